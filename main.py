@@ -1,4 +1,5 @@
 import os
+import logging
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
@@ -9,6 +10,10 @@ from routes.slide_routes import router as slide_router
 # Load environment variables
 load_dotenv()
 
+# Service modules log per-slide progress at INFO and per-shape detail at DEBUG;
+# default to WARNING in production (set LOG_LEVEL=INFO or DEBUG to trace)
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "WARNING").upper())
+
 # Create FastAPI app
 app = FastAPI(
     title="PowerPoint to Excel Extractor API",
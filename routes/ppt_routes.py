@@ -1,7 +1,6 @@
 from fastapi import APIRouter, UploadFile, File, HTTPException
 from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from datetime import datetime
-from io import BytesIO
 import os
 from services.s3_service import s3_service
 from services.extraction_service import extraction_service
@@ -134,9 +133,9 @@ async def extract_ppt(
         # Download PPT from S3
         # Use bucket override if detected from URL, otherwise use default
         if bucket_override:
-            ppt_bytes = s3_service.download_file(s3_key, bucket_name=bucket_override)
+            ppt_bytes = s3_service.download_fileobj(s3_key, bucket_name=bucket_override)
         else:
-            ppt_bytes = s3_service.download_file(s3_key)
+            ppt_bytes = s3_service.download_fileobj(s3_key)
         
         if not ppt_bytes:
             raise HTTPException(
@@ -167,10 +166,9 @@ async def extract_ppt(
         # Optionally upload Excel to S3
         if upload_images:  # Use same flag for consistency
             try:
-                with open(local_excel_path, 'rb') as f:
-                    excel_bytes = f.read()
-                excel_upload_result = s3_service.upload_file(
-                    file_data=excel_bytes,
+                # Stream the saved workbook from disk instead of reading it into memory
+                excel_upload_result = s3_service.upload_path(
+                    file_path=local_excel_path,
                     filename=excel_filename,
                     folder="extracted_excel"
                 )
@@ -290,10 +288,9 @@ async def upload_and_extract(
         # Optionally upload Excel to S3
         if upload_images_to_s3:
             try:
-                with open(local_excel_path, 'rb') as f:
-                    excel_bytes = f.read()
-                excel_upload_result = s3_service.upload_file(
-                    file_data=excel_bytes,
+                # Stream the saved workbook from disk instead of reading it into memory
+                excel_upload_result = s3_service.upload_path(
+                    file_path=local_excel_path,
                     filename=excel_filename,
                     folder="extracted_excel"
                 )
@@ -497,7 +494,7 @@ async def generate_ppt_from_data(
     """
     try:
         # Generate presentation
-        ppt_bytes, filename, stats = ppt_generation_service.generate_presentation(
+        ppt_buffer, filename, stats = ppt_generation_service.generate_presentation(
             template_s3_url=template_s3_url,
             template_id=template_id,
             output_filename=output_filename
@@ -513,7 +510,7 @@ async def generate_ppt_from_data(
         # Upload to S3 if requested
         if upload_to_s3:
             upload_result = s3_service.upload_file(
-                file_data=ppt_bytes,
+                file_data=ppt_buffer.getvalue(),
                 filename=filename,
                 folder="generated_presentations"
             )
@@ -529,7 +526,7 @@ async def generate_ppt_from_data(
         local_path = os.path.join(output_folder, filename)
         
         with open(local_path, 'wb') as f:
-            f.write(ppt_bytes)
+            f.write(ppt_buffer.getbuffer())
         
         response_data['local_path'] = local_path
         response_data['download_url'] = f"/api/download/{filename}"
@@ -563,7 +560,7 @@ async def generate_and_download_ppt(
     """
     try:
         # Generate presentation
-        ppt_bytes, filename, stats = ppt_generation_service.generate_presentation(
+        ppt_buffer, filename, stats = ppt_generation_service.generate_presentation(
             template_s3_url=template_s3_url,
             template_id=template_id,
             output_filename=output_filename
@@ -571,7 +568,7 @@ async def generate_and_download_ppt(
         
         # Return as streaming response
         return StreamingResponse(
-            BytesIO(ppt_bytes),
+            ppt_buffer,
             media_type="application/vnd.openxmlformats-officedocument.presentationml.presentation",
             headers={
                 "Content-Disposition": f"attachment; filename={filename}"
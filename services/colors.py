@@ -0,0 +1,34 @@
+"""
+Color helpers - Shared hex color parsing for the slide services and handlers
+"""
+
+import logging
+from functools import lru_cache
+from pptx.dml.color import RGBColor
+
+
+logger = logging.getLogger(__name__)
+
+# Strips whitespace and "#" from hex color strings in a single pass
+_HEX_CLEAN = str.maketrans("", "", " \t\n\r#")
+
+
+@lru_cache(maxsize=256)
+def parse_hex_color(hex_str: str) -> RGBColor:
+    """Parse a hex color string; cached because decks reuse a handful of palette colors"""
+    hex_str = hex_str.translate(_HEX_CLEAN)
+    # bytes.fromhex validates and parses in one C call; unpacking enforces 3 bytes
+    try:
+        r, g, b = bytes.fromhex(hex_str)
+    except ValueError:
+        logger.warning("⚠️ Invalid hex color '%s', defaulting to black", hex_str)
+        return RGBColor(0, 0, 0)
+
+    return RGBColor(r, g, b)
+
+
+def hex_to_rgb(hex_str):
+    """Convert #RRGGBB string to RGBColor safely."""
+    if not hex_str:
+        return RGBColor(0, 0, 0)
+    return parse_hex_color(str(hex_str))
@@ -4,7 +4,7 @@ import hashlib
 from io import BytesIO
 from pptx import Presentation
 from openpyxl import Workbook
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Union, BinaryIO
 from datetime import datetime
 from services.s3_service import s3_service
 
@@ -173,7 +173,7 @@ class ExtractionService:
                     
                     if image_blob:
                         # Generate unique filename
-                        image_hash = hashlib.md5(image_blob).hexdigest()[:12]
+                        image_hash = hashlib.blake2b(image_blob, digest_size=6).hexdigest()
                         file_extension = self.get_image_extension(image_info['format'])
                         filename = f"slide_{slide_num}_shape_{shape_index}_{image_hash}{file_extension}"
                         
@@ -190,9 +190,11 @@ class ExtractionService:
                         
                         # Upload to S3 if enabled
                         if upload_to_s3:
+                            # Content-addressed key: a content-only base name lets the
+                            # same picture on other slides or decks map to one object
                             s3_result = s3_service.upload_image_to_s3(
                                 image_data=image_blob,
-                                filename=filename,
+                                filename=f"image{file_extension}",
                                 content_type=image_info['format']
                             )
                             if s3_result.get('success'):
@@ -301,18 +303,18 @@ class ExtractionService:
         
         return chart_info
     
-    def extract_ppt_to_excel(self, ppt_bytes: bytes, upload_images_to_s3: bool = True) -> tuple:
+    def extract_ppt_to_excel(self, ppt_bytes: Union[bytes, BinaryIO], upload_images_to_s3: bool = True) -> tuple:
         """
         Extract PowerPoint data to Excel
         
         Args:
-            ppt_bytes: PowerPoint file content as bytes
+            ppt_bytes: PowerPoint file content as bytes or a binary file-like object
             upload_images_to_s3: Whether to upload extracted images to S3
             
         Returns:
             tuple: (workbook, extracted_data_dict)
         """
-        prs = Presentation(BytesIO(ppt_bytes))
+        prs = Presentation(ppt_bytes if hasattr(ppt_bytes, 'read') else BytesIO(ppt_bytes))
         wb = Workbook()
         ws = wb.active
         ws.title = "PPT_Data"
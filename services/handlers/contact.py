@@ -2,22 +2,27 @@
 Contact slide handler - Handles generation/modification of contact slides
 """
 
+import logging
 from io import BytesIO
 from pptx import Presentation
 from pptx.util import Pt
 from pptx.dml.color import RGBColor
 from typing import Dict, Any
-import requests
+
+
+logger = logging.getLogger(__name__)
 
 
 def hex_to_rgb(hex_str):
-    """Convert #RRGGBB string to RGBColor safely."""
+    """Convert #RRGGBB string to RGBColor safely (RGBColor values pass through)."""
     if not hex_str:
         return RGBColor(0, 0, 0)
+    if isinstance(hex_str, RGBColor):
+        return hex_str
     
     hex_str = str(hex_str).strip().replace("#", "")
     if len(hex_str) != 6 or any(c not in "0123456789ABCDEFabcdef" for c in hex_str):
-        print(f"⚠️ Invalid hex color '{hex_str}', defaulting to black")
+        logger.warning("⚠️ Invalid hex color '%s', defaulting to black", hex_str)
         return RGBColor(0, 0, 0)
     
     return RGBColor(int(hex_str[0:2], 16),
@@ -46,7 +51,7 @@ def handle_contact_slide(presentation_bytes: BytesIO, slide_data: Dict[str, Any]
     Returns:
         BytesIO containing the modified presentation
     """
-    print(f"📞 Processing CONTACT slide...")
+    logger.info("📞 Processing CONTACT slide...")
     
     prs = Presentation(presentation_bytes)
     
@@ -85,7 +90,7 @@ def handle_contact_slide(presentation_bytes: BytesIO, slide_data: Dict[str, Any]
     prs.save(output)
     output.seek(0)
     
-    print(f"✅ Contact slide processed successfully")
+    logger.info("✅ Contact slide processed successfully")
     return output
 
 
@@ -98,11 +103,12 @@ def _update_title(slide, slide_data: Dict[str, Any]):
                 
                 # Apply primary color if available
                 if slide_data.get('colors', {}).get('primary'):
+                    rgb = hex_to_rgb(slide_data['colors']['primary'])
                     for paragraph in shape.text_frame.paragraphs:
                         for run in paragraph.runs:
-                            run.font.color.rgb = hex_to_rgb(slide_data['colors']['primary'])
+                            run.font.color.rgb = rgb
                 
-                print(f"📝 Updated title: {slide_data['title']}")
+                logger.debug("📝 Updated title: %s", slide_data['title'])
                 break
 
 
@@ -122,7 +128,7 @@ def _update_website(slide, slide_data: Dict[str, Any]):
                             except:
                                 pass  # Hyperlink might not be supported
                 
-                print(f"🌐 Updated website: {slide_data['website_link']}")
+                logger.debug("🌐 Updated website: %s", slide_data['website_link'])
                 break
 
 
@@ -142,7 +148,7 @@ def _update_linkedin(slide, slide_data: Dict[str, Any]):
                             except:
                                 pass
                 
-                print(f"🔗 Updated LinkedIn: {slide_data['linkedin_link']}")
+                logger.debug("🔗 Updated LinkedIn: %s", slide_data['linkedin_link'])
                 break
 
 
@@ -162,7 +168,7 @@ def _update_email(slide, slide_data: Dict[str, Any]):
                             except:
                                 pass
                 
-                print(f"📧 Updated email: {slide_data['contact_email']}")
+                logger.debug("📧 Updated email: %s", slide_data['contact_email'])
                 break
 
 
@@ -172,12 +178,12 @@ def _update_phone(slide, slide_data: Dict[str, Any]):
         if 'phone' in shape.name.lower() or 'tel' in shape.name.lower():
             if hasattr(shape, 'text_frame'):
                 shape.text_frame.text = slide_data['contact_phone']
-                print(f"📱 Updated phone: {slide_data['contact_phone']}")
+                logger.debug("📱 Updated phone: %s", slide_data['contact_phone'])
                 break
 
 
-def _update_images_from_urls(slide, image_urls: list):
-    """Update images from URLs"""
+def _update_images_from_urls(slide, image_urls: list, prefetched: Dict[str, BytesIO] = None):
+    """Update images from URLs, using already-downloaded images from prefetched when present"""
     if not image_urls:
         return
     
@@ -191,11 +197,17 @@ def _update_images_from_urls(slide, image_urls: list):
     # Update images
     for i, (shape, image_url) in enumerate(zip(image_shapes, image_urls)):
         try:
-            print(f"🖼️ Downloading image {i+1} from: {image_url}")
-            response = requests.get(image_url, timeout=10)
-            response.raise_for_status()
-            
-            image_data = BytesIO(response.content)
+            if prefetched and image_url in prefetched:
+                image_data = prefetched[image_url]
+                if image_data is None:
+                    # The prefetch already failed for this URL; keep the template image
+                    logger.warning("⚠️ Skipping image %s, download failed: %s", i+1, image_url)
+                    continue
+            else:
+                # Imported here: slide_data_service imports this handler module
+                from services.slide_data_service import slide_data_service
+                logger.debug("🖼️ Downloading image %s from: %s", i+1, image_url)
+                image_data = slide_data_service.download_image_from_url(image_url)
             
             # Get position and size
             left, top, width, height = shape.left, shape.top, shape.width, shape.height
@@ -206,10 +218,10 @@ def _update_images_from_urls(slide, image_urls: list):
             
             # Add new image
             slide.shapes.add_picture(image_data, left, top, width, height)
-            print(f"✅ Updated image {i+1}")
+            logger.debug("✅ Updated image %s", i+1)
             
         except Exception as e:
-            print(f"⚠️ Failed to update image {i+1} from {image_url}: {e}")
+            logger.warning("⚠️ Failed to update image %s from %s: %s", i+1, image_url, e)
 
 
 def _apply_color_scheme(slide, colors: Dict[str, str]):
@@ -217,7 +229,7 @@ def _apply_color_scheme(slide, colors: Dict[str, str]):
     # This would need to be customized based on your template structure
     # For now, just log that we have colors available
     if colors:
-        print(f"🎨 Color scheme available: {', '.join(colors.keys())}")
+        logger.debug("🎨 Color scheme available: %s", ', '.join(colors.keys()))
         
         # Apply text color if specified
         if colors.get('text'):
@@ -2,22 +2,27 @@
 Cover slide handler - Handles generation/modification of cover slides
 """
 
+import logging
 from io import BytesIO
 from pptx import Presentation
 from pptx.util import Pt
 from pptx.dml.color import RGBColor
 from typing import Dict, Any
-import requests
+
+
+logger = logging.getLogger(__name__)
 
 
 def hex_to_rgb(hex_str):
-    """Convert #RRGGBB string to RGBColor safely."""
+    """Convert #RRGGBB string to RGBColor safely (RGBColor values pass through)."""
     if not hex_str:
         return RGBColor(0, 0, 0)
+    if isinstance(hex_str, RGBColor):
+        return hex_str
     
     hex_str = str(hex_str).strip().replace("#", "")
     if len(hex_str) != 6 or any(c not in "0123456789ABCDEFabcdef" for c in hex_str):
-        print(f"⚠️ Invalid hex color '{hex_str}', defaulting to black")
+        logger.warning("⚠️ Invalid hex color '%s', defaulting to black", hex_str)
         return RGBColor(0, 0, 0)
     
     return RGBColor(int(hex_str[0:2], 16),
@@ -46,7 +51,7 @@ def handle_cover_slide(presentation_bytes: BytesIO, slide_data: Dict[str, Any],
     Returns:
         BytesIO containing the modified presentation
     """
-    print(f"📄 Processing COVER slide...")
+    logger.info("📄 Processing COVER slide...")
     
     prs = Presentation(presentation_bytes)
     
@@ -80,7 +85,7 @@ def handle_cover_slide(presentation_bytes: BytesIO, slide_data: Dict[str, Any],
     prs.save(output)
     output.seek(0)
     
-    print(f"✅ Cover slide processed successfully")
+    logger.info("✅ Cover slide processed successfully")
     return output
 
 
@@ -93,11 +98,12 @@ def _update_title(slide, slide_data: Dict[str, Any]):
                 
                 # Apply primary color if available
                 if slide_data.get('colors', {}).get('primary'):
+                    rgb = hex_to_rgb(slide_data['colors']['primary'])
                     for paragraph in shape.text_frame.paragraphs:
                         for run in paragraph.runs:
-                            run.font.color.rgb = hex_to_rgb(slide_data['colors']['primary'])
+                            run.font.color.rgb = rgb
                 
-                print(f"📝 Updated title: {slide_data['title']}")
+                logger.debug("📝 Updated title: %s", slide_data['title'])
                 break
 
 
@@ -110,11 +116,12 @@ def _update_subtitle(slide, slide_data: Dict[str, Any]):
                 
                 # Apply secondary color if available
                 if slide_data.get('colors', {}).get('secondary'):
+                    rgb = hex_to_rgb(slide_data['colors']['secondary'])
                     for paragraph in shape.text_frame.paragraphs:
                         for run in paragraph.runs:
-                            run.font.color.rgb = hex_to_rgb(slide_data['colors']['secondary'])
+                            run.font.color.rgb = rgb
                 
-                print(f"📝 Updated subtitle: {slide_data['subtitle']}")
+                logger.debug("📝 Updated subtitle: %s", slide_data['subtitle'])
                 break
 
 
@@ -124,12 +131,12 @@ def _update_company_name(slide, slide_data: Dict[str, Any]):
         if 'company' in shape.name.lower() or shape.name.startswith('Company'):
             if hasattr(shape, 'text_frame'):
                 shape.text_frame.text = slide_data['company_name']
-                print(f"📝 Updated company name: {slide_data['company_name']}")
+                logger.debug("📝 Updated company name: %s", slide_data['company_name'])
                 break
 
 
-def _update_images_from_urls(slide, image_urls: list):
-    """Update images from URLs"""
+def _update_images_from_urls(slide, image_urls: list, prefetched: Dict[str, BytesIO] = None):
+    """Update images from URLs, using already-downloaded images from prefetched when present"""
     if not image_urls:
         return
     
@@ -143,11 +150,17 @@ def _update_images_from_urls(slide, image_urls: list):
     # Update images
     for i, (shape, image_url) in enumerate(zip(image_shapes, image_urls)):
         try:
-            print(f"🖼️ Downloading image {i+1} from: {image_url}")
-            response = requests.get(image_url, timeout=10)
-            response.raise_for_status()
-            
-            image_data = BytesIO(response.content)
+            if prefetched and image_url in prefetched:
+                image_data = prefetched[image_url]
+                if image_data is None:
+                    # The prefetch already failed for this URL; keep the template image
+                    logger.warning("⚠️ Skipping image %s, download failed: %s", i+1, image_url)
+                    continue
+            else:
+                # Imported here: slide_data_service imports this handler module
+                from services.slide_data_service import slide_data_service
+                logger.debug("🖼️ Downloading image %s from: %s", i+1, image_url)
+                image_data = slide_data_service.download_image_from_url(image_url)
             
             # Get position and size
             left, top, width, height = shape.left, shape.top, shape.width, shape.height
@@ -158,10 +171,10 @@ def _update_images_from_urls(slide, image_urls: list):
             
             # Add new image
             slide.shapes.add_picture(image_data, left, top, width, height)
-            print(f"✅ Updated image {i+1}")
+            logger.debug("✅ Updated image %s", i+1)
             
         except Exception as e:
-            print(f"⚠️ Failed to update image {i+1} from {image_url}: {e}")
+            logger.warning("⚠️ Failed to update image %s from %s: %s", i+1, image_url, e)
 
 
 def _apply_color_scheme(slide, colors: Dict[str, str]):
@@ -169,10 +182,10 @@ def _apply_color_scheme(slide, colors: Dict[str, str]):
     # This would need to be customized based on your template structure
     # For now, just log that we have colors available
     if colors:
-        print(f"🎨 Color scheme available: {', '.join(colors.keys())}")
+        logger.debug("🎨 Color scheme available: %s", ', '.join(colors.keys()))
         
         # Apply background color if specified
         if colors.get('background'):
             for shape in slide.shapes:
                 if 'background' in shape.name.lower() or 'bg' in shape.name.lower():
-                    print(f"🎨 Found background element: {shape.name}")
+                    logger.debug("🎨 Found background element: %s", shape.name)
@@ -2,6 +2,7 @@
 Graph slide handler - Handles generation/modification of chart/graph slides
 """
 
+import logging
 from io import BytesIO
 from pptx import Presentation
 from pptx.util import Pt
@@ -10,6 +11,9 @@ from typing import Dict, Any, List
 import json
 
 
+logger = logging.getLogger(__name__)
+
+
 def hex_to_rgb(hex_str):
     """Convert #RRGGBB string to RGBColor safely."""
     if not hex_str:
@@ -17,7 +21,7 @@ def hex_to_rgb(hex_str):
     
     hex_str = str(hex_str).strip().replace("#", "")
     if len(hex_str) != 6 or any(c not in "0123456789ABCDEFabcdef" for c in hex_str):
-        print(f"⚠️ Invalid hex color '{hex_str}', defaulting to black")
+        logger.warning("⚠️ Invalid hex color '%s', defaulting to black", hex_str)
         return RGBColor(0, 0, 0)
     
     return RGBColor(int(hex_str[0:2], 16),
@@ -42,7 +46,7 @@ def handle_graph_slide(presentation_bytes: BytesIO, slide_data: Dict[str, Any],
     Returns:
         BytesIO containing the modified presentation
     """
-    print(f"📈 Processing GRAPH slide...")
+    logger.info("📈 Processing GRAPH slide...")
     
     prs = Presentation(presentation_bytes)
     
@@ -64,7 +68,7 @@ def handle_graph_slide(presentation_bytes: BytesIO, slide_data: Dict[str, Any],
     prs.save(output)
     output.seek(0)
     
-    print(f"✅ Graph slide processed successfully")
+    logger.info("✅ Graph slide processed successfully")
     return output
 
 
@@ -92,7 +96,7 @@ def _update_title(slide, slide_data: Dict[str, Any]):
         if 'title' in shape.name.lower() or shape.name.startswith('Title'):
             if hasattr(shape, 'text_frame'):
                 shape.text_frame.text = slide_data['title']
-                print(f"📝 Updated title: {slide_data['title']}")
+                logger.debug("📝 Updated title: %s", slide_data['title'])
                 break
 
 
@@ -127,7 +131,7 @@ def _update_single_chart(slide, chart_index: int, chart_config: Dict[str, Any],
             (chart_index == 1 and 'chart' in shape.name.lower() and 'title' in shape.name.lower())):
             if hasattr(shape, 'text_frame'):
                 shape.text_frame.text = chart_title
-                print(f"📊 Updated chart {chart_index} title: {chart_title}")
+                logger.debug("📊 Updated chart %s title: %s", chart_index, chart_title)
                 break
     
     # Update chart data (stored as text or processed by template)
@@ -141,17 +145,17 @@ def _update_single_chart(slide, chart_index: int, chart_config: Dict[str, Any],
             # If it's a text shape, store formatted chart data
             if hasattr(shape, 'text_frame'):
                 shape.text_frame.text = chart_info
-                print(f"📊 Updated chart {chart_index} data")
+                logger.debug("📊 Updated chart %s data", chart_index)
                 break
             
             # If it's an actual chart object (PowerPoint chart)
             elif hasattr(shape, 'chart'):
                 try:
                     _update_powerpoint_chart(shape.chart, chart_data, chart_type)
-                    print(f"📊 Updated PowerPoint chart {chart_index}")
+                    logger.debug("📊 Updated PowerPoint chart %s", chart_index)
                     break
                 except Exception as e:
-                    print(f"⚠️ Could not update PowerPoint chart {chart_index}: {e}")
+                    logger.warning("⚠️ Could not update PowerPoint chart %s: %s", chart_index, e)
                     # Fallback: try to find a text shape to store data
                     continue
 
@@ -213,10 +217,10 @@ def _update_powerpoint_chart(chart, chart_data: Dict[str, Any], chart_type: str)
                         except (ValueError, TypeError):
                             series.values[i] = 0
         
-        print(f"📊 Updated PowerPoint chart with {len(labels)} categories and {len(datasets)} series")
+        logger.debug("📊 Updated PowerPoint chart with %s categories and %s series", len(labels), len(datasets))
         
     except Exception as e:
-        print(f"⚠️ PowerPoint chart update failed: {e}")
+        logger.warning("⚠️ PowerPoint chart update failed: %s", e)
         raise
 
 
@@ -231,4 +235,4 @@ def _apply_chart_options(slide, chart_options: Dict[str, Any]):
         for shape in slide.shapes:
             if 'chart' in shape.name.lower() or 'background' in shape.name.lower():
                 # This would need template-specific implementation
-                print(f"🎨 Chart background color: {background_color}")
\ No newline at end of file
+                logger.debug("🎨 Chart background color: %s", background_color)
\ No newline at end of file
@@ -2,12 +2,16 @@
 Image+Text slide handler - Handles generation/modification of image and text slides
 """
 
+import logging
 from io import BytesIO
 from pptx import Presentation
 from pptx.dml.color import RGBColor
 from typing import Dict, Any
 
 
+logger = logging.getLogger(__name__)
+
+
 def hex_to_rgb(hex_str):
     """Convert #RRGGBB string to RGBColor safely."""
     if not hex_str:
@@ -15,7 +19,7 @@ def hex_to_rgb(hex_str):
     
     hex_str = str(hex_str).strip().replace("#", "")
     if len(hex_str) != 6 or any(c not in "0123456789ABCDEFabcdef" for c in hex_str):
-        print(f"⚠️ Invalid hex color '{hex_str}', defaulting to black")
+        logger.warning("⚠️ Invalid hex color '%s', defaulting to black", hex_str)
         return RGBColor(0, 0, 0)
     
     return RGBColor(int(hex_str[0:2], 16),
@@ -35,7 +39,7 @@ def handle_image_text_slide(presentation_bytes: BytesIO, slide_data: Dict[str, A
     Returns:
         BytesIO containing the modified presentation
     """
-    print(f"🖼️ Processing IMAGE+TEXT slide...")
+    logger.info("🖼️ Processing IMAGE+TEXT slide...")
     
     prs = Presentation(presentation_bytes)
     
@@ -61,7 +65,7 @@ def handle_image_text_slide(presentation_bytes: BytesIO, slide_data: Dict[str, A
     prs.save(output)
     output.seek(0)
     
-    print(f"✅ Image+Text slide processed successfully")
+    logger.info("✅ Image+Text slide processed successfully")
     return output
 
 
@@ -75,7 +79,7 @@ def _update_title(slide, slide_data: Dict[str, Any]):
                     for paragraph in shape.text_frame.paragraphs:
                         for run in paragraph.runs:
                             run.font.color.rgb = hex_to_rgb(slide_data['title_color'])
-                print(f"📝 Updated title: {slide_data['title']}")
+                logger.debug("📝 Updated title: %s", slide_data['title'])
                 break
 
 
@@ -89,7 +93,7 @@ def _update_text(slide, slide_data: Dict[str, Any]):
                     for paragraph in shape.text_frame.paragraphs:
                         for run in paragraph.runs:
                             run.font.color.rgb = hex_to_rgb(slide_data['text_color'])
-                print(f"📝 Updated text: {slide_data['text'][:50]}...")
+                logger.debug("📝 Updated text: %.50s...", slide_data['text'])
                 break
 
 
@@ -102,5 +106,5 @@ def _update_image(slide, image_data: BytesIO):
                 sp = shape.element
                 sp.getparent().remove(sp)
                 slide.shapes.add_picture(image_data, left, top, width, height)
-                print(f"🖼️ Updated image")
+                logger.debug("🖼️ Updated image")
                 break
\ No newline at end of file
@@ -2,12 +2,15 @@
 Images slide handler - Handles generation/modification of multi-image gallery slides
 """
 
+import logging
 from io import BytesIO
 from pptx import Presentation
 from pptx.util import Pt
 from pptx.dml.color import RGBColor
 from typing import Dict, Any
-import requests
+
+
+logger = logging.getLogger(__name__)
 
 
 def hex_to_rgb(hex_str):
@@ -17,7 +20,7 @@ def hex_to_rgb(hex_str):
     
     hex_str = str(hex_str).strip().replace("#", "")
     if len(hex_str) != 6 or any(c not in "0123456789ABCDEFabcdef" for c in hex_str):
-        print(f"⚠️ Invalid hex color '{hex_str}', defaulting to black")
+        logger.warning("⚠️ Invalid hex color '%s', defaulting to black", hex_str)
         return RGBColor(0, 0, 0)
     
     return RGBColor(int(hex_str[0:2], 16),
@@ -43,7 +46,7 @@ def handle_images_slide(presentation_bytes: BytesIO, slide_data: Dict[str, Any],
     Returns:
         BytesIO containing the modified presentation
     """
-    print(f"🖼️ Processing IMAGES slide...")
+    logger.info("🖼️ Processing IMAGES slide...")
     
     prs = Presentation(presentation_bytes)
     
@@ -65,7 +68,7 @@ def handle_images_slide(presentation_bytes: BytesIO, slide_data: Dict[str, Any],
     prs.save(output)
     output.seek(0)
     
-    print(f"✅ Images slide processed successfully")
+    logger.info("✅ Images slide processed successfully")
     return output
 
 
@@ -75,11 +78,11 @@ def _update_title(slide, slide_data: Dict[str, Any]):
         if 'title' in shape.name.lower() or shape.name.startswith('Title'):
             if hasattr(shape, 'text_frame'):
                 shape.text_frame.text = slide_data['title']
-                print(f"📝 Updated title: {slide_data['title']}")
+                logger.debug("📝 Updated title: %s", slide_data['title'])
                 break
 
 
-def _update_image_gallery(slide, slide_data: Dict[str, Any]):
+def _update_image_gallery(slide, slide_data: Dict[str, Any], prefetched: Dict[str, BytesIO] = None):
     """Update image gallery with headers and descriptions"""
     images = slide_data.get('images', [])
     headers = slide_data.get('headers', [])
@@ -96,7 +99,7 @@ def _update_image_gallery(slide, slide_data: Dict[str, Any]):
     # Process each image
     for i, (image_url, header, description) in enumerate(zip(images, headers, descriptions), 1):
         # Update image
-        _update_image(slide, i, image_url)
+        _update_image(slide, i, image_url, prefetched)
         
         # Update header
         if header:
@@ -107,19 +110,25 @@ def _update_image_gallery(slide, slide_data: Dict[str, Any]):
             _update_image_description(slide, i, description)
 
 
-def _update_image(slide, index: int, image_url: str):
-    """Update a specific image in the gallery"""
+def _update_image(slide, index: int, image_url: str, prefetched: Dict[str, BytesIO] = None):
+    """Update a specific image in the gallery, using prefetched[image_url] when present"""
     image_shape_name = f"Image{index}"
     
     for shape in slide.shapes:
         if shape.name == image_shape_name or f"image{index}" in shape.name.lower() or f"picture{index}" in shape.name.lower():
             if shape.shape_type == 13:  # Picture type
                 try:
-                    print(f"🖼️ Downloading image {index} from: {image_url}")
-                    response = requests.get(image_url, timeout=10)
-                    response.raise_for_status()
-                    
-                    image_data = BytesIO(response.content)
+                    if prefetched and image_url in prefetched:
+                        image_data = prefetched[image_url]
+                        if image_data is None:
+                            # The prefetch already failed for this URL; keep the template image
+                            logger.warning("⚠️ Skipping image %s, download failed: %s", index, image_url)
+                            return
+                    else:
+                        # Imported here: slide_data_service imports this handler module
+                        from services.slide_data_service import slide_data_service
+                        logger.debug("🖼️ Downloading image %s from: %s", index, image_url)
+                        image_data = slide_data_service.download_image_from_url(image_url)
                     
                     # Get position and size
                     left, top, width, height = shape.left, shape.top, shape.width, shape.height
@@ -130,10 +139,10 @@ def _update_image(slide, index: int, image_url: str):
                     
                     # Add new image
                     slide.shapes.add_picture(image_data, left, top, width, height)
-                    print(f"✅ Updated image {index}")
+                    logger.debug("✅ Updated image %s", index)
                     
                 except Exception as e:
-                    print(f"⚠️ Failed to update image {index} from {image_url}: {e}")
+                    logger.warning("⚠️ Failed to update image %s from %s: %s", index, image_url, e)
                 break
 
 
@@ -151,7 +160,7 @@ def _update_image_header(slide, index: int, header: str):
                     for run in paragraph.runs:
                         run.font.bold = True
                 
-                print(f"📝 Updated header {index}: {header}")
+                logger.debug("📝 Updated header %s: %s", index, header)
                 break
 
 
@@ -163,5 +172,5 @@ def _update_image_description(slide, index: int, description: str):
         if shape.name == description_shape_name or f"description{index}" in shape.name.lower() or f"desc{index}" in shape.name.lower():
             if hasattr(shape, 'text_frame'):
                 shape.text_frame.text = description
-                print(f"📝 Updated description {index}: {description[:50]}...")
+                logger.debug("📝 Updated description %s: %.50s...", index, description)
                 break
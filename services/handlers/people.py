@@ -2,6 +2,7 @@
 People slide handler - Handles generation/modification of people/team slides
 """
 
+import logging
 from io import BytesIO
 from pptx import Presentation
 from pptx.util import Pt
@@ -9,6 +10,9 @@ from pptx.dml.color import RGBColor
 from typing import Dict, Any
 
 
+logger = logging.getLogger(__name__)
+
+
 def hex_to_rgb(hex_str):
     """Convert #RRGGBB string to RGBColor safely."""
     if not hex_str:
@@ -16,7 +20,7 @@ def hex_to_rgb(hex_str):
     
     hex_str = str(hex_str).strip().replace("#", "")
     if len(hex_str) != 6 or any(c not in "0123456789ABCDEFabcdef" for c in hex_str):
-        print(f"⚠️ Invalid hex color '{hex_str}', defaulting to black")
+        logger.warning("⚠️ Invalid hex color '%s', defaulting to black", hex_str)
         return RGBColor(0, 0, 0)
     
     return RGBColor(int(hex_str[0:2], 16),
@@ -45,7 +49,7 @@ def handle_people_slide(presentation_bytes: BytesIO, slide_data: Dict[str, Any],
     Returns:
         BytesIO containing the modified presentation
     """
-    print(f"👥 Processing PEOPLE slide...")
+    logger.info("👥 Processing PEOPLE slide...")
     
     prs = Presentation(presentation_bytes)
     
@@ -79,7 +83,7 @@ def handle_people_slide(presentation_bytes: BytesIO, slide_data: Dict[str, Any],
     prs.save(output)
     output.seek(0)
     
-    print(f"✅ People slide processed successfully")
+    logger.info("✅ People slide processed successfully")
     return output
 
 
@@ -93,7 +97,7 @@ def _update_title(slide, slide_data: Dict[str, Any]):
                     for paragraph in shape.text_frame.paragraphs:
                         for run in paragraph.runs:
                             run.font.color.rgb = hex_to_rgb(slide_data['title_color'])
-                print(f"📝 Updated title: {slide_data['title']}")
+                logger.debug("📝 Updated title: %s", slide_data['title'])
                 break
 
 
@@ -107,7 +111,7 @@ def _update_description(slide, slide_data: Dict[str, Any]):
                     for paragraph in shape.text_frame.paragraphs:
                         for run in paragraph.runs:
                             run.font.color.rgb = hex_to_rgb(slide_data['description_color'])
-                print(f"📝 Updated description: {slide_data['description'][:50]}...")
+                logger.debug("📝 Updated description: %.50s...", slide_data['description'])
                 break
 
 
@@ -151,7 +155,7 @@ def _update_people(slide, slide_data: Dict[str, Any]):
                         for run in shape.text_frame.paragraphs[1].runs:
                             run.font.italic = True
                     
-                    print(f"👤 Updated Person {i}: {name} - {designation}")
+                    logger.debug("👤 Updated Person %s: %s - %s", i, name, designation)
                     found = True
                     break
         
@@ -191,7 +195,7 @@ def _update_separate_person_fields(slide, index: int, name: str, designation: st
         if shape.name == description_shape_name or f"description{index}" in shape.name.lower() or f"desc{index}" in shape.name.lower():
             if hasattr(shape, 'text_frame'):
                 shape.text_frame.text = description
-                print(f"👤 Updated Person {index}: {name} - {designation}")
+                logger.debug("👤 Updated Person %s: %s - %s", index, name, designation)
                 break
 
 
@@ -201,7 +205,7 @@ def _update_background_color(slide, background_color: str):
     # For now, just log that we found background elements
     for shape in slide.shapes:
         if 'background' in shape.name.lower() or 'bg' in shape.name.lower():
-            print(f"🎨 Found background element: {shape.name}")
+            logger.debug("🎨 Found background element: %s", shape.name)
 
 
 def _update_image(slide, image_data: BytesIO):
@@ -213,5 +217,5 @@ def _update_image(slide, image_data: BytesIO):
                 sp = shape.element
                 sp.getparent().remove(sp)
                 slide.shapes.add_picture(image_data, left, top, width, height)
-                print(f"🖼️ Updated image")
+                logger.debug("🖼️ Updated image")
                 break
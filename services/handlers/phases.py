@@ -2,6 +2,7 @@
 Phases slide handler - Handles generation/modification of phase/timeline slides
 """
 
+import logging
 from io import BytesIO
 from pptx import Presentation
 from pptx.util import Pt
@@ -9,6 +10,9 @@ from pptx.dml.color import RGBColor
 from typing import Dict, Any
 
 
+logger = logging.getLogger(__name__)
+
+
 def hex_to_rgb(hex_str):
     """Convert #RRGGBB string to RGBColor safely."""
     if not hex_str:
@@ -16,7 +20,7 @@ def hex_to_rgb(hex_str):
     
     hex_str = str(hex_str).strip().replace("#", "")
     if len(hex_str) != 6 or any(c not in "0123456789ABCDEFabcdef" for c in hex_str):
-        print(f"⚠️ Invalid hex color '{hex_str}', defaulting to black")
+        logger.warning("⚠️ Invalid hex color '%s', defaulting to black", hex_str)
         return RGBColor(0, 0, 0)
     
     return RGBColor(int(hex_str[0:2], 16),
@@ -40,7 +44,7 @@ def handle_phases_slide(presentation_bytes: BytesIO, slide_data: Dict[str, Any],
     Returns:
         BytesIO containing the modified presentation
     """
-    print(f"📅 Processing PHASES slide...")
+    logger.info("📅 Processing PHASES slide...")
     
     prs = Presentation(presentation_bytes)
     
@@ -66,7 +70,7 @@ def handle_phases_slide(presentation_bytes: BytesIO, slide_data: Dict[str, Any],
     prs.save(output)
     output.seek(0)
     
-    print(f"✅ Phases slide processed successfully")
+    logger.info("✅ Phases slide processed successfully")
     return output
 
 
@@ -76,7 +80,7 @@ def _update_title(slide, slide_data: Dict[str, Any]):
         if 'title' in shape.name.lower() or shape.name.startswith('Title'):
             if hasattr(shape, 'text_frame'):
                 shape.text_frame.text = slide_data['title']
-                print(f"📝 Updated title: {slide_data['title']}")
+                logger.debug("📝 Updated title: %s", slide_data['title'])
                 break
 
 
@@ -112,7 +116,7 @@ def _update_phases(slide, slide_data: Dict[str, Any]):
                         for run in first_paragraph.runs:
                             run.font.bold = True
                     
-                    print(f"📋 Updated Phase {i}: {phase.get('name', '')}")
+                    logger.debug("📋 Updated Phase %s: %s", i, phase.get('name', ''))
                     break
     
     # Update timeline color if specified
@@ -126,7 +130,7 @@ def _update_timeline_color(slide, timeline_color: str):
         if 'timeline' in shape.name.lower() or 'arrow' in shape.name.lower():
             # This would need to be customized based on your template structure
             # For now, just log that we found timeline elements
-            print(f"🎨 Found timeline element: {shape.name}")
+            logger.debug("🎨 Found timeline element: %s", shape.name)
 
 
 def _update_image(slide, image_data: BytesIO):
@@ -138,5 +142,5 @@ def _update_image(slide, image_data: BytesIO):
                 sp = shape.element
                 sp.getparent().remove(sp)
                 slide.shapes.add_picture(image_data, left, top, width, height)
-                print(f"🖼️ Updated image")
+                logger.debug("🖼️ Updated image")
                 break
\ No newline at end of file
@@ -2,6 +2,7 @@
 Points slide handler - Handles generation/modification of bullet point slides
 """
 
+import logging
 from io import BytesIO
 from pptx import Presentation
 from pptx.util import Pt
@@ -9,6 +10,9 @@ from pptx.dml.color import RGBColor
 from typing import Dict, Any
 
 
+logger = logging.getLogger(__name__)
+
+
 def hex_to_rgb(hex_str):
     """Convert #RRGGBB string to RGBColor safely."""
     if not hex_str:
@@ -16,7 +20,7 @@ def hex_to_rgb(hex_str):
     
     hex_str = str(hex_str).strip().replace("#", "")
     if len(hex_str) != 6 or any(c not in "0123456789ABCDEFabcdef" for c in hex_str):
-        print(f"⚠️ Invalid hex color '{hex_str}', defaulting to black")
+        logger.warning("⚠️ Invalid hex color '%s', defaulting to black", hex_str)
         return RGBColor(0, 0, 0)
     
     return RGBColor(int(hex_str[0:2], 16),
@@ -36,7 +40,7 @@ def handle_points_slide(presentation_bytes: BytesIO, slide_data: Dict[str, Any],
     Returns:
         BytesIO containing the modified presentation
     """
-    print(f"🎯 Processing POINTS slide...")
+    logger.info("🎯 Processing POINTS slide...")
     
     prs = Presentation(presentation_bytes)
     
@@ -68,7 +72,7 @@ def handle_points_slide(presentation_bytes: BytesIO, slide_data: Dict[str, Any],
     prs.save(output)
     output.seek(0)
     
-    print(f"✅ Points slide processed successfully")
+    logger.info("✅ Points slide processed successfully")
     return output
 
 
@@ -82,7 +86,7 @@ def _update_header(slide, slide_data: Dict[str, Any]):
                     for paragraph in shape.text_frame.paragraphs:
                         for run in paragraph.runs:
                             run.font.color.rgb = hex_to_rgb(slide_data['header_color'])
-                print(f"📝 Updated header: {slide_data['header']}")
+                logger.debug("📝 Updated header: %s", slide_data['header'])
                 break
 
 
@@ -96,7 +100,7 @@ def _update_description(slide, slide_data: Dict[str, Any]):
                     for paragraph in shape.text_frame.paragraphs:
                         for run in paragraph.runs:
                             run.font.color.rgb = hex_to_rgb(slide_data['description_color'])
-                print(f"📝 Updated description: {slide_data['description'][:50]}...")
+                logger.debug("📝 Updated description: %.50s...", slide_data['description'])
                 break
 
 
@@ -112,7 +116,7 @@ def _update_image(slide, image_data: BytesIO):
                 sp.getparent().remove(sp)
                 # Add new image
                 slide.shapes.add_picture(image_data, left, top, width, height)
-                print(f"🖼️ Updated image")
+                logger.debug("🖼️ Updated image")
                 break
 
 
@@ -132,5 +136,5 @@ def _update_points(slide, slide_data: Dict[str, Any]):
                     if point.get('font_size'):
                         for run in paragraph.runs:
                             run.font.size = Pt(point['font_size'])
-                print(f"📋 Updated {len(slide_data['points'])} bullet points")
+                logger.debug("📋 Updated %s bullet points", len(slide_data['points']))
                 break
\ No newline at end of file
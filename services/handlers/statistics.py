@@ -2,26 +2,16 @@
 Statistics slide handler - Handles generation/modification of statistics slides
 """
 
+import logging
 from io import BytesIO
 from pptx import Presentation
 from pptx.util import Pt
-from pptx.dml.color import RGBColor
 from typing import Dict, Any
+from services.colors import hex_to_rgb
+from services.handlers.text_runs import write_paragraphs
 
 
-def hex_to_rgb(hex_str):
-    """Convert #RRGGBB string to RGBColor safely."""
-    if not hex_str:
-        return RGBColor(0, 0, 0)
-    
-    hex_str = str(hex_str).strip().replace("#", "")
-    if len(hex_str) != 6 or any(c not in "0123456789ABCDEFabcdef" for c in hex_str):
-        print(f"⚠️ Invalid hex color '{hex_str}', defaulting to black")
-        return RGBColor(0, 0, 0)
-    
-    return RGBColor(int(hex_str[0:2], 16),
-                    int(hex_str[2:4], 16),
-                    int(hex_str[4:6], 16))
+logger = logging.getLogger(__name__)
 
 
 def handle_statistics_slide(presentation_bytes: BytesIO, slide_data: Dict[str, Any], image_data: BytesIO = None) -> BytesIO:
@@ -43,7 +33,7 @@ def handle_statistics_slide(presentation_bytes: BytesIO, slide_data: Dict[str, A
     Returns:
         BytesIO containing the modified presentation
     """
-    print(f"📊 Processing STATISTICS slide...")
+    logger.info("📊 Processing STATISTICS slide...")
     
     prs = Presentation(presentation_bytes)
     
@@ -52,65 +42,70 @@ def handle_statistics_slide(presentation_bytes: BytesIO, slide_data: Dict[str, A
         raise ValueError(f"Slide {slide_data.get('slide_number')} not found in presentation")
     
     slide = prs.slides[slide_index]
+    # Build the shape proxies once and share them across all updates
+    shapes = list(slide.shapes)
     
     # Update title
     if slide_data.get('title'):
-        _update_title(slide, slide_data)
+        _update_title(slide, slide_data, shapes)
     
     # Update description
     if slide_data.get('description'):
-        _update_description(slide, slide_data)
+        _update_description(slide, slide_data, shapes)
     
     # Update statistics
     if slide_data.get('stat_data'):
-        _update_statistics(slide, slide_data)
+        _update_statistics(slide, slide_data, shapes)
     
     # Update background color if provided
     if slide_data.get('background_color'):
-        _update_background_color(slide, slide_data['background_color'])
+        _update_background_color(slide, slide_data['background_color'], shapes)
     
     # Update image if provided
     if image_data and slide_data.get('image_url'):
-        _update_image(slide, image_data)
+        _update_image(slide, image_data, shapes)
     
     output = BytesIO()
     prs.save(output)
     output.seek(0)
     
-    print(f"✅ Statistics slide processed successfully")
+    logger.info("✅ Statistics slide processed successfully")
     return output
 
 
-def _update_title(slide, slide_data: Dict[str, Any]):
+def _update_title(slide, slide_data: Dict[str, Any], shapes=None):
     """Update title text and formatting"""
-    for shape in slide.shapes:
+    for shape in shapes or slide.shapes:
         if 'title' in shape.name.lower() or shape.name.startswith('Title'):
             if hasattr(shape, 'text_frame'):
                 shape.text_frame.text = slide_data['title']
                 if slide_data.get('title_color'):
+                    rgb = hex_to_rgb(slide_data['title_color'])
                     for paragraph in shape.text_frame.paragraphs:
                         for run in paragraph.runs:
-                            run.font.color.rgb = hex_to_rgb(slide_data['title_color'])
-                print(f"📝 Updated title: {slide_data['title']}")
+                            run.font.color.rgb = rgb
+                logger.debug("📝 Updated title: %s", slide_data['title'])
                 break
 
 
-def _update_description(slide, slide_data: Dict[str, Any]):
+def _update_description(slide, slide_data: Dict[str, Any], shapes=None):
     """Update description text and formatting"""
-    for shape in slide.shapes:
+    for shape in shapes or slide.shapes:
         if 'description' in shape.name.lower() or shape.name.startswith('Description'):
             if hasattr(shape, 'text_frame'):
                 shape.text_frame.text = slide_data['description']
                 if slide_data.get('description_color'):
+                    rgb = hex_to_rgb(slide_data['description_color'])
                     for paragraph in shape.text_frame.paragraphs:
                         for run in paragraph.runs:
-                            run.font.color.rgb = hex_to_rgb(slide_data['description_color'])
-                print(f"📝 Updated description: {slide_data['description'][:50]}...")
+                            run.font.color.rgb = rgb
+                logger.debug("📝 Updated description: %.50s...", slide_data['description'])
                 break
 
 
-def _update_statistics(slide, slide_data: Dict[str, Any]):
+def _update_statistics(slide, slide_data: Dict[str, Any], shapes=None):
     """Update statistics data"""
+    shapes = shapes or list(slide.shapes)
     stat_data = slide_data.get('stat_data', [])
     if not stat_data:
         return
@@ -119,95 +114,74 @@ def _update_statistics(slide, slide_data: Dict[str, Any]):
     for i, stat in enumerate(stat_data, 1):
         label = stat.get('label', '')
         value = stat.get('value', '')
+        rgb = hex_to_rgb(stat['color']) if stat.get('color') else None
+        size = Pt(stat['font_size']) if stat.get('font_size') else None
         
         # Try to find combined stat shape first
         stat_shape_name = f"Stat{i}"
         found = False
         
-        for shape in slide.shapes:
+        for shape in shapes:
             if shape.name == stat_shape_name or f"stat{i}" in shape.name.lower():
                 if hasattr(shape, 'text_frame'):
-                    # Combined format: "Label\nValue"
-                    shape.text_frame.text = f"{label}\n{value}"
-                    
-                    # Apply formatting
-                    if stat.get('color'):
-                        for paragraph in shape.text_frame.paragraphs:
-                            for run in paragraph.runs:
-                                run.font.color.rgb = hex_to_rgb(stat['color'])
+                    # Combined format: "Label\nValue" with the value (second paragraph) bold
+                    write_paragraphs(shape.text_frame._txBody, f"{label}\n{value}".split("\n"),
+                                     rgb=rgb, size=size, bold_lines=(1,))
                     
-                    if stat.get('font_size'):
-                        for paragraph in shape.text_frame.paragraphs:
-                            for run in paragraph.runs:
-                                run.font.size = Pt(stat['font_size'])
-                    
-                    # Make value bold (second paragraph)
-                    if len(shape.text_frame.paragraphs) > 1:
-                        for run in shape.text_frame.paragraphs[1].runs:
-                            run.font.bold = True
-                    
-                    print(f"📊 Updated Stat {i}: {label} = {value}")
+                    logger.debug("📊 Updated Stat %d: %s = %s", i, label, value)
                     found = True
                     break
         
         # If not found, try separate Label/Value shapes
         if not found:
-            _update_separate_label_value(slide, i, label, value, stat)
+            _update_separate_label_value(slide, i, label, value, stat, shapes)
 
 
-def _update_separate_label_value(slide, index: int, label: str, value: str, stat: Dict[str, Any]):
+def _update_separate_label_value(slide, index: int, label: str, value: str, stat: Dict[str, Any], shapes=None):
     """Update separate label and value shapes"""
+    shapes = shapes or list(slide.shapes)
     label_shape_name = f"Label{index}"
     value_shape_name = f"Value{index}"
+    rgb = hex_to_rgb(stat['color']) if stat.get('color') else None
+    size = Pt(stat['font_size']) if stat.get('font_size') else None
     
     # Update label
-    for shape in slide.shapes:
+    for shape in shapes:
         if shape.name == label_shape_name or f"label{index}" in shape.name.lower():
             if hasattr(shape, 'text_frame'):
-                shape.text_frame.text = label
-                if stat.get('color'):
-                    for paragraph in shape.text_frame.paragraphs:
-                        for run in paragraph.runs:
-                            run.font.color.rgb = hex_to_rgb(stat['color'])
+                write_paragraphs(shape.text_frame._txBody, str(label).split("\n"), rgb=rgb)
                 break
     
     # Update value
-    for shape in slide.shapes:
+    for shape in shapes:
         if shape.name == value_shape_name or f"value{index}" in shape.name.lower():
             if hasattr(shape, 'text_frame'):
-                shape.text_frame.text = value
-                if stat.get('color'):
-                    for paragraph in shape.text_frame.paragraphs:
-                        for run in paragraph.runs:
-                            run.font.color.rgb = hex_to_rgb(stat['color'])
-                            run.font.bold = True
-                
-                if stat.get('font_size'):
-                    for paragraph in shape.text_frame.paragraphs:
-                        for run in paragraph.runs:
-                            run.font.size = Pt(stat['font_size'])
+                lines = str(value).split("\n")
+                # Value runs are bold only when a color is given, as before
+                bold_lines = range(len(lines)) if rgb is not None else ()
+                write_paragraphs(shape.text_frame._txBody, lines, rgb=rgb, size=size, bold_lines=bold_lines)
                 
-                print(f"📊 Updated Stat {index}: {label} = {value}")
+                logger.debug("📊 Updated Stat %d: %s = %s", index, label, value)
                 break
 
 
-def _update_background_color(slide, background_color: str):
+def _update_background_color(slide, background_color: str, shapes=None):
     """Update background color"""
     # This would need to be customized based on your template structure
     # For now, just log that we found background elements
-    for shape in slide.shapes:
+    for shape in shapes or slide.shapes:
         if 'background' in shape.name.lower() or 'bg' in shape.name.lower():
-            print(f"🎨 Found background element: {shape.name}")
+            logger.debug("🎨 Found background element: %s", shape.name)
 
 
-def _update_image(slide, image_data: BytesIO):
+def _update_image(slide, image_data: BytesIO, shapes=None):
     """Update image in slide"""
-    for shape in slide.shapes:
+    for shape in shapes or slide.shapes:
         if 'image' in shape.name.lower() or 'picture' in shape.name.lower():
             if shape.shape_type == 13:  # Picture type
                 left, top, width, height = shape.left, shape.top, shape.width, shape.height
                 sp = shape.element
                 sp.getparent().remove(sp)
                 slide.shapes.add_picture(image_data, left, top, width, height)
-                print(f"🖼️ Updated image")
+                logger.debug("🖼️ Updated image")
                 break
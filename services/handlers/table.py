@@ -2,25 +2,15 @@
 Table slide handler - Handles generation/modification of table slides
 """
 
+import logging
 from io import BytesIO
 from pptx import Presentation
-from pptx.dml.color import RGBColor
 from typing import Dict, Any, List
+from services.colors import hex_to_rgb
+from services.handlers.text_runs import write_paragraphs
 
 
-def hex_to_rgb(hex_str):
-    """Convert #RRGGBB string to RGBColor safely."""
-    if not hex_str:
-        return RGBColor(0, 0, 0)
-    
-    hex_str = str(hex_str).strip().replace("#", "")
-    if len(hex_str) != 6 or any(c not in "0123456789ABCDEFabcdef" for c in hex_str):
-        print(f"⚠️ Invalid hex color '{hex_str}', defaulting to black")
-        return RGBColor(0, 0, 0)
-    
-    return RGBColor(int(hex_str[0:2], 16),
-                    int(hex_str[2:4], 16),
-                    int(hex_str[4:6], 16))
+logger = logging.getLogger(__name__)
 
 
 def handle_table_slide(presentation_bytes: BytesIO, slide_data: Dict[str, Any], image_data: BytesIO = None) -> BytesIO:
@@ -35,7 +25,7 @@ def handle_table_slide(presentation_bytes: BytesIO, slide_data: Dict[str, Any],
     Returns:
         BytesIO containing the modified presentation
     """
-    print(f"📊 Processing TABLE slide...")
+    logger.info("📊 Processing TABLE slide...")
     
     prs = Presentation(presentation_bytes)
     
@@ -44,62 +34,62 @@ def handle_table_slide(presentation_bytes: BytesIO, slide_data: Dict[str, Any],
         raise ValueError(f"Slide {slide_data.get('slide_number')} not found in presentation")
     
     slide = prs.slides[slide_index]
+    # Build the shape proxies once and share them across all updates
+    shapes = list(slide.shapes)
     
     # Update title
     if slide_data.get('title'):
-        _update_title(slide, slide_data)
+        _update_title(slide, slide_data, shapes)
     
     # Update table
     if slide_data.get('table_data'):
-        _update_table(slide, slide_data)
+        _update_table(slide, slide_data, shapes)
     
     output = BytesIO()
     prs.save(output)
     output.seek(0)
     
-    print(f"✅ Table slide processed successfully")
+    logger.info("✅ Table slide processed successfully")
     return output
 
 
-def _update_title(slide, slide_data: Dict[str, Any]):
+def _update_title(slide, slide_data: Dict[str, Any], shapes=None):
     """Update title text and formatting"""
-    for shape in slide.shapes:
+    for shape in shapes or slide.shapes:
         if 'title' in shape.name.lower():
             if hasattr(shape, 'text_frame'):
                 shape.text_frame.text = slide_data['title']
-                print(f"📝 Updated title: {slide_data['title']}")
+                logger.debug("📝 Updated title: %s", slide_data['title'])
                 break
 
 
-def _update_table(slide, slide_data: Dict[str, Any]):
+def _update_table(slide, slide_data: Dict[str, Any], shapes=None):
     """Update table data and formatting"""
     table_data = slide_data.get('table_data', [])
     if not table_data:
         return
     
-    for shape in slide.shapes:
+    header_rgb = None
+    if slide_data.get('header_row', True) and slide_data.get('header_color'):
+        header_rgb = hex_to_rgb(slide_data['header_color'])
+    
+    for shape in shapes or slide.shapes:
         if shape.has_table:
-            table = shape.table
+            # Walk <a:tr>/<a:tc> once instead of resolving table.cell() per cell
+            tbl = shape.table._tbl
+            col_count = len(tbl.tblGrid.gridCol_lst)
             
             # Update table cells
             rows_updated = 0
-            for row_idx, row_data in enumerate(table_data):
-                if row_idx >= len(table.rows):
-                    break
-                for col_idx, cell_data in enumerate(row_data):
-                    if col_idx >= len(table.columns):
-                        break
-                    cell = table.cell(row_idx, col_idx)
-                    cell.text = str(cell_data)
-                    
-                    # Apply header formatting
-                    if row_idx == 0 and slide_data.get('header_row', True):
-                        if slide_data.get('header_color'):
-                            for paragraph in cell.text_frame.paragraphs:
-                                for run in paragraph.runs:
-                                    run.font.color.rgb = hex_to_rgb(slide_data['header_color'])
-                                    run.font.bold = True
+            for row_idx, (tr, row_data) in enumerate(zip(tbl.tr_lst, table_data)):
+                # Apply header formatting to the first row only
+                row_rgb = header_rgb if row_idx == 0 else None
+                for tc, cell_data in zip(tr.tc_lst[:col_count], row_data):
+                    # Header cells are written bold in the header color
+                    lines = str(cell_data).split("\n")
+                    bold_lines = range(len(lines)) if row_rgb is not None else ()
+                    write_paragraphs(tc.get_or_add_txBody(), lines, rgb=row_rgb, bold_lines=bold_lines)
                 rows_updated += 1
             
-            print(f"📋 Updated table with {rows_updated} rows and {len(table_data[0]) if table_data else 0} columns")
-            break
\ No newline at end of file
+            logger.debug("📋 Updated table with %d rows and %d columns", rows_updated, len(table_data[0]) if table_data else 0)
+            break
@@ -0,0 +1,59 @@
+"""
+Text run helpers - Shared XML construction for handlers that rewrite text bodies
+"""
+
+import re
+from lxml import etree
+from pptx.oxml.ns import qn
+
+
+# Control characters lxml refuses in text; tab and line feed are allowed
+_CTRL_CHARS = re.compile(r"[\x00-\x08\x0B-\x1F]")
+
+
+def escape_ctrl_chars(text: str) -> str:
+    """
+    Replace control characters with the plain-text escape python-pptx uses
+
+    For example a BEL character (0x07) becomes "_x0007_", so sheet data
+    containing control characters still renders instead of raising in lxml.
+    """
+    return _CTRL_CHARS.sub(lambda match: "_x%04X_" % ord(match.group()), text)
+
+
+def write_paragraphs(txBody, lines, rgb=None, size=None, bold_lines=()):
+    """
+    Rewrite a <a:txBody>'s paragraphs in a single XML edit
+
+    Builds each <a:p>/<a:r>/<a:rPr> with color, size and bold set inline,
+    instead of assigning text and then re-walking paragraphs/runs to format.
+    A vertical tab inside a line becomes an <a:br/> line break, as it does
+    when assigning text through python-pptx.
+
+    Args:
+        txBody: <a:txBody> element to rewrite
+        lines: List of paragraph strings
+        rgb: Optional RGBColor applied to every run
+        size: Optional font size (Length) applied to every run
+        bold_lines: Indexes of lines whose runs should be bold
+    """
+    for p in txBody.findall(qn('a:p')):
+        txBody.remove(p)
+
+    for line_idx, line in enumerate(lines):
+        p = etree.SubElement(txBody, qn('a:p'))
+        for segment_idx, segment in enumerate(line.split("\v")):
+            if segment_idx:
+                etree.SubElement(p, qn('a:br'))
+            if not segment:
+                continue
+            r = etree.SubElement(p, qn('a:r'))
+            rPr = etree.SubElement(r, qn('a:rPr'))
+            if size is not None:
+                rPr.set('sz', str(int(round(size.pt * 100))))
+            if line_idx in bold_lines:
+                rPr.set('b', '1')
+            if rgb is not None:
+                solidFill = etree.SubElement(rPr, qn('a:solidFill'))
+                etree.SubElement(solidFill, qn('a:srgbClr'), val=str(rgb))
+            etree.SubElement(r, qn('a:t')).text = escape_ctrl_chars(segment)
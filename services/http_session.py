@@ -0,0 +1,26 @@
+"""
+Shared HTTP session - One pooled keep-alive session for template and image downloads
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def _build_session() -> requests.Session:
+    """Build a keep-alive session that retries rate limits and transient 5xx responses"""
+    session = requests.Session()
+    session.headers['User-Agent'] = 'PPTTOEXCEL-slide-service'
+    # pool_maxsize covers parallel image prefetches plus concurrent requests
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=64,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+# Used by SlideDataService and the slide handlers, so all downloads share one pool
+http_session = _build_session()
@@ -1,31 +1,122 @@
 import os
 import io
-import requests
+import functools
+import itertools
+import logging
+import re
+import shutil
+from collections import namedtuple
 from io import BytesIO
+from lxml import etree
 from pptx import Presentation
 from pptx.dml.color import RGBColor
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
 from services.sheets_service import get_sheets_service
 from services.s3_service import s3_service
+from services.http_session import http_session
+from services.colors import hex_to_rgb
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
+try:
+    import ahocorasick
+except ImportError:  # Optional - falls back to a compiled regex alternation
+    ahocorasick = None
+
+# Namespaces used to walk the slide XML directly
+_NSMAP = {
+    'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
+    'p': 'http://schemas.openxmlformats.org/presentationml/2006/main',
+}
+
+# Precompiled XPath expressions - evaluated in C by lxml, no shape proxies needed
+_SP_XP = etree.XPath("./p:sp", namespaces=_NSMAP)
+_SP_NAME_XP = etree.XPath("string(./p:nvSpPr/p:cNvPr/@name)", namespaces=_NSMAP)
+_SP_TEXT_XP = etree.XPath("./p:txBody//a:t/text()", namespaces=_NSMAP)
+
+# Per-shape lookups derived from the sheet rows, see build_all_maps
+SheetMaps = namedtuple('SheetMaps', ['replacements', 'color_map', 'image_map'])
+
+
+@functools.lru_cache(maxsize=8)
+def _load_template(s3_key: str) -> bytes:
+    """
+    Download template bytes from S3, cached per key so repeated generations
+    from the same template skip the S3 round-trip.
+    
+    Call _load_template.cache_clear() after replacing a template in S3.
+    """
+    template_bytes = s3_service.download_file(s3_key)
+    if not template_bytes:
+        raise RuntimeError(f"Failed to download template from S3: {s3_key}")
+    return template_bytes
+
+
+def _build_placeholder_finder(placeholders):
+    """
+    Build a single-pass matcher over all {{placeholder}} strings
+    
+    Uses an Aho-Corasick automaton when pyahocorasick is installed, otherwise
+    a compiled regex alternation (longest placeholders first).
+    
+    Args:
+        placeholders: Iterable of placeholder strings to search for
+        
+    Returns:
+        Function mapping text → iterable of (start, end, placeholder) matches,
+        leftmost-longest and non-overlapping, or None if there is nothing to find
+    """
+    placeholders = list(placeholders)
+    if not placeholders:
+        return None
+    
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for placeholder in placeholders:
+            automaton.add_word(placeholder, placeholder)
+        automaton.make_automaton()
+        
+        def find(text):
+            for end, placeholder in automaton.iter_long(text):
+                yield end - len(placeholder) + 1, end + 1, placeholder
+        return find
+    
+    pattern = re.compile("|".join(
+        re.escape(p) for p in sorted(placeholders, key=len, reverse=True)
+    ))
+    return lambda text: ((m.start(), m.end(), m.group()) for m in pattern.finditer(text))
+
+
+def _substitute_placeholders(text: str, find, values: Dict[str, str]) -> tuple:
+    """
+    Replace every placeholder match in one pass, splicing slices instead of
+    repeatedly rebuilding the string
+    
+    Returns:
+        tuple: (new_text, list of distinct placeholders replaced, in order)
+    """
+    pieces = []
+    replaced = []
+    pos = 0
+    for start, end, placeholder in find(text):
+        pieces.append(text[pos:start])
+        pieces.append(values[placeholder])
+        pos = end
+        if placeholder not in replaced:
+            replaced.append(placeholder)
+    if not replaced:
+        return text, replaced
+    pieces.append(text[pos:])
+    return "".join(pieces), replaced
+
 class PPTGenerationService:
     """Service for generating PowerPoint presentations from templates"""
     
     @staticmethod
     def hex_to_rgb(hex_str):
         """Convert #RRGGBB string to RGBColor safely."""
-        if not hex_str:
-            return RGBColor(0, 0, 0)
-        
-        hex_str = str(hex_str).strip().replace("#", "")
-        if len(hex_str) != 6 or any(c not in "0123456789ABCDEFabcdef" for c in hex_str):
-            print(f"⚠️ Invalid hex color '{hex_str}', defaulting to black")
-            return RGBColor(0, 0, 0)
-        
-        return RGBColor(int(hex_str[0:2], 16),
-                        int(hex_str[2:4], 16),
-                        int(hex_str[4:6], 16))
+        return hex_to_rgb(hex_str)
     
     def get_template_data_from_sheets(self, template_id: str) -> List[Dict]:
         """
@@ -52,82 +143,104 @@ class PPTGenerationService:
         
         # First row is headers
         headers = rows[0]
-        data_rows = rows[1:]
-        
-        # Filter rows by template_id (column A)
-        filtered_data = []
-        for row in data_rows:
-            if len(row) > 0 and row[0] == template_id:
-                # Convert row to dictionary using headers
-                row_dict = {}
-                for i, header in enumerate(headers):
-                    row_dict[header] = row[i] if i < len(row) else ""
-                filtered_data.append(row_dict)
-        
-        print(f"📊 Found {len(filtered_data)} rows for template_id: {template_id}")
+        header_count = len(headers)
+        padding = [""] * header_count
+        
+        # Filter rows by template_id (column A) and convert each to a dictionary,
+        # padding short rows so every header gets a value
+        filtered_data = [
+            dict(zip(headers, (row + padding)[:header_count]))
+            for row in itertools.islice(rows, 1, None)
+            if row and row[0] == template_id
+        ]
+        
+        logger.info("📊 Found %d rows for template_id: %s", len(filtered_data), template_id)
         return filtered_data
     
-    def build_replacements_dict(self, sheet_data: List[Dict]) -> Dict[str, str]:
+    def build_all_maps(self, sheet_data: List[Dict]) -> SheetMaps:
         """
-        Build a dictionary of shape_name → content mappings
-        Maps actual shape names from PPT to their content values
+        Build the text, color and image maps in a single pass over the sheet data
         
         Args:
             sheet_data: List of row dictionaries from Google Sheets
             
         Returns:
-            Dictionary mapping shape names to content values
+            SheetMaps with:
+                - replacements: shape name (and lowercase name) → content value
+                - color_map: lowercase shape name → (fill RGBColor or None, font RGBColor or None)
+                - image_map: lowercase shape name → image URL
         """
         replacements = {}
+        color_map = {}
+        image_map = {}
+        parsed_colors = {}  # hex string → RGBColor, palettes repeat across rows
+        primary_color = None
+        secondary_color = None
         
-        # Map each shape name to its sub-component content
         for row in sheet_data:
             shape_name = row.get('Shape Name', '').strip()
+            fill_color = row.get('Fill Color', '')
+            font_color = row.get('Font Color', '')
             
-            # Get sub-component value from "Component | Sub-component" column
-            sub_component = row.get('Sub-component', '').strip()
-            
-            # Fallback to Content column if Sub-component is empty
-            if not sub_component:
-                sub_component = row.get('Content', '').strip()
+            # First colors found become the primary/secondary color placeholders
+            if primary_color is None and fill_color.strip().startswith('#'):
+                primary_color = fill_color.strip()
+            if secondary_color is None and font_color.strip().startswith('#'):
+                secondary_color = font_color.strip()
             
             if not shape_name:
                 continue
+            shape_key = shape_name.lower()
+            
+            # Get sub-component value from "Component | Sub-component" column,
+            # falling back to Content column if Sub-component is empty
+            sub_component = row.get('Sub-component', '').strip()
+            if not sub_component:
+                sub_component = row.get('Content', '').strip()
             
-            # Direct mapping: shape name → sub-component value
+            # Direct mapping plus lowercase version for case-insensitive matching
             replacements[shape_name] = sub_component
+            replacements[shape_key] = sub_component
+            logger.debug("  📝 '%s' → '%s'", shape_name, sub_component)
             
-            # Also create lowercase version for case-insensitive matching
-            replacements[shape_name.lower()] = sub_component
+            # Decode colors once here so the apply loop only does a dict lookup
+            if fill_color and fill_color not in parsed_colors:
+                parsed_colors[fill_color] = self.hex_to_rgb(fill_color)
+            if font_color and font_color not in parsed_colors:
+                parsed_colors[font_color] = self.hex_to_rgb(font_color)
+            color_map[shape_key] = (
+                parsed_colors[fill_color] if fill_color else None,
+                parsed_colors[font_color] if font_color else None
+            )
             
-            print(f"  📝 '{shape_name}' → '{sub_component}'")
+            image_url = row.get('Image S3 URL', '') or row.get('Image URL', '')
+            if image_url and image_url.startswith('http'):
+                image_map[shape_key] = image_url
         
-        # Add color placeholders if they exist
-        if sheet_data:
-            # Get unique colors from all rows
-            fill_colors = set()
-            font_colors = set()
-            
-            for row in sheet_data:
-                fill_color = row.get('Fill Color', '').strip()
-                font_color = row.get('Font Color', '').strip()
-                
-                if fill_color and fill_color.startswith('#'):
-                    fill_colors.add(fill_color)
-                if font_color and font_color.startswith('#'):
-                    font_colors.add(font_color)
-            
-            # Use first found colors as primary/secondary
-            if fill_colors:
-                replacements["{{P100}}"] = list(fill_colors)[0]
-            if font_colors:
-                replacements["{{S100}}"] = list(font_colors)[0]
+        if primary_color:
+            replacements["{{P100}}"] = primary_color
+        if secondary_color:
+            replacements["{{S100}}"] = secondary_color
         
-        print(f"🔑 Built {len(replacements)} shape name → sub-component mappings")
+        logger.info("🔑 Built %d shape name → sub-component mappings", len(replacements))
         # Show first 5 mappings as examples
-        for i, (name, value) in enumerate(list(replacements.items())[:5]):
-            print(f"   '{name}' → '{value}'")
-        return replacements
+        if logger.isEnabledFor(logging.DEBUG):
+            for name, value in itertools.islice(replacements.items(), 5):
+                logger.debug("   '%s' → '%s'", name, value)
+        return SheetMaps(replacements, color_map, image_map)
+    
+    def build_replacements_dict(self, sheet_data: List[Dict]) -> Dict[str, str]:
+        """
+        Build a dictionary of shape_name → content mappings
+        Maps actual shape names from PPT to their content values
+        
+        Args:
+            sheet_data: List of row dictionaries from Google Sheets
+            
+        Returns:
+            Dictionary mapping shape names to content values
+        """
+        return self.build_all_maps(sheet_data).replacements
     
     def replace_text_in_presentation(self, prs: Presentation, replacements: Dict[str, str]) -> int:
         """
@@ -142,10 +255,16 @@ class PPTGenerationService:
         """
         replacement_count = 0
         
+        # {{ShapeName}} placeholder → replacement value, matched in a single scan
+        placeholder_values = {f"{{{{{key}}}}}": str(value) for key, value in replacements.items()}
+        find_placeholders = _build_placeholder_finder(placeholder_values)
+        
         for slide_idx, slide in enumerate(prs.slides, start=1):
-            for shape in slide.shapes:
-                # Get the shape name
-                shape_name = shape.name.strip()
+            shapes = slide.shapes
+            # Walk <p:sp> elements with lxml; only autoshapes/text boxes carry text
+            for sp in _SP_XP(shapes._spTree):
+                # Get the shape name straight from <p:cNvPr>
+                shape_name = _SP_NAME_XP(sp).strip()
                 shape_name_lower = shape_name.lower()
                 
                 # Check if this shape name exists in our mappings
@@ -155,130 +274,121 @@ class PPTGenerationService:
                 elif shape_name_lower in replacements:
                     content = replacements[shape_name_lower]
                 
+                # Skip shapes we won't touch without building a python-pptx proxy:
+                # no mapping and no "{{" anywhere in the shape's text runs
+                if content is None and (find_placeholders is None or "{{" not in "".join(_SP_TEXT_XP(sp))):
+                    continue
+                
+                shape = shapes._shape_factory(sp)
+                original_text = shape.text
+                
                 # Replace the text if we found content
                 if content is not None:
-                    if shape.has_text_frame:
-                        # Replace all text in the shape with content
-                        original_text = shape.text
-                        shape.text = str(content)
+                    # Replace all text in the shape with content, unless it already
+                    # matches (rewriting would also drop the run formatting)
+                    content = str(content)
+                    if original_text != content:
+                        shape.text = content
+                        original_text = content
                         replacement_count += 1
-                        print(f"  ✓ Slide {slide_idx}: Shape '{shape_name}' → '{content[:50]}...'")
-                    elif hasattr(shape, 'text'):
-                        try:
-                            shape.text = str(content)
-                            replacement_count += 1
-                            print(f"  ✓ Slide {slide_idx}: Shape '{shape_name}' → '{content[:50]}...'")
-                        except:
-                            pass
+                        logger.debug("  ✓ Slide %d: Shape '%s' → '%.50s...'", slide_idx, shape_name, content)
                 
                 # Also check for {{placeholder}} patterns in existing text
-                if shape.has_text_frame:
-                    original_text = shape.text
-                    new_text = original_text
-                    
-                    # Replace any {{ShapeName}} placeholders
-                    for shape_key, value in replacements.items():
-                        placeholder = f"{{{{{shape_key}}}}}"
-                        if placeholder in new_text:
-                            new_text = new_text.replace(placeholder, str(value))
-                            replacement_count += 1
-                            print(f"  ✓ Slide {slide_idx}: Replaced placeholder {placeholder[:30]}... → '{value[:50]}...'")
-                    
-                    # Update if changed
-                    if new_text != original_text:
-                        shape.text = new_text
+                if find_placeholders is None or "{{" not in original_text:
+                    continue
+                
+                # Replace any {{ShapeName}} placeholders
+                new_text, replaced = _substitute_placeholders(original_text, find_placeholders, placeholder_values)
+                for placeholder in replaced:
+                    replacement_count += 1
+                    logger.debug("  ✓ Slide %d: Replaced placeholder %.30s... → '%.50s...'",
+                                 slide_idx, placeholder, placeholder_values[placeholder])
+                
+                # Update if changed
+                if new_text != original_text:
+                    shape.text = new_text
         
-        print(f"✅ Made {replacement_count} text replacements")
+        logger.info("✅ Made %d text replacements", replacement_count)
         return replacement_count
     
-    def apply_colors_from_data(self, prs: Presentation, sheet_data: List[Dict]):
+    def apply_colors_from_data(self, prs: Presentation, sheet_data: List[Dict], color_map: Optional[Dict[str, Tuple[Optional[RGBColor], Optional[RGBColor]]]] = None):
         """
         Apply fill colors and font colors based on sheet data
         
         Args:
             prs: PowerPoint presentation object
             sheet_data: List of row dictionaries with color information
+            color_map: Optional prebuilt color map from build_all_maps
         """
-        # Build color map by shape name
-        color_map = {}
-        for row in sheet_data:
-            shape_name = row.get('Shape Name', '').lower().strip()
-            fill_color = row.get('Fill Color', '')
-            font_color = row.get('Font Color', '')
-            
-            if shape_name:
-                color_map[shape_name] = {
-                    'fill': fill_color,
-                    'font': font_color
-                }
+        if color_map is None:
+            color_map = self.build_all_maps(sheet_data).color_map
         
         # Apply colors to shapes
         for slide_idx, slide in enumerate(prs.slides, start=1):
             for shape in slide.shapes:
                 shape_key = shape.name.lower().strip()
                 
-                if shape_key in color_map:
-                    colors = color_map[shape_key]
+                colors = color_map.get(shape_key)
+                if colors:
+                    fill_rgb, font_rgb = colors
                     
                     # Apply fill color
-                    if colors['fill']:
+                    if fill_rgb is not None:
                         try:
                             if hasattr(shape, 'fill'):
                                 shape.fill.solid()
-                                shape.fill.fore_color.rgb = self.hex_to_rgb(colors['fill'])
-                                print(f"  🎨 Applied fill color to '{shape.name}'")
+                                shape.fill.fore_color.rgb = fill_rgb
+                                logger.debug("  🎨 Applied fill color to '%s'", shape.name)
                         except Exception as e:
-                            print(f"  ⚠️ Could not apply fill color to '{shape.name}': {e}")
+                            logger.warning("  ⚠️ Could not apply fill color to '%s': %s", shape.name, e)
                     
                     # Apply font color
-                    if colors['font'] and shape.has_text_frame:
+                    if font_rgb is not None and shape.has_text_frame:
                         try:
-                            rgb_color = self.hex_to_rgb(colors['font'])
                             for paragraph in shape.text_frame.paragraphs:
                                 for run in paragraph.runs:
-                                    run.font.color.rgb = rgb_color
-                            print(f"  🎨 Applied font color to '{shape.name}'")
+                                    run.font.color.rgb = font_rgb
+                            logger.debug("  🎨 Applied font color to '%s'", shape.name)
                         except Exception as e:
-                            print(f"  ⚠️ Could not apply font color to '{shape.name}': {e}")
+                            logger.warning("  ⚠️ Could not apply font color to '%s': %s", shape.name, e)
     
-    def replace_images_from_data(self, prs: Presentation, sheet_data: List[Dict]):
+    def replace_images_from_data(self, prs: Presentation, sheet_data: List[Dict], image_map: Dict[str, str] = None):
         """
         Replace images in shapes based on Image S3 URL from sheet data
         
         Args:
             prs: PowerPoint presentation object
             sheet_data: List of row dictionaries with image URLs
+            image_map: Optional prebuilt image map from build_all_maps
         """
-        # Build image map by shape name
-        image_map = {}
-        for row in sheet_data:
-            shape_name = row.get('Shape Name', '').lower().strip()
-            image_url = row.get('Image S3 URL', '') or row.get('Image URL', '')
-            
-            if shape_name and image_url and image_url.startswith('http'):
-                image_map[shape_name] = image_url
+        if image_map is None:
+            image_map = self.build_all_maps(sheet_data).image_map
         
-        # Replace images
+        # Replace images (snapshot the shapes - the tree is mutated while we go)
         for slide_idx, slide in enumerate(prs.slides, start=1):
-            for shape in slide.shapes:
+            for shape in list(slide.shapes):
                 shape_key = shape.name.lower().strip()
                 
                 if shape_key in image_map:
                     image_url = image_map[shape_key]
                     try:
                         # Download image
-                        print(f"  📥 Downloading image for '{shape.name}' from {image_url[:50]}...")
-                        response = requests.get(image_url, timeout=10)
-                        response.raise_for_status()
-                        image_bytes = BytesIO(response.content)
+                        logger.debug("  📥 Downloading image for '%s' from %.50s...", shape.name, image_url)
+                        with http_session.get(image_url, timeout=10, stream=True) as response:
+                            response.raise_for_status()
+                            # Stream straight into the buffer, no intermediate bytes copy
+                            response.raw.decode_content = True
+                            image_bytes = BytesIO()
+                            shutil.copyfileobj(response.raw, image_bytes)
+                        image_bytes.seek(0)
                         
                         # Replace shape with image
                         left, top, width, height = shape.left, shape.top, shape.width, shape.height
                         slide.shapes._spTree.remove(shape._element)
                         slide.shapes.add_picture(image_bytes, left, top, width, height)
-                        print(f"  🖼️ Image replaced in '{shape.name}'")
+                        logger.debug("  🖼️ Image replaced in '%s'", shape.name)
                     except Exception as e:
-                        print(f"  ⚠️ Could not replace image in '{shape.name}': {e}")
+                        logger.warning("  ⚠️ Could not replace image in '%s': %s", shape.name, e)
     
     def generate_presentation(
         self,
@@ -295,43 +405,42 @@ class PPTGenerationService:
             output_filename: Optional custom filename for output
             
         Returns:
-            tuple: (presentation_bytes, filename, stats_dict)
+            tuple: (presentation_buffer, filename, stats_dict) - the buffer is a
+            BytesIO positioned at 0
         """
-        print(f"\n🚀 Starting presentation generation...")
-        print(f"📄 Template: {template_s3_url}")
-        print(f"🆔 Template ID: {template_id}")
+        logger.info("🚀 Starting presentation generation...")
+        logger.info("📄 Template: %s", template_s3_url)
+        logger.info("🆔 Template ID: %s", template_id)
         
         # Download template from S3
         from urllib.parse import urlparse, unquote
         parsed_url = urlparse(template_s3_url)
         s3_key = unquote(parsed_url.path.lstrip('/'))
         
-        print(f"📥 Downloading template from S3: {s3_key}")
-        template_bytes = s3_service.download_file(s3_key)
-        if not template_bytes:
-            raise RuntimeError(f"Failed to download template from S3: {s3_key}")
+        logger.info("📥 Loading template from S3: %s", s3_key)
+        template_bytes = _load_template(s3_key)
         
-        # Load presentation
+        # Load presentation (parsed fresh per request, each gets its own copy)
         prs = Presentation(BytesIO(template_bytes))
-        print(f"✅ Template loaded: {len(prs.slides)} slides")
+        logger.info("✅ Template loaded: %d slides", len(prs.slides))
         
         # Get data from Google Sheets
         sheet_data = self.get_template_data_from_sheets(template_id)
         if not sheet_data:
             raise RuntimeError(f"No data found for template_id: {template_id}")
         
-        # Build replacement mappings
-        replacements = self.build_replacements_dict(sheet_data)
+        # Build text/color/image mappings in one pass
+        maps = self.build_all_maps(sheet_data)
         
         # Apply all transformations
-        print("\n🔄 Applying transformations...")
-        text_replacements = self.replace_text_in_presentation(prs, replacements)
+        logger.info("🔄 Applying transformations...")
+        text_replacements = self.replace_text_in_presentation(prs, maps.replacements)
         
-        print("\n🎨 Applying colors...")
-        self.apply_colors_from_data(prs, sheet_data)
+        logger.info("🎨 Applying colors...")
+        self.apply_colors_from_data(prs, sheet_data, maps.color_map)
         
-        print("\n🖼️ Replacing images...")
-        self.replace_images_from_data(prs, sheet_data)
+        logger.info("🖼️ Replacing images...")
+        self.replace_images_from_data(prs, sheet_data, maps.image_map)
         
         # Generate output filename
         if not output_filename:
@@ -342,7 +451,6 @@ class PPTGenerationService:
         output_buffer = BytesIO()
         prs.save(output_buffer)
         output_buffer.seek(0)
-        presentation_bytes = output_buffer.getvalue()
         
         stats = {
             'template_id': template_id,
@@ -350,15 +458,15 @@ class PPTGenerationService:
             'data_rows': len(sheet_data),
             'text_replacements': text_replacements,
             'output_filename': output_filename,
-            'file_size': len(presentation_bytes)
+            'file_size': output_buffer.getbuffer().nbytes
         }
         
-        print(f"\n✅ Presentation generated successfully!")
-        print(f"   📊 {stats['slides_count']} slides")
-        print(f"   📝 {stats['text_replacements']} text replacements")
-        print(f"   💾 {stats['file_size'] / 1024:.2f} KB")
+        logger.info("✅ Presentation generated successfully!")
+        logger.info("   📊 %d slides", stats['slides_count'])
+        logger.info("   📝 %d text replacements", stats['text_replacements'])
+        logger.info("   💾 %.2f KB", stats['file_size'] / 1024)
         
-        return presentation_bytes, output_filename, stats
+        return output_buffer, output_filename, stats
 
 
 # Create singleton instance
@@ -1,13 +1,76 @@
 import os
+import hashlib
+import itertools
+import logging
+import socket
+import threading
+import time
 import boto3
+import requests
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from botocore.exceptions import ClientError
 from io import BytesIO
-from datetime import datetime
-from typing import BinaryIO, Optional
-import hashlib
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FuturesTimeout
+from typing import BinaryIO, Iterable, Iterator, Optional
+import secrets
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib.parse import quote
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+_PPTX_MIME = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+
+# Managed transfer settings: payloads over 8 MB are uploaded as 8 MB parts
+# over up to 10 parallel connections
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=10,
+    use_threads=True
+)
+
+
+# Objects larger than this are fetched over parallel byte-range GETs
+_RANGED_DOWNLOAD_THRESHOLD = 64 * 1024 * 1024
+_RANGE_PART_SIZE = 16 * 1024 * 1024
+_RANGE_MAX_WORKERS = 10
+
+# Direct S3 HTTP is only started alongside CloudFront once CloudFront has
+# taken this long without finishing
+_CLOUDFRONT_HEDGE_SECONDS = 2.0
+
+# Presigned URLs are signed this much longer than requested and reused for
+# that window, so a cached URL still has the full requested lifetime
+_PRESIGN_REUSE_SECONDS = 300
+_PRESIGN_MAX_EXPIRATION = 7 * 24 * 3600
+_LIST_CACHE_TTL_SECONDS = 30
+
+# Client tuning: a connection pool large enough for concurrent transfers,
+# short timeouts, and adaptive retries that back off on 503 SlowDown
+_BOTO_CONFIG = Config(
+    max_pool_connections=64,
+    connect_timeout=5,
+    read_timeout=30,
+    retries={'max_attempts': 5, 'mode': 'adaptive'},
+    tcp_keepalive=True,
+    s3={'addressing_style': 'virtual'}
+)
+
+class _BufferedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose sockets use a larger receive buffer for big downloads"""
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['socket_options'] = HTTPConnection.default_socket_options + [
+            (socket.SOL_SOCKET, socket.SO_RCVBUF, 4 * 1024 * 1024)
+        ]
+        super().init_poolmanager(*args, **kwargs)
+
 class S3Service:
     """Service for handling S3 operations"""
     
@@ -18,25 +81,62 @@ class S3Service:
         self.bucket_name = os.getenv("S3_BUCKET_NAME")
         self.cloudfront_domain = os.getenv("CLOUDFRONT_DOMAIN", None)  # e.g., d2zu6flr7wd65l.cloudfront.net
         
-        if not all([self.aws_access_key, self.aws_secret_key, self.bucket_name]):
+        self.has_credentials = bool(self.aws_access_key and self.aws_secret_key)
+        
+        # Without credentials the service can still serve reads through CloudFront
+        # and public S3 HTTP; only the boto3-backed operations become unavailable
+        if not self.bucket_name or not (self.has_credentials or self.cloudfront_domain):
             raise ValueError("Missing AWS credentials or bucket name in environment variables")
         
-        self.s3_client = boto3.client(
-            's3',
-            aws_access_key_id=self.aws_access_key,
-            aws_secret_access_key=self.aws_secret_key,
-            region_name=self.aws_region
+        # The boto3 client is built on first use, so read-only workers never pay for it
+        self._s3_client = None
+        self._s3_client_lock = threading.Lock()
+        
+        # Pooled keep-alive session for the CloudFront / public S3 HTTP tiers,
+        # retrying transient 5xx responses
+        self._http = requests.Session()
+        adapter = _BufferedHTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[500, 502, 503, 504])
         )
+        self._http.mount('https://', adapter)
+        self._http.mount('http://', adapter)
+        
+        # Runs the CloudFront tier so a slow edge can be hedged with direct S3
+        self._download_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix='s3-download')
+        
+        # (s3_key, expiration) -> (signed_at, url) and prefix -> (listed_at, keys)
+        self._presign_cache = {}
+        self._list_cache = {}
         
         if self.cloudfront_domain:
-            print(f"✅ CloudFront domain configured: {self.cloudfront_domain}")
+            logger.info("✅ CloudFront domain configured: %s", self.cloudfront_domain)
+    
+    @property
+    def s3_client(self):
+        """Boto3 S3 client, created on first access"""
+        if self._s3_client is None:
+            if not self.has_credentials:
+                raise ValueError("AWS credentials are required for this S3 operation")
+            with self._s3_client_lock:
+                if self._s3_client is None:
+                    self._s3_client = boto3.client(
+                        's3',
+                        aws_access_key_id=self.aws_access_key,
+                        aws_secret_access_key=self.aws_secret_key,
+                        region_name=self.aws_region,
+                        config=_BOTO_CONFIG
+                    )
+        return self._s3_client
     
     def upload_file(
         self,
         file_data: bytes,
         filename: str,
         folder: str = "presentations",
-        content_type: str = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+        content_type: str = _PPTX_MIME,
+        content_addressed: bool = False
     ) -> dict:
         """
         Upload file to S3
@@ -46,50 +146,168 @@ class S3Service:
             filename: Original filename
             folder: S3 folder path
             content_type: MIME type
+            content_addressed: Key the object by a hash of its content and skip
+                the upload when that object already exists
             
         Returns:
             dict with s3_key, s3_url, bucket_name
         """
         try:
-            # Generate unique filename with timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            file_hash = hashlib.md5(file_data).hexdigest()[:8]
-            base_name = os.path.splitext(filename)[0]
-            extension = os.path.splitext(filename)[1]
-            
-            unique_filename = f"{base_name}_{timestamp}_{file_hash}{extension}"
-            s3_key = f"{folder}/{unique_filename}"
-            
-            # Upload to S3
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=s3_key,
-                Body=file_data,
-                ContentType=content_type
+            # 128-bit BLAKE2b: faster than MD5 and wide enough to address content
+            content_hash = hashlib.blake2b(file_data, digest_size=16).hexdigest() if content_addressed else None
+            return self._upload_fileobj(
+                BytesIO(file_data), filename, folder, content_type, content_hash, len(file_data)
             )
-            
-            # Generate S3 URL
-            s3_url = f"https://{self.bucket_name}.s3.{self.aws_region}.amazonaws.com/{s3_key}"
-            
+        except Exception as e:
             return {
-                "success": True,
-                "s3_key": s3_key,
-                "s3_url": s3_url,
-                "bucket_name": self.bucket_name,
-                "filename": unique_filename
+                "success": False,
+                "error": str(e)
             }
+    
+    def upload_path(
+        self,
+        file_path: str,
+        filename: Optional[str] = None,
+        folder: str = "presentations",
+        content_type: str = _PPTX_MIME
+    ) -> dict:
+        """
+        Upload a file from disk to S3 without reading it into memory first
+        
+        Args:
+            file_path: Path of the local file
+            filename: Filename to use for the S3 key (defaults to the file's basename)
+            folder: S3 folder path
+            content_type: MIME type
             
+        Returns:
+            dict with s3_key, s3_url, bucket_name
+        """
+        try:
+            with open(file_path, 'rb') as f:
+                return self._upload_fileobj(
+                    f, filename or os.path.basename(file_path), folder, content_type,
+                    content_length=os.fstat(f.fileno()).st_size
+                )
         except Exception as e:
             return {
                 "success": False,
                 "error": str(e)
             }
     
+    def _upload_fileobj(
+        self,
+        fileobj: BinaryIO,
+        filename: str,
+        folder: str,
+        content_type: str,
+        content_hash: Optional[str] = None,
+        content_length: Optional[int] = None
+    ) -> dict:
+        """
+        Upload a file-like object to S3
+        
+        Payloads known to be below the multipart threshold go up in a single
+        put_object streamed from the file object; anything larger or of
+        unknown size uses the managed (multipart) transfer.
+        
+        With content_hash the key is derived from the content, and the upload
+        is skipped when an object with that key already exists.
+        
+        Raises on failure; the public upload methods turn errors into a result dict.
+        """
+        base_name, extension = os.path.splitext(filename)
+        
+        if content_hash:
+            unique_filename = f"{base_name}_{content_hash}{extension}"
+        else:
+            # Generate unique filename with a hex nanosecond timestamp; the random
+            # suffix only separates concurrent processes, so the payload is never hashed
+            timestamp = format(time.time_ns(), 'x')
+            file_hash = secrets.token_hex(4)
+            unique_filename = f"{base_name}_{timestamp}_{file_hash}{extension}"
+        s3_key = f"{folder}/{unique_filename}"
+        
+        # Generate S3 URL
+        s3_url = f"https://{self.bucket_name}.s3.{self.aws_region}.amazonaws.com/{s3_key}"
+        result = {
+            "success": True,
+            "s3_key": s3_key,
+            "s3_url": s3_url,
+            "bucket_name": self.bucket_name,
+            "filename": unique_filename
+        }
+        
+        if content_hash and self._object_exists(s3_key):
+            logger.debug("♻️ Identical content already at %s, skipping upload", s3_key)
+            result["deduplicated"] = True
+            return result
+        
+        if content_length is not None and content_length < _TRANSFER_CONFIG.multipart_threshold:
+            # Small payload: one request, skipping the transfer manager's thread setup
+            self.s3_client.put_object(
+                Bucket=self.bucket_name,
+                Key=s3_key,
+                Body=fileobj,
+                ContentLength=content_length,
+                ContentType=content_type
+            )
+        else:
+            # Upload to S3 - parts go up in parallel once past the multipart threshold
+            self.s3_client.upload_fileobj(
+                fileobj,
+                self.bucket_name,
+                s3_key,
+                ExtraArgs={'ContentType': content_type},
+                Config=_TRANSFER_CONFIG
+            )
+        self._list_cache.clear()
+        
+        return result
+    
+    def _object_exists(self, s3_key: str) -> bool:
+        """
+        Check for an object with a HEAD request
+        
+        Upload-only credentials (no s3:GetObject / s3:ListBucket) get 403 rather
+        than 404; that is treated as "unknown" so the caller goes on with the PUT.
+        """
+        try:
+            self.s3_client.head_object(Bucket=self.bucket_name, Key=s3_key)
+            return True
+        except ClientError as e:
+            code = e.response.get('Error', {}).get('Code')
+            if code in ('404', 'NoSuchKey', 'NotFound'):
+                return False
+            if code in ('403', 'AccessDenied', 'Forbidden'):
+                logger.debug("🔒 HEAD not permitted for %s, uploading without dedupe check", s3_key)
+                return False
+            raise
+    
     def download_file(self, s3_key: str, bucket_name: Optional[str] = None) -> Optional[bytes]:
+        """
+        Download file from S3 as bytes (see download_fileobj for the strategy)
+        
+        Callers that can read from a file-like object should prefer
+        download_fileobj, which skips the final copy out of the buffer.
+        
+        Args:
+            s3_key: S3 object key (should be unquoted/decoded)
+            bucket_name: Optional bucket name override (defaults to configured bucket)
+        
+        Returns:
+            file content as bytes on success, or None on failure
+        """
+        buffer = self.download_fileobj(s3_key, bucket_name)
+        return buffer.getvalue() if buffer is not None else None
+    
+    def download_fileobj(self, s3_key: str, bucket_name: Optional[str] = None) -> Optional[BytesIO]:
         """
         Download file from S3 using a three-tier strategy for maximum reliability:
         1. CloudFront (fastest, no ACL issues)
-        2. Direct S3 HTTP (public access fallback)
+        2. Direct S3 HTTP (public access fallback) - when CloudFront fails, or
+           alongside it once CloudFront misses a short deadline; whichever
+           finishes first wins and the other stops reading
         3. Boto3 API (for private buckets with proper credentials)
 
         Args:
@@ -97,63 +315,89 @@ class S3Service:
             bucket_name: Optional bucket name override (defaults to configured bucket)
 
         Returns:
-            file content as bytes on success, or None on failure
+            BytesIO positioned at 0 on success, or None on failure
         """
-        print(f"📥 Download Strategy: CloudFront → S3 HTTP → Boto3 API")
-        print(f"   S3 Key: {s3_key}")
+        logger.debug("📥 Download Strategy: CloudFront → S3 HTTP → Boto3 API (key=%s)", s3_key)
+        
+        bucket = bucket_name if bucket_name else self.bucket_name
         
-        # Try CloudFront first (if configured)
         if self.cloudfront_domain:
-            result = self._download_via_cloudfront(s3_key)
-            if result:
+            cloudfront_stop = threading.Event()
+            cloudfront_future = self._download_executor.submit(
+                self._download_via_cloudfront, s3_key, cloudfront_stop
+            )
+            try:
+                result = cloudfront_future.result(timeout=_CLOUDFRONT_HEDGE_SECONDS)
+            except FuturesTimeout:
+                # Stalled CDN edge: hedge with direct S3 HTTP on this thread.
+                # The tiers tell each other to stop once one has the object, so
+                # the body is not streamed twice to completion
+                http_stop = threading.Event()
+                
+                def stop_http_if_found(future):
+                    if future.result() is not None:
+                        http_stop.set()
+                
+                cloudfront_future.add_done_callback(stop_http_if_found)
+                result = self._download_file_via_http(s3_key, bucket, http_stop)
+                if result is not None:
+                    cloudfront_stop.set()
+                    return result
+                result = cloudfront_future.result()
+            else:
+                if result is None:
+                    result = self._download_file_via_http(s3_key, bucket)
+            if result is not None:
+                return result
+        else:
+            # Try direct S3 HTTP (public access)
+            result = self._download_file_via_http(s3_key, bucket)
+            if result is not None:
                 return result
-        
-        # Try direct S3 HTTP (public access)
-        bucket = bucket_name if bucket_name else self.bucket_name
-        result = self._download_file_via_http(s3_key, bucket)
-        if result:
-            return result
         
         # Fall back to Boto3 API (requires valid credentials)
+        if not self.has_credentials:
+            logger.warning("❌ Download failed and no AWS credentials for Boto3 fallback (key=%s)", s3_key)
+            return None
         return self._download_file_via_boto3(s3_key, bucket)
     
-    def _download_via_cloudfront(self, s3_key: str) -> Optional[bytes]:
+    def _download_via_cloudfront(self, s3_key: str, stop: Optional[threading.Event] = None) -> Optional[BytesIO]:
         """
         Download file via CloudFront CDN.
         Works even with S3 ACL/ownership issues - recommended approach.
         
         Args:
             s3_key: S3 object key
+            stop: Optional event; once set, the download is abandoned
         
         Returns:
-            file content as bytes on success, or None on failure
+            BytesIO positioned at 0 on success, or None on failure
         """
         try:
-            import requests
-            
             # URL encode the key to handle special characters
-            from urllib.parse import quote
             encoded_key = quote(s3_key, safe='/')
             cloudfront_url = f"https://{self.cloudfront_domain}/{encoded_key}"
             
-            print(f"🌐 Tier 1: Trying CloudFront...")
-            print(f"   URL: {cloudfront_url}")
+            logger.debug("🌐 Tier 1: Trying CloudFront url=%s", cloudfront_url)
             
-            response = requests.get(cloudfront_url, timeout=30)
+            response = self._http.get(cloudfront_url, timeout=(5, 25), stream=True)
             
             if response.status_code == 200:
-                file_size = len(response.content)
-                print(f"✅ CloudFront download successful ({file_size} bytes)")
-                return response.content
+                buffer = self._read_response(response, stop)
+                logger.debug("✅ CloudFront download successful (%d bytes)", buffer.getbuffer().nbytes)
+                return buffer
             else:
-                print(f"⚠️ CloudFront returned {response.status_code}, trying fallback...")
+                response.close()
+                logger.debug("⚠️ CloudFront returned %s, trying fallback...", response.status_code)
                 return None
                 
         except Exception as e:
-            print(f"⚠️ CloudFront failed ({type(e).__name__}), trying fallback...")
+            logger.debug("⚠️ CloudFront failed (%s), trying fallback...", type(e).__name__)
             return None
     
-    def _download_file_via_http(self, s3_key: str, bucket_name: str) -> Optional[bytes]:
+    def _download_file_via_http(
+        self, s3_key: str, bucket_name: str, stop: Optional[threading.Event] = None
+    ) -> Optional[BytesIO]:
         """
         Download file from S3 via HTTP public URL.
         Works when bucket has public read policy.
@@ -161,41 +405,136 @@ class S3Service:
         Args:
             s3_key: S3 object key
             bucket_name: Bucket name
+            stop: Optional event; once set, the download is abandoned
         
         Returns:
-            file content as bytes on success, or None on failure
+            BytesIO positioned at 0 on success, or None on failure
         """
         try:
-            import requests
-            
             # Construct public S3 URL
             # Format: https://bucket.s3.region.amazonaws.com/key
             s3_url = f"https://{bucket_name}.s3.{self.aws_region}.amazonaws.com/{s3_key}"
             
-            print(f"🌐 Tier 2: Trying Direct S3 HTTP...")
-            print(f"   URL: {s3_url}")
+            logger.debug("🌐 Tier 2: Trying Direct S3 HTTP url=%s", s3_url)
             
-            response = requests.get(s3_url, timeout=30)
+            response = self._http.get(s3_url, timeout=(5, 25), stream=True)
             
             if response.status_code == 200:
-                file_size = len(response.content)
-                print(f"✅ S3 HTTP download successful ({file_size} bytes)")
-                return response.content
-            elif response.status_code == 403:
-                print(f"⚠️ S3 HTTP returned 403 (Access Denied), trying fallback...")
+                # Large objects: drop this stream and split into parallel range GETs
+                size = int(response.headers.get('Content-Length') or 0)
+                if size > _RANGED_DOWNLOAD_THRESHOLD and response.headers.get('Accept-Ranges') == 'bytes':
+                    response.close()
+                    logger.debug("   Large object (%d bytes), downloading in parallel ranges...", size)
+                    buffer = self._download_ranges(s3_url, size, stop)
+                else:
+                    buffer = self._read_response(response, stop)
+                logger.debug("✅ S3 HTTP download successful (%d bytes)", buffer.getbuffer().nbytes)
+                return buffer
+            
+            response.close()
+            if response.status_code == 403:
+                logger.debug("⚠️ S3 HTTP returned 403 (Access Denied), trying fallback...")
                 return None
             elif response.status_code == 404:
-                print(f"⚠️ S3 HTTP returned 404 (Not Found), trying fallback...")
+                logger.debug("⚠️ S3 HTTP returned 404 (Not Found), trying fallback...")
                 return None
             else:
-                print(f"⚠️ S3 HTTP returned {response.status_code}, trying fallback...")
+                logger.debug("⚠️ S3 HTTP returned %s, trying fallback...", response.status_code)
                 return None
                 
         except Exception as e:
-            print(f"⚠️ S3 HTTP failed ({type(e).__name__}), trying fallback...")
+            logger.debug("⚠️ S3 HTTP failed (%s), trying fallback...", type(e).__name__)
             return None
     
-    def _download_file_via_boto3(self, s3_key: str, bucket_name: str) -> Optional[bytes]:
+    @staticmethod
+    def _preallocated_buffer(size: int) -> BytesIO:
+        """Return a BytesIO already sized to hold size bytes, positioned at 0"""
+        buffer = BytesIO()
+        buffer.seek(size - 1)
+        buffer.write(b'\0')
+        buffer.seek(0)
+        return buffer
+    
+    @staticmethod
+    def _check_stop(stop: Optional[threading.Event]) -> None:
+        """Raise when another download tier has already delivered the object"""
+        if stop is not None and stop.is_set():
+            raise IOError("Download abandoned, another tier finished first")
+    
+    @staticmethod
+    def _read_response(response: requests.Response, stop: Optional[threading.Event] = None) -> BytesIO:
+        """
+        Read a streamed response body in 1 MB chunks into a single buffer,
+        avoiding requests' list-of-chunks join behind response.content
+        
+        When the body length is known up front the buffer is allocated once
+        and filled through a memoryview, so it never regrows while reading.
+        If stop is set while reading, the response is closed and IOError raised.
+        """
+        size = int(response.headers.get('Content-Length') or 0)
+        with response:
+            if size and 'Content-Encoding' not in response.headers:
+                buffer = S3Service._preallocated_buffer(size)
+                view = buffer.getbuffer()
+                pos = 0
+                try:
+                    for chunk in response.iter_content(chunk_size=1024 * 1024):
+                        S3Service._check_stop(stop)
+                        view[pos:pos + len(chunk)] = chunk
+                        pos += len(chunk)
+                finally:
+                    view.release()
+                if pos != size:
+                    raise IOError(f"Incomplete body: {pos} of {size} bytes")
+            else:
+                buffer = BytesIO()
+                for chunk in response.iter_content(chunk_size=1024 * 1024):
+                    S3Service._check_stop(stop)
+                    buffer.write(chunk)
+        buffer.seek(0)
+        return buffer
+    
+    def _download_ranges(self, url: str, size: int, stop: Optional[threading.Event] = None) -> BytesIO:
+        """
+        Download an object of known size as parallel byte-range GETs
+        
+        Each part is written straight into its offset of a preallocated
+        buffer, so parts are never concatenated.
+        
+        Args:
+            url: HTTP URL of the object
+            size: Object size in bytes
+            stop: Optional event; once set, the parts stop reading
+        
+        Returns:
+            BytesIO positioned at 0
+        """
+        buffer = self._preallocated_buffer(size)
+        view = buffer.getbuffer()
+        get = self._http.get
+        
+        def fetch_part(start: int):
+            end = min(start + _RANGE_PART_SIZE, size) - 1
+            headers = {'Range': f'bytes={start}-{end}'}
+            with get(url, headers=headers, timeout=(5, 25), stream=True) as response:
+                if response.status_code != 206:
+                    raise IOError(f"Range request returned {response.status_code}")
+                pos = start
+                for chunk in response.iter_content(chunk_size=1024 * 1024):
+                    self._check_stop(stop)
+                    view[pos:pos + len(chunk)] = chunk
+                    pos += len(chunk)
+            if pos != end + 1:
+                raise IOError(f"Incomplete range {start}-{end}")
+        
+        try:
+            with ThreadPoolExecutor(max_workers=_RANGE_MAX_WORKERS) as executor:
+                list(executor.map(fetch_part, range(0, size, _RANGE_PART_SIZE)))
+        finally:
+            view.release()
+        return buffer
+    
+    def _download_file_via_boto3(self, s3_key: str, bucket_name: str) -> Optional[BytesIO]:
         """
         Download file using Boto3 API.
         Requires valid AWS credentials with S3 permissions.
@@ -205,32 +544,99 @@ class S3Service:
             bucket_name: Bucket name
         
         Returns:
-            file content as bytes on success, or None on failure
+            BytesIO positioned at 0 on success, or None on failure
         """
         try:
-            print(f"🔑 Tier 3: Trying Boto3 API...")
-            print(f"   Bucket: {bucket_name}, Key: {s3_key}")
+            logger.debug("🔑 Tier 3: Trying Boto3 API bucket=%s key=%s", bucket_name, s3_key)
             
             buffer = BytesIO()
             self.s3_client.download_fileobj(bucket_name, s3_key, buffer)
             buffer.seek(0)
-            data = buffer.getvalue()
-            file_size = len(data)
-            print(f"✅ Boto3 API download successful ({file_size} bytes)")
-            return data
+            logger.debug("✅ Boto3 API download successful (%d bytes)", buffer.getbuffer().nbytes)
+            return buffer
             
         except self.s3_client.exceptions.NoSuchKey:
-            print(f"❌ Boto3 API: File not found")
+            logger.warning("❌ Boto3 API: File not found (key=%s)", s3_key)
             return None
         except Exception as e:
-            error_msg = f"{type(e).__name__}: {str(e)}"
-            print(f"❌ Boto3 API failed: {error_msg}")
+            logger.error("❌ Boto3 API failed: %s: %s", type(e).__name__, e)
+            return None
+    
+    def get_etag(self, s3_key: str, bucket_name: Optional[str] = None) -> Optional[str]:
+        """
+        Read an object's ETag without downloading it, for cache revalidation
+        
+        Uses a boto3 HEAD when credentials are configured, otherwise an HTTP
+        HEAD against CloudFront and then the public S3 URL.
+        
+        Args:
+            s3_key: S3 object key
+            bucket_name: Optional bucket name override (defaults to configured bucket)
+        
+        Returns:
+            The ETag, or None when it could not be read
+        """
+        bucket = bucket_name if bucket_name else self.bucket_name
+        
+        if self.has_credentials:
+            try:
+                return self.s3_client.head_object(Bucket=bucket, Key=s3_key).get('ETag')
+            except ClientError as e:
+                logger.debug("⚠️ Boto3 HEAD failed for %s: %s", s3_key, e.response.get('Error', {}).get('Code'))
+        
+        urls = [f"https://{bucket}.s3.{self.aws_region}.amazonaws.com/{s3_key}"]
+        if self.cloudfront_domain and bucket == self.bucket_name:
+            urls.insert(0, f"https://{self.cloudfront_domain}/{quote(s3_key, safe='/')}")
+        for url in urls:
+            try:
+                response = self._http.head(url, timeout=(5, 10))
+            except requests.RequestException as e:
+                logger.debug("⚠️ HEAD %s failed (%s)", url, type(e).__name__)
+                continue
+            if response.status_code == 200:
+                return response.headers.get('ETag')
+        return None
+    
+    def download_range(self, s3_key: str, start: int, end: Optional[int] = None) -> Optional[bytes]:
+        """
+        Download part of an object with an HTTP Range request
+        
+        A negative start reads the last -start bytes, e.g. start=-65536 fetches
+        the tail of a PPTX where the ZIP central directory lives.
+        
+        Args:
+            s3_key: S3 object key
+            start: First byte offset (inclusive), or negative for a suffix range
+            end: Last byte offset (inclusive); None reads to the end of the object
+            
+        Returns:
+            The requested bytes, or None on failure
+        """
+        if start < 0:
+            byte_range = f"bytes={start}"
+        elif end is None:
+            byte_range = f"bytes={start}-"
+        else:
+            byte_range = f"bytes={start}-{end}"
+        
+        try:
+            response = self.s3_client.get_object(
+                Bucket=self.bucket_name,
+                Key=s3_key,
+                Range=byte_range
+            )
+            return response['Body'].read()
+        except Exception as e:
+            logger.error("Error reading S3 range %s of %s: %s", byte_range, s3_key, e)
             return None
     
     def get_file_url(self, s3_key: str, expiration: int = 3600) -> Optional[str]:
         """
         Generate presigned URL for S3 object
         
+        URLs are cached per (key, expiration) for a few minutes so repeated
+        requests skip the signing work.
+        
         Args:
             s3_key: S3 object key
             expiration: URL expiration time in seconds (default: 1 hour)
@@ -238,6 +644,12 @@ class S3Service:
         Returns:
             Presigned URL or None if failed
         """
+        cache_key = (s3_key, expiration)
+        now = time.monotonic()
+        cached = self._presign_cache.get(cache_key)
+        if cached and now - cached[0] < _PRESIGN_REUSE_SECONDS:
+            return cached[1]
+        
         try:
             url = self.s3_client.generate_presigned_url(
                 'get_object',
@@ -245,11 +657,14 @@ class S3Service:
                     'Bucket': self.bucket_name,
                     'Key': s3_key
                 },
-                ExpiresIn=expiration
+                ExpiresIn=min(expiration + _PRESIGN_REUSE_SECONDS, _PRESIGN_MAX_EXPIRATION)
             )
+            if len(self._presign_cache) >= 1024:
+                self._presign_cache.clear()
+            self._presign_cache[cache_key] = (now, url)
             return url
         except Exception as e:
-            print(f"Error generating presigned URL: {e}")
+            logger.error("Error generating presigned URL: %s", e)
             return None
     
     def upload_excel_to_s3(
@@ -281,16 +696,23 @@ class S3Service:
         image_data: bytes,
         filename: str,
         content_type: str = "image/jpeg",
-        folder: str = "extracted_images"
+        folder: str = "extracted_images",
+        content_addressed: bool = True
     ) -> dict:
         """
         Upload image to S3
         
+        Images are content-addressed by default: the key is the filename's
+        base name plus a hash of the content. Pass a content-independent
+        filename (e.g. "image.png") so the same logo extracted from many
+        slides or re-runs is stored once.
+        
         Args:
             image_data: Image content as bytes
             filename: Image filename
             content_type: Image MIME type
             folder: S3 folder path
+            content_addressed: Key by content hash and skip existing objects
             
         Returns:
             dict with upload details
@@ -299,33 +721,76 @@ class S3Service:
             file_data=image_data,
             filename=filename,
             folder=folder,
-            content_type=content_type
+            content_type=content_type,
+            content_addressed=content_addressed
         )
     
+    def upload_many(self, items: Iterable[dict], max_workers: int = 16) -> list:
+        """
+        Upload several files to S3 concurrently
+        
+        Args:
+            items: upload_file keyword arguments, one dict per file
+            max_workers: Maximum number of uploads in flight
+            
+        Returns:
+            List of upload_file results, in the same order as items
+        """
+        items = list(items)
+        if not items:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            return list(executor.map(lambda item: self.upload_file(**item), items))
+    
     def list_files(self, prefix: str = "") -> list:
         """
         List files in S3 bucket
         
+        Listings are cached per prefix for 30 seconds; uploads and deletes
+        through this service invalidate the cache.
+        
         Args:
             prefix: S3 prefix/folder to filter
             
         Returns:
             List of file keys
         """
+        now = time.monotonic()
+        cached = self._list_cache.get(prefix)
+        if cached and now - cached[0] < _LIST_CACHE_TTL_SECONDS:
+            return list(cached[1])
+        
         try:
-            response = self.s3_client.list_objects_v2(
-                Bucket=self.bucket_name,
-                Prefix=prefix
-            )
-            
-            if 'Contents' in response:
-                return [obj['Key'] for obj in response['Contents']]
-            return []
+            keys = list(self.iter_files(prefix))
+            self._list_cache[prefix] = (now, keys)
+            return list(keys)
             
         except Exception as e:
-            print(f"Error listing S3 files: {e}")
+            logger.error("Error listing S3 files: %s", e)
             return []
     
+    def iter_files(self, prefix: str = "") -> Iterator[str]:
+        """
+        Lazily yield every key under a prefix, one 1000-key page at a time
+        
+        Unlike list_files this is uncached and lets errors propagate.
+        
+        Args:
+            prefix: S3 prefix/folder to filter
+            
+        Yields:
+            File keys
+        """
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        pages = paginator.paginate(
+            Bucket=self.bucket_name,
+            Prefix=prefix,
+            PaginationConfig={'PageSize': 1000}
+        )
+        for page in pages:
+            for obj in page.get('Contents', []):
+                yield obj['Key']
+    
     def delete_file(self, s3_key: str) -> bool:
         """
         Delete file from S3
@@ -341,10 +806,48 @@ class S3Service:
                 Bucket=self.bucket_name,
                 Key=s3_key
             )
+            self._list_cache.clear()
             return True
         except Exception as e:
-            print(f"Error deleting S3 file: {e}")
+            logger.error("Error deleting S3 file: %s", e)
             return False
+    
+    def bulk_delete(self, s3_keys: Iterable[str]) -> dict:
+        """
+        Delete many files from S3, 1000 keys per request
+        
+        Args:
+            s3_keys: S3 object keys
+            
+        Returns:
+            dict with deleted count and the keys that failed
+        """
+        deleted = 0
+        failed = []
+        keys = iter(s3_keys)
+        while True:
+            batch = list(itertools.islice(keys, 1000))
+            if not batch:
+                break
+            try:
+                response = self.s3_client.delete_objects(
+                    Bucket=self.bucket_name,
+                    Delete={'Objects': [{'Key': key} for key in batch], 'Quiet': True}
+                )
+                # Quiet mode only reports the failures
+                errors = [err['Key'] for err in response.get('Errors', [])]
+            except Exception as e:
+                logger.error("Error deleting S3 files: %s", e)
+                errors = batch
+            failed.extend(errors)
+            deleted += len(batch) - len(errors)
+        
+        self._list_cache.clear()
+        return {
+            "success": not failed,
+            "deleted": deleted,
+            "failed": failed
+        }
 
 # Create singleton instance
 s3_service = S3Service()
\ No newline at end of file
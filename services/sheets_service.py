@@ -1,13 +1,207 @@
 import os
 import json
-from google.oauth2.service_account import Credentials
-from googleapiclient.discovery import build
+import logging
+import math
+import random
+import threading
+import time
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
 from googleapiclient.errors import HttpError
-from typing import List, Dict, Any
+from typing import TYPE_CHECKING, List, Dict, Any, Iterable, Iterator, Tuple
 from dotenv import load_dotenv
 
+if TYPE_CHECKING:
+    from google.oauth2.service_account import Credentials
+
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Shape dict keys in sheet column order (after Template ID) - matches Excel exactly
+SHAPE_COLUMN_KEYS = (
+    'slide_number',      # Slide No
+    'shape_name',        # Shape Name
+    'shape_type',        # Shape Type
+    'content',           # Content
+    'left_emu',          # Left (EMU)
+    'top_emu',           # Top (EMU)
+    'width_emu',         # Width (EMU)
+    'height_emu',        # Height (EMU)
+    'left_inches',       # Left (Inches)
+    'top_inches',        # Top (Inches)
+    'width_inches',      # Width (Inches)
+    'height_inches',     # Height (Inches)
+    'font_name',         # Font Name
+    'font_size',         # Font Size
+    'font_bold',         # Font Bold
+    'font_italic',       # Font Italic
+    'font_underline',    # Font Underline
+    'font_color',        # Font Color
+    'text_alignment',    # Text Alignment
+    'line_spacing',      # Line Spacing
+    'paragraph_spacing', # Paragraph Spacing
+    'fill_color',        # Fill Color
+    'fill_type',         # Fill Type
+    'transparency',      # Transparency
+    'line_color',        # Line Color
+    'line_width',        # Line Width
+    'line_style',        # Line Style
+    'rotation',          # Rotation
+    'has_image',         # Has Image
+    'image_format',      # Image Format
+    'image_width',       # Image Width
+    'image_height',      # Image Height
+    'image_file_size',   # Image File Size
+    'image_url',         # Image URL
+    'image_s3_url',      # Image S3 URL
+    'image_base64',      # Image Base64
+    'chart_type',        # Chart Type
+    'chart_title',       # Chart Title
+    'chart_data',        # Chart Data
+    'chart_categories',  # Chart Categories
+    'chart_series',      # Chart Series
+    'hyperlink',         # Hyperlink
+    'z_order',           # Z-Order
+    'hidden',            # Hidden
+    'shadow',            # Shadow
+    'glow_effect',       # Glow Effect
+    'reflection',        # Reflection
+    '3d_effects',        # 3D Effects
+    'placeholder_type',  # Placeholder Type
+    'animation_effects', # Animation Effects
+)
+
+# Sheet header row - Template ID + all Excel columns
+HEADERS = [[
+    # ONLY ADDITION - Template ID
+    "Template ID",
+    
+    # EXACT SAME AS EXCEL (45 columns)
+    "Slide No",
+    "Shape Name",
+    "Shape Type",
+    "Content",
+    "Left (EMU)",
+    "Top (EMU)",
+    "Width (EMU)",
+    "Height (EMU)",
+    "Left (Inches)",
+    "Top (Inches)",
+    "Width (Inches)",
+    "Height (Inches)",
+    "Font Name",
+    "Font Size",
+    "Font Bold",
+    "Font Italic",
+    "Font Underline",
+    "Font Color",
+    "Text Alignment",
+    "Line Spacing",
+    "Paragraph Spacing",
+    "Fill Color",
+    "Fill Type",
+    "Transparency",
+    "Line Color",
+    "Line Width",
+    "Line Style",
+    "Rotation",
+    "Has Image",
+    "Image Format",
+    "Image Width",
+    "Image Height",
+    "Image File Size",
+    "Image URL",
+    "Image S3 URL",
+    "Image Base64",
+    "Chart Type",
+    "Chart Title",
+    "Chart Data",
+    "Chart Categories",
+    "Chart Series",
+    "Hyperlink",
+    "Z-Order",
+    "Hidden",
+    "Shadow",
+    "Glow Effect",
+    "Reflection",
+    "3D Effects",
+    "Placeholder Type",
+    "Animation Effects"
+]]
+
+# Missing keys default to '' - merging over this dict lets one itemgetter call
+# pull the whole row in C instead of one shape.get() per column
+_EMPTY_SHAPE_ROW = dict.fromkeys(SHAPE_COLUMN_KEYS, '')
+_get_shape_row = itemgetter(*SHAPE_COLUMN_KEYS)
+
+# Base64 image data is blanked in sheet rows by default: it is usually most of
+# the payload, overflows the 50,000-char cell limit, and the S3 URL column
+# already points at the image
+_STRIPPED_COLUMNS = {'image_base64': ''}
+
+# Columns sent as real numbers (rows go up with valueInputOption=RAW, so
+# Sheets stores values as-is instead of re-parsing every cell as typed input)
+NUMERIC_COLUMNS = frozenset({
+    'slide_number', 'left_emu', 'top_emu', 'width_emu', 'height_emu',
+    'left_inches', 'top_inches', 'width_inches', 'height_inches',
+    'font_size', 'rotation', 'image_width', 'image_height', 'image_file_size', 'z_order'
+})
+# Row positions of the numeric columns (offset by the leading Template ID)
+_NUMERIC_INDICES = tuple(i + 1 for i, key in enumerate(SHAPE_COLUMN_KEYS) if key in NUMERIC_COLUMNS)
+
+def _to_number(value):
+    """Convert a numeric-looking string to int/float; '' becomes an empty cell (None)"""
+    if value == '':
+        return None
+    try:
+        number = float(value)
+    except ValueError:
+        return value
+    if not math.isfinite(number):
+        return value
+    return int(number) if number.is_integer() else number
+
+# Keep each append request well under the Sheets API's 10 MB request cap
+_APPEND_CHUNK_ROWS = 5000
+_APPEND_CHUNK_CHARS = 4_000_000
+
+def _chunk_rows(values):
+    """Group rows into append-sized chunks by row count and approximate payload size"""
+    chunk = []
+    chars = 0
+    for row in values:
+        chunk.append(row)
+        chars += sum(len(str(cell)) for cell in row)
+        if len(chunk) >= _APPEND_CHUNK_ROWS or chars >= _APPEND_CHUNK_CHARS:
+            yield chunk
+            chunk = []
+            chars = 0
+    if chunk:
+        yield chunk
+
+# Sheets API statuses worth retrying (rate limit + transient server errors)
+_RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+@lru_cache(maxsize=4)
+def _load_credentials(credentials_json: str, scopes: Tuple[str, ...]) -> "Credentials":
+    """Parse service-account credentials once per distinct JSON blob"""
+    from google.oauth2.service_account import Credentials
+    
+    try:
+        credentials_dict = json.loads(credentials_json)
+    except json.JSONDecodeError:
+        raise ValueError("Invalid GOOGLE_SHEETS_CREDENTIALS JSON format")
+    return Credentials.from_service_account_info(credentials_dict, scopes=list(scopes))
+
+@lru_cache(maxsize=4)
+def _load_credentials_file(credentials_path: str, scopes: Tuple[str, ...]) -> "Credentials":
+    """Load service-account credentials from a key file once per path"""
+    from google.oauth2.service_account import Credentials
+    
+    return Credentials.from_service_account_file(credentials_path, scopes=list(scopes))
+
 class GoogleSheetsService:
     """Service for handling Google Sheets operations"""
     
@@ -15,61 +209,120 @@ class GoogleSheetsService:
         self.scopes = ['https://www.googleapis.com/auth/spreadsheets']
         self.spreadsheet_id = os.getenv('GOOGLE_SHEET_ID')
         self.credentials_json = os.getenv('GOOGLE_SHEETS_CREDENTIALS')
+        self.credentials_path = os.getenv('GOOGLE_SHEETS_CREDENTIALS_PATH')
         
         if not self.spreadsheet_id:
             raise ValueError("GOOGLE_SHEET_ID not found in environment variables")
         
-        if not self.credentials_json:
-            raise ValueError("GOOGLE_SHEETS_CREDENTIALS not found in environment variables")
+        if not (self.credentials_path or self.credentials_json):
+            raise ValueError("GOOGLE_SHEETS_CREDENTIALS or GOOGLE_SHEETS_CREDENTIALS_PATH not found in environment variables")
         
-        # Parse credentials from JSON string
-        try:
-            credentials_dict = json.loads(self.credentials_json)
-            self.credentials = Credentials.from_service_account_info(
-                credentials_dict,
-                scopes=self.scopes
-            )
-        except json.JSONDecodeError:
-            raise ValueError("Invalid GOOGLE_SHEETS_CREDENTIALS JSON format")
+        # Load credentials from a key file if given, else parse the JSON string
+        # (both memoized, so the parsed credentials and their cached access
+        # token survive re-instantiation)
+        if self.credentials_path:
+            self.credentials = _load_credentials_file(self.credentials_path, tuple(self.scopes))
+            # Let other Google client libraries in the process find the same key file
+            os.environ.setdefault('GOOGLE_APPLICATION_CREDENTIALS', self.credentials_path)
+        else:
+            self.credentials = _load_credentials(self.credentials_json, tuple(self.scopes))
         
-        self.service = build('sheets', 'v4', credentials=self.credentials)
+        # Imported here so workers that never touch Sheets don't load the API client
+        from googleapiclient.discovery import build
+        # static_discovery uses the discovery document bundled with the client
+        # library, so building the service makes no network round trip
+        self.service = build(
+            'sheets', 'v4',
+            credentials=self.credentials,
+            cache_discovery=False,
+            static_discovery=True
+        )
         self.sheet = self.service.spreadsheets()
     
-    def append_rows(self, values: List[List[Any]], range_name: str = "Sheet1") -> Dict:
+    @staticmethod
+    def _execute_with_backoff(request, max_retries: int = 5, base: float = 1.0, cap: float = 30.0):
+        """
+        Execute a Sheets API request, retrying rate limits and 5xx errors
+        
+        Waits min(cap, base * 2**attempt) plus up to 1s of jitter between
+        attempts, or the server's Retry-After when it sends one.
+        
+        Args:
+            request: Un-executed googleapiclient request
+            max_retries: Retries before the last HttpError is raised
+            base: Initial delay in seconds
+            cap: Maximum delay in seconds
+            
+        Returns:
+            The request's response
+        """
+        for attempt in range(max_retries + 1):
+            try:
+                return request.execute()
+            except HttpError as error:
+                if attempt == max_retries or error.resp.status not in _RETRYABLE_STATUSES:
+                    raise
+                retry_after = error.resp.get('retry-after')
+                if retry_after and retry_after.isdigit():
+                    delay = min(cap, float(retry_after))
+                else:
+                    delay = min(cap, base * 2 ** attempt) + random.random()
+                time.sleep(delay)
+    
+    def append_rows(
+        self,
+        values: Iterable[List[Any]],
+        range_name: str = "Sheet1",
+        value_input_option: str = "USER_ENTERED"
+    ) -> Dict:
         """
         Append rows to Google Sheet
         
+        Large payloads are sent as sequential appends of at most 5000 rows
+        (or ~4 MB of cell text) each, with the counts summed.
+        
         Args:
-            values: List of rows to append
+            values: Rows to append; any iterable, consumed one chunk at a time
             range_name: Sheet name or range (default: "Sheet1")
+            value_input_option: RAW stores values as sent; USER_ENTERED parses them like typed input
             
         Returns:
             dict with operation details
         """
+        updated_range = None
+        updated_rows = 0
+        updated_cells = 0
         try:
-            body = {
-                'values': values
-            }
-            
-            result = self.sheet.values().append(
-                spreadsheetId=self.spreadsheet_id,
-                range=range_name,
-                valueInputOption='USER_ENTERED',
-                insertDataOption='INSERT_ROWS',
-                body=body
-            ).execute()
+            for chunk in _chunk_rows(values):
+                body = {
+                    'values': chunk
+                }
+                
+                result = self._execute_with_backoff(self.sheet.values().append(
+                    spreadsheetId=self.spreadsheet_id,
+                    range=range_name,
+                    valueInputOption=value_input_option,
+                    insertDataOption='INSERT_ROWS',
+                    body=body
+                ))
+                
+                updates = result.get('updates', {})
+                updated_range = updates.get('updatedRange')
+                updated_rows += updates.get('updatedRows') or 0
+                updated_cells += updates.get('updatedCells') or 0
             
             return {
                 'success': True,
-                'updated_range': result.get('updates', {}).get('updatedRange'),
-                'updated_rows': result.get('updates', {}).get('updatedRows'),
-                'updated_cells': result.get('updates', {}).get('updatedCells')
+                'updated_range': updated_range,
+                'updated_rows': updated_rows,
+                'updated_cells': updated_cells
             }
             
         except HttpError as error:
             return {
                 'success': False,
-                'error': str(error)
+                'error': str(error),
+                'updated_rows': updated_rows
             }
     
     def append_ppt_data(
@@ -77,7 +330,7 @@ class GoogleSheetsService:
         template_id: str,
         s3_url: str,
         slide_data: List[Dict],
-        
+        include_image_base64: bool = False
     ) -> Dict:
         """
         Append PowerPoint extraction data to Google Sheets
@@ -89,79 +342,21 @@ class GoogleSheetsService:
             s3_url: S3 URL of the uploaded PowerPoint (not used, kept for compatibility)
             slide_data: List of slide data dictionaries
             excel_url: URL of generated Excel file (not used, kept for compatibility)
+            include_image_base64: Write the Image Base64 column instead of leaving it blank
             
         Returns:
             dict with operation details
         """
-        rows = []
+        rows = self._iter_rows(template_id, slide_data, include_image_base64)
         
-        for slide in slide_data:
-            shapes = slide.get('shapes', [])
-            
-            # Each shape becomes a row - exact same as Excel but with Template ID first
-            for shape in shapes:
-                # Build row exactly as Excel does, just prepend Template ID
-                row = [
-                    template_id,  # ONLY ADDITION - Template ID at the start
-                    # Everything below matches Excel exactly (45 columns)
-                    shape.get('slide_number', ''),           # Slide No
-                    shape.get('shape_name', ''),             # Shape Name
-                    shape.get('shape_type', ''),             # Shape Type
-                    shape.get('content', ''),                # Content
-                    shape.get('left_emu', ''),               # Left (EMU)
-                    shape.get('top_emu', ''),                # Top (EMU)
-                    shape.get('width_emu', ''),              # Width (EMU)
-                    shape.get('height_emu', ''),             # Height (EMU)
-                    shape.get('left_inches', ''),            # Left (Inches)
-                    shape.get('top_inches', ''),             # Top (Inches)
-                    shape.get('width_inches', ''),           # Width (Inches)
-                    shape.get('height_inches', ''),          # Height (Inches)
-                    shape.get('font_name', ''),              # Font Name
-                    shape.get('font_size', ''),              # Font Size
-                    shape.get('font_bold', ''),              # Font Bold
-                    shape.get('font_italic', ''),            # Font Italic
-                    shape.get('font_underline', ''),         # Font Underline
-                    shape.get('font_color', ''),             # Font Color
-                    shape.get('text_alignment', ''),         # Text Alignment
-                    shape.get('line_spacing', ''),           # Line Spacing
-                    shape.get('paragraph_spacing', ''),      # Paragraph Spacing
-                    shape.get('fill_color', ''),             # Fill Color
-                    shape.get('fill_type', ''),              # Fill Type
-                    shape.get('transparency', ''),           # Transparency
-                    shape.get('line_color', ''),             # Line Color
-                    shape.get('line_width', ''),             # Line Width
-                    shape.get('line_style', ''),             # Line Style
-                    shape.get('rotation', ''),               # Rotation
-                    shape.get('has_image', ''),              # Has Image
-                    shape.get('image_format', ''),           # Image Format
-                    shape.get('image_width', ''),            # Image Width
-                    shape.get('image_height', ''),           # Image Height
-                    shape.get('image_file_size', ''),        # Image File Size
-                    shape.get('image_url', ''),              # Image URL
-                    shape.get('image_s3_url', ''),           # Image S3 URL
-                    shape.get('image_base64', ''),           # Image Base64
-                    shape.get('chart_type', ''),             # Chart Type
-                    shape.get('chart_title', ''),            # Chart Title
-                    shape.get('chart_data', ''),             # Chart Data
-                    shape.get('chart_categories', ''),       # Chart Categories
-                    shape.get('chart_series', ''),           # Chart Series
-                    shape.get('hyperlink', ''),              # Hyperlink
-                    shape.get('z_order', ''),                # Z-Order
-                    shape.get('hidden', ''),                 # Hidden
-                    shape.get('shadow', ''),                 # Shadow
-                    shape.get('glow_effect', ''),            # Glow Effect
-                    shape.get('reflection', ''),             # Reflection
-                    shape.get('3d_effects', ''),             # 3D Effects
-                    shape.get('placeholder_type', ''),       # Placeholder Type
-                    shape.get('animation_effects', '')       # Animation Effects
-                ]
-                rows.append(row)
-        
-        if rows:
-            result = self.append_rows(rows)
+        first_row = next(rows, None)
+        if first_row is not None:
+            # Numeric columns are already typed; RAW keeps deck text (e.g. "=...")
+            # from being parsed as formulas or dates
+            result = self.append_rows(chain((first_row,), rows), value_input_option="RAW")
             if result.get('success'):
                 result['template_id'] = template_id
-                result['rows_added'] = len(rows)
+                result['rows_added'] = result['updated_rows']
             return result
         else:
             return {
@@ -169,6 +364,47 @@ class GoogleSheetsService:
                 'error': 'No data to append'
             }
     
+    def append_ppt_data_batch(self, items: List[Tuple[str, List[Dict]]], include_image_base64: bool = False) -> Dict:
+        """
+        Append several presentations' extraction data in as few API calls as possible
+        
+        Args:
+            items: (template_id, slide_data) pairs
+            include_image_base64: Write the Image Base64 column instead of leaving it blank
+            
+        Returns:
+            dict with operation details
+        """
+        rows = chain.from_iterable(
+            self._iter_rows(template_id, slide_data, include_image_base64)
+            for template_id, slide_data in items
+        )
+        
+        first_row = next(rows, None)
+        if first_row is None:
+            return {
+                'success': False,
+                'error': 'No data to append'
+            }
+        
+        result = self.append_rows(chain((first_row,), rows), value_input_option="RAW")
+        if result.get('success'):
+            result['template_ids'] = [template_id for template_id, _ in items]
+            result['rows_added'] = result['updated_rows']
+        return result
+    
+    @staticmethod
+    def _iter_rows(template_id: str, slide_data: List[Dict], include_image_base64: bool = False) -> Iterator[List[Any]]:
+        """Yield one sheet row per shape - exact same as Excel but with Template ID first"""
+        shapes = chain.from_iterable(slide.get('shapes', []) for slide in slide_data)
+        overrides = {} if include_image_base64 else _STRIPPED_COLUMNS
+        for shape in shapes:
+            row = [template_id, *_get_shape_row({**_EMPTY_SHAPE_ROW, **shape, **overrides})]
+            for i in _NUMERIC_INDICES:
+                if isinstance(row[i], str):
+                    row[i] = _to_number(row[i])
+            yield row
+    
     def get_sheet_data(self, range_name: str = "Sheet1") -> Dict:
         """
         Get data from Google Sheet
@@ -180,10 +416,10 @@ class GoogleSheetsService:
             dict with sheet data
         """
         try:
-            result = self.sheet.values().get(
+            result = self._execute_with_backoff(self.sheet.values().get(
                 spreadsheetId=self.spreadsheet_id,
                 range=range_name
-            ).execute()
+            ))
             
             values = result.get('values', [])
             
@@ -210,10 +446,10 @@ class GoogleSheetsService:
             dict with operation details
         """
         try:
-            result = self.sheet.values().clear(
+            result = self._execute_with_backoff(self.sheet.values().clear(
                 spreadsheetId=self.spreadsheet_id,
                 range=range_name
-            ).execute()
+            ))
             
             return {
                 'success': True,
@@ -226,84 +462,43 @@ class GoogleSheetsService:
                 'error': str(error)
             }
     
-    def initialize_headers(self, range_name: str = "Sheet1!A1:AT1") -> Dict:
+    def initialize_headers(self, range_name: str = "Sheet1!A1:AY1", force: bool = False) -> Dict:
         """
-        Initialize sheet with headers - Template ID + all Excel columns (46 total)
+        Initialize sheet with headers - Template ID + all Excel columns (51 total)
+        
+        Skipped when the sheet's first cell is already filled, unless forced.
         
         Args:
             range_name: Range for headers
+            force: Write the headers even if the sheet already has them
             
         Returns:
             dict with operation details
         """
-        headers = [[
-            # ONLY ADDITION - Template ID
-            "Template ID",
-            
-            # EXACT SAME AS EXCEL (45 columns)
-            "Slide No",
-            "Shape Name",
-            "Shape Type",
-            "Content",
-            "Left (EMU)",
-            "Top (EMU)",
-            "Width (EMU)",
-            "Height (EMU)",
-            "Left (Inches)",
-            "Top (Inches)",
-            "Width (Inches)",
-            "Height (Inches)",
-            "Font Name",
-            "Font Size",
-            "Font Bold",
-            "Font Italic",
-            "Font Underline",
-            "Font Color",
-            "Text Alignment",
-            "Line Spacing",
-            "Paragraph Spacing",
-            "Fill Color",
-            "Fill Type",
-            "Transparency",
-            "Line Color",
-            "Line Width",
-            "Line Style",
-            "Rotation",
-            "Has Image",
-            "Image Format",
-            "Image Width",
-            "Image Height",
-            "Image File Size",
-            "Image URL",
-            "Image S3 URL",
-            "Image Base64",
-            "Chart Type",
-            "Chart Title",
-            "Chart Data",
-            "Chart Categories",
-            "Chart Series",
-            "Hyperlink",
-            "Z-Order",
-            "Hidden",
-            "Shadow",
-            "Glow Effect",
-            "Reflection",
-            "3D Effects",
-            "Placeholder Type",
-            "Animation Effects"
-        ]]
-        
         try:
+            if not force:
+                first_cell = range_name.split('!')[0] + '!A1' if '!' in range_name else 'A1'
+                existing = self._execute_with_backoff(self.sheet.values().get(
+                    spreadsheetId=self.spreadsheet_id,
+                    range=first_cell
+                ))
+                if existing.get('values'):
+                    return {
+                        'success': True,
+                        'skipped': True,
+                        'updated_cells': 0
+                    }
+            
             body = {
-                'values': headers
+                'values': HEADERS
             }
             
-            result = self.sheet.values().update(
+            result = self._execute_with_backoff(self.sheet.values().update(
                 spreadsheetId=self.spreadsheet_id,
                 range=range_name,
                 valueInputOption='USER_ENTERED',
                 body=body
-            ).execute()
+            ))
             
             return {
                 'success': True,
@@ -318,14 +513,17 @@ class GoogleSheetsService:
 
 # Create singleton instance (will be initialized when needed)
 sheets_service = None
+_sheets_service_lock = threading.Lock()
 
 def get_sheets_service():
     """Get or create Google Sheets service instance"""
     global sheets_service
     if sheets_service is None:
-        try:
-            sheets_service = GoogleSheetsService()
-        except Exception as e:
-            print(f"Warning: Could not initialize Google Sheets service: {e}")
-            return None
+        with _sheets_service_lock:
+            if sheets_service is None:
+                try:
+                    sheets_service = GoogleSheetsService()
+                except Exception as e:
+                    logger.warning("Could not initialize Google Sheets service: %s", e)
+                    return None
     return sheets_service
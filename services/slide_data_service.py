@@ -1,46 +1,175 @@
-import os
-import io
+import copy
+import hashlib
+import logging
+import shutil
+import threading
 import requests
 from io import BytesIO
 from pptx import Presentation
-from pptx.util import Inches, Pt
-from pptx.dml.color import RGBColor
-from pptx.enum.text import PP_ALIGN
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, NamedTuple, Optional, Tuple
+from urllib.parse import unquote, urlparse
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from PIL import Image
 from services.s3_service import s3_service
-from datetime import datetime
+from services.http_session import http_session
+from services.colors import hex_to_rgb, parse_hex_color
 
 # Import slide handlers
-from services.handlers.points import handle_points_slide
-from services.handlers.image_text import handle_image_text_slide
-from services.handlers.table import handle_table_slide
-from services.handlers.phases import handle_phases_slide
-from services.handlers.statistics import handle_statistics_slide
-from services.handlers.people import handle_people_slide
-from services.handlers.cover import handle_cover_slide
-from services.handlers.contact import handle_contact_slide
-from services.handlers.images import handle_images_slide
-from services.handlers.graphs import handle_graph_slide
+from services.handlers.points import (
+    handle_points_slide,
+    _update_header as _points_update_header,
+    _update_description as _points_update_description,
+    _update_image as _points_update_image,
+    _update_points as _points_update_points,
+)
+from services.handlers.image_text import (
+    handle_image_text_slide,
+    _update_title as _image_text_update_title,
+    _update_text as _image_text_update_text,
+    _update_image as _image_text_update_image,
+)
+from services.handlers.table import (
+    handle_table_slide,
+    _update_title as _table_update_title,
+    _update_table as _table_update_table,
+)
+from services.handlers.phases import (
+    handle_phases_slide,
+    _update_title as _phases_update_title,
+    _update_phases as _phases_update_phases,
+    _update_image as _phases_update_image,
+)
+from services.handlers.statistics import (
+    handle_statistics_slide,
+    _update_title as _statistics_update_title,
+    _update_description as _statistics_update_description,
+    _update_statistics as _statistics_update_statistics,
+    _update_background_color as _statistics_update_background_color,
+    _update_image as _statistics_update_image,
+)
+from services.handlers.people import (
+    handle_people_slide,
+    _update_title as _people_update_title,
+    _update_description as _people_update_description,
+    _update_people as _people_update_people,
+    _update_background_color as _people_update_background_color,
+    _update_image as _people_update_image,
+)
+from services.handlers.cover import (
+    handle_cover_slide,
+    _update_title as _cover_update_title,
+    _update_subtitle as _cover_update_subtitle,
+    _update_company_name as _cover_update_company_name,
+    _update_images_from_urls as _cover_update_images_from_urls,
+    _apply_color_scheme as _cover_apply_color_scheme,
+)
+from services.handlers.contact import (
+    handle_contact_slide,
+    _update_title as _contact_update_title,
+    _update_website as _contact_update_website,
+    _update_linkedin as _contact_update_linkedin,
+    _update_email as _contact_update_email,
+    _update_phone as _contact_update_phone,
+    _update_images_from_urls as _contact_update_images_from_urls,
+    _apply_color_scheme as _contact_apply_color_scheme,
+)
+from services.handlers.images import (
+    handle_images_slide,
+    _update_title as _images_update_title,
+    _update_image_gallery as _images_update_image_gallery,
+)
+from services.handlers.graphs import (
+    handle_graph_slide,
+    _update_title as _graphs_update_title,
+    _update_charts as _graphs_update_charts,
+)
+
+logger = logging.getLogger(__name__)
+
+# Refuse slide images that would decode to more than 50 MP (decompression bombs);
+# checked in _probe_image so Pillow's process-wide limit stays at its default
+_MAX_IMAGE_PIXELS = 50_000_000
+
+# Content-Types accepted for slide images; generic binary types are let through
+# to the Pillow header probe, since S3 often serves untyped uploads that way
+_IMAGE_CONTENT_TYPES = frozenset({
+    'image/png', 'image/jpeg', 'image/jpg', 'image/gif', 'image/webp', 'image/bmp', 'image/tiff',
+    'application/octet-stream', 'binary/octet-stream', '',
+})
+
+# Above this size deep-copying a parsed template costs more than re-parsing it
+_PRESENTATION_CACHE_MAX_BYTES = 10 * 1024 * 1024
+
+
+def _normalize_colors(colors: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Parse a cover/contact color scheme once, up front
+    
+    Handlers apply these colors run by run; with RGBColor values they skip
+    re-parsing the hex string for every shape. Empty values are kept as-is so
+    handlers still treat them as unset.
+    """
+    return {key: parse_hex_color(str(value)) if value else value for key, value in colors.items()}
+
+
+class SlideConfig(NamedTuple):
+    """One normalized entry of a multi-slide request"""
+    slide_type: Optional[str]
+    slide_data: Dict[str, Any]
+    image_url: Optional[str] = None
+    
+    @classmethod
+    def from_dict(cls, config: Dict[str, Any]) -> "SlideConfig":
+        """Build from a {'slide_type': ..., 'slide_data': {...}} request entry"""
+        slide_data = config.get('slide_data') or {}
+        if isinstance(slide_data.get('colors'), dict):
+            # Copy rather than mutate the caller's dict
+            slide_data = dict(slide_data, colors=_normalize_colors(slide_data['colors']))
+        return cls(config.get('slide_type'), slide_data, slide_data.get('image_url'))
 
 
 class SlideDataService:
     """Service for managing and generating different slide types"""
     
+    # Slide type -> handler taking (presentation_bytes, slide_data, image_data)
+    _HANDLER_MAP = {
+        'points': handle_points_slide,
+        'image_text': handle_image_text_slide,
+        'table': handle_table_slide,
+        'phases': handle_phases_slide,
+        'statistics': handle_statistics_slide,
+        'people': handle_people_slide,
+        'cover': handle_cover_slide,
+        'contact': handle_contact_slide,
+        'images': handle_images_slide,
+        'graphs': handle_graph_slide,
+    }
+    
+    def __init__(self):
+        # Pooled keep-alive session for image and template downloads, shared
+        # with the slide handlers
+        self._http = http_session
+        
+        # Template URL or S3 key -> (ETag, bytes), most recently used last;
+        # entries are always revalidated against the current ETag before reuse
+        self._template_cache: "OrderedDict[str, Tuple[Optional[str], bytes]]" = OrderedDict()
+        self._template_cache_size = 16
+        self._template_cache_lock = threading.Lock()
+        
+        # Template content digest -> pristine parsed Presentation (never modified)
+        self._presentation_cache: "OrderedDict[bytes, Presentation]" = OrderedDict()
+        self._presentation_cache_size = 4
+        self._presentation_cache_lock = threading.Lock()
+        
+        # Template URL -> [Future, waiter count] for downloads in progress
+        self._inflight: Dict[str, list] = {}
+        self._inflight_lock = threading.Lock()
+    
     @staticmethod
     def hex_to_rgb(hex_str):
         """Convert #RRGGBB string to RGBColor safely."""
-        if not hex_str:
-            return RGBColor(0, 0, 0)
-        
-        hex_str = str(hex_str).strip().replace("#", "")
-        if len(hex_str) != 6 or any(c not in "0123456789ABCDEFabcdef" for c in hex_str):
-            print(f"⚠️ Invalid hex color '{hex_str}', defaulting to black")
-            return RGBColor(0, 0, 0)
-        
-        return RGBColor(int(hex_str[0:2], 16),
-                        int(hex_str[2:4], 16),
-                        int(hex_str[4:6], 16))
+        return hex_to_rgb(hex_str)
     
     def download_image_from_url(self, image_url: str) -> BytesIO:
         """
@@ -53,41 +182,93 @@ class SlideDataService:
             BytesIO object containing the image data
         """
         try:
-            print(f"🖼️ Downloading image from: {image_url}")
-            response = requests.get(image_url, timeout=10)
-            response.raise_for_status()
-            print(f"✅ Image downloaded successfully ({len(response.content)} bytes)")
-            return BytesIO(response.content)
+            logger.debug("🖼️ Downloading image from: %s", image_url)
+            with self._http.get(image_url, timeout=10, stream=True) as response:
+                response.raise_for_status()
+                # Bail out before reading the body when the server sent e.g. an HTML error page
+                content_type = response.headers.get('Content-Type', '').split(';', 1)[0].strip().lower()
+                if content_type not in _IMAGE_CONTENT_TYPES:
+                    raise RuntimeError(f"Unexpected Content-Type '{content_type}'")
+                logger.debug("📦 Image Content-Length: %s", response.headers.get('Content-Length', 'unknown'))
+                buffer = self._read_stream(response)
+            fmt, width, height = self._probe_image(buffer)
+            logger.debug("✅ Image downloaded successfully (%s %dx%d)", fmt, width, height)
+            return buffer
         except Exception as e:
             error_msg = f"Failed to download image from {image_url}: {str(e)}"
-            print(f"❌ {error_msg}")
+            logger.error("❌ %s", error_msg)
             raise RuntimeError(error_msg)
     
     def download_template_from_s3(self, s3_url: str) -> BytesIO:
         """
         Download PowerPoint template from S3
         
+        Concurrent calls for the same template share one download: the first
+        caller fetches it and the others wait for and copy its result.
+        
         Args:
             s3_url: S3 URL of the template or just the S3 key
             
         Returns:
             BytesIO object containing the template data
         """
+        with self._inflight_lock:
+            entry = self._inflight.get(s3_url)
+            if entry is None:
+                entry = self._inflight[s3_url] = [Future(), 0]
+                leader = True
+            else:
+                entry[1] += 1
+                leader = False
+        
+        if not leader:
+            logger.debug("⏳ Waiting for in-flight download of %s", s3_url)
+            return BytesIO(entry[0].result())
+        
+        try:
+            buffer = self._download_template(s3_url)
+        except Exception as e:
+            with self._inflight_lock:
+                del self._inflight[s3_url]
+            entry[0].set_exception(e)
+            raise
+        
+        with self._inflight_lock:
+            del self._inflight[s3_url]
+        # Only snapshot the bytes when someone is actually waiting on them
+        entry[0].set_result(buffer.getvalue() if entry[1] else None)
+        return buffer
+    
+    def _download_template(self, s3_url: str) -> BytesIO:
+        """Download a template over HTTP (with the ETag cache) or fall back to boto3"""
         try:
-            from urllib.parse import unquote, urlparse
-            
             # Extract key from S3 URL
             if s3_url.startswith('http'):
                 # Try direct HTTP download first (works for public S3 URLs)
-                print(f"📥 Attempting direct download from S3 URL: {s3_url}")
+                logger.debug("📥 Attempting direct download from S3 URL: %s", s3_url)
                 try:
-                    response = requests.get(s3_url, timeout=30)
-                    response.raise_for_status()
-                    print(f"✅ Template downloaded directly via HTTP ({len(response.content)} bytes)")
-                    return BytesIO(response.content)
-                except Exception as http_error:
-                    print(f"⚠️ Direct HTTP download failed: {http_error}")
-                    print(f"🔄 Falling back to boto3 download...")
+                    # Revalidate a cached copy with its ETag; 304 means reuse it
+                    cached = self._get_cached_template(s3_url)
+                    headers = {'If-None-Match': cached[0]} if cached else None
+                    with self._http.get(s3_url, timeout=30, headers=headers, stream=True) as response:
+                        if cached and response.status_code == 304:
+                            logger.debug("✅ Template unchanged, using cached copy (%d bytes)", len(cached[1]))
+                            return BytesIO(cached[1])
+                        response.raise_for_status()
+                        buffer = self._read_stream(response)
+                    logger.debug("✅ Template downloaded directly via HTTP (%d bytes)", buffer.getbuffer().nbytes)
+                    # Without an ETag there is no way to revalidate, so don't cache
+                    etag = response.headers.get('ETag')
+                    if etag:
+                        self._cache_template(s3_url, etag, buffer.getvalue())
+                    return buffer
+                except requests.HTTPError as http_error:
+                    # Transient failures were already retried by the session's
+                    # adapter; only a private object is worth a second download
+                    status = http_error.response.status_code if http_error.response is not None else None
+                    if status not in (401, 403):
+                        raise
+                    logger.warning("⚠️ Direct HTTP download denied (%s), falling back to boto3 download", status)
                     
                     # Fall back to boto3 download
                     parsed = urlparse(s3_url)
@@ -97,26 +278,129 @@ class SlideDataService:
                     if not key:
                         raise ValueError(f"Invalid S3 URL format - no key found: {s3_url}")
                         
-                    print(f"📥 Parsed S3 URL - Key: {key}")
+                    logger.debug("📥 Parsed S3 URL - Key: %s", key)
             else:
                 # Assume it's just the key
                 key = s3_url
-                print(f"📥 Using provided key: {key}")
+                logger.debug("📥 Using provided key: %s", key)
+            
+            # Keys can be overwritten in place, so a cached copy is only reused
+            # while the object's ETag still matches
+            etag = s3_service.get_etag(key)
+            cached = self._get_cached_template(key)
+            if cached and etag and cached[0] == etag:
+                logger.debug("✅ Template unchanged, using cached copy for key %s (%d bytes)", key, len(cached[1]))
+                return BytesIO(cached[1])
             
             # Download from S3 using boto3
-            file_data = s3_service.download_file(key)
+            file_data = s3_service.download_fileobj(key)
 
-            if not file_data:
+            if file_data is None or not file_data.getbuffer().nbytes:
                 raise RuntimeError(f"S3 download failed or returned no data for key: {key}")
 
-            print(f"✅ Template downloaded successfully ({len(file_data)} bytes)")
-            return BytesIO(file_data)
+            logger.debug("✅ Template downloaded successfully (%d bytes)", file_data.getbuffer().nbytes)
+            # Without an ETag there is no way to revalidate, so don't cache
+            if etag:
+                self._cache_template(key, etag, file_data.getvalue())
+            return file_data
             
         except Exception as e:
             error_msg = f"Failed to download template from S3: {str(e)}"
-            print(f"❌ {error_msg}")
+            logger.error("❌ %s", error_msg)
             raise RuntimeError(error_msg)
     
+    @staticmethod
+    def _probe_image(buffer: BytesIO) -> Tuple[str, int, int]:
+        """
+        Read an image's format and size from its header without decoding pixels
+        
+        Pillow only parses the header on open, so this is cheap; it raises for
+        data that isn't a recognised image or exceeds _MAX_IMAGE_PIXELS.
+        
+        Returns:
+            (format, width, height); the buffer is rewound to 0
+        """
+        try:
+            with Image.open(buffer) as img:
+                fmt, width, height = img.format, img.width, img.height
+            if width * height > _MAX_IMAGE_PIXELS:
+                raise ValueError(f"Image too large ({width}x{height} exceeds {_MAX_IMAGE_PIXELS} pixels)")
+            return fmt, width, height
+        finally:
+            buffer.seek(0)
+    
+    @staticmethod
+    def _read_stream(response: requests.Response) -> BytesIO:
+        """
+        Copy a streamed response body straight from the socket into a BytesIO
+        
+        Reads response.raw in 64 KB blocks, skipping the per-chunk generator in
+        iter_content; gzip/deflate bodies are still decoded on the way through.
+        """
+        response.raw.decode_content = True
+        buffer = BytesIO()
+        shutil.copyfileobj(response.raw, buffer, length=64 * 1024)
+        buffer.seek(0)
+        return buffer
+    
+    def _get_cached_template(self, s3_url: str) -> Optional[Tuple[Optional[str], bytes]]:
+        """Look up a cached template by URL or key, marking it most recently used"""
+        with self._template_cache_lock:
+            cached = self._template_cache.get(s3_url)
+            if cached:
+                self._template_cache.move_to_end(s3_url)
+            return cached
+    
+    def _cache_template(self, s3_url: str, etag: Optional[str], content: bytes) -> None:
+        """Remember a downloaded template by URL or key, evicting the least recently used"""
+        with self._template_cache_lock:
+            self._template_cache[s3_url] = (etag, content)
+            self._template_cache.move_to_end(s3_url)
+            while len(self._template_cache) > self._template_cache_size:
+                self._template_cache.popitem(last=False)
+    
+    def clear_template_cache(self) -> None:
+        """Drop all cached templates (e.g. after overwriting a template in S3)"""
+        with self._template_cache_lock:
+            self._template_cache.clear()
+        with self._presentation_cache_lock:
+            self._presentation_cache.clear()
+    
+    def _load_presentation(self, presentation_bytes: BytesIO) -> Presentation:
+        """
+        Return a Presentation for the template that the caller is free to modify
+        
+        Parsed templates are kept by content digest, so a template seen before
+        is deep-copied from its already-parsed XML instead of being unzipped
+        and parsed again. Templates over 10 MB are always parsed directly.
+        
+        Args:
+            presentation_bytes: BytesIO containing the template
+            
+        Returns:
+            A Presentation not shared with any other caller
+        """
+        size = presentation_bytes.getbuffer().nbytes
+        if size > _PRESENTATION_CACHE_MAX_BYTES:
+            return Presentation(presentation_bytes)
+        
+        digest = hashlib.blake2b(presentation_bytes.getbuffer(), digest_size=16).digest()
+        with self._presentation_cache_lock:
+            cached = self._presentation_cache.get(digest)
+            if cached is not None:
+                self._presentation_cache.move_to_end(digest)
+        
+        if cached is None:
+            cached = Presentation(presentation_bytes)
+            with self._presentation_cache_lock:
+                self._presentation_cache[digest] = cached
+                while len(self._presentation_cache) > self._presentation_cache_size:
+                    self._presentation_cache.popitem(last=False)
+        else:
+            logger.debug("📄 Using cached parsed template (%d bytes)", size)
+        
+        return copy.deepcopy(cached)
+    
     def generate_slide(
         self,
         slide_type: str,
@@ -134,46 +418,23 @@ class SlideDataService:
         Returns:
             BytesIO object containing the modified presentation
         """
-        print(f"� Generating {slide_type.upper()} slide...")
+        logger.info("🔧 Generating %s slide...", slide_type.upper())
+        
+        if slide_type not in self._HANDLER_MAP:
+            available_types = ', '.join(self._HANDLER_MAP)
+            raise ValueError(f"Unsupported slide type '{slide_type}'. Available types: {available_types}")
         
         # Download the presentation
         presentation_bytes = self.download_template_from_s3(presentation_s3_url)
         
-        # Download image if provided
-        image_data = None
-        if slide_data.get('image_url'):
-            try:
-                image_data = self.download_image_from_url(slide_data['image_url'])
-            except Exception as e:
-                print(f"⚠️ Warning: Could not download image: {e}")
-        
-        # Route to appropriate handler
-        handler_map = {
-            'points': handle_points_slide,
-            'image_text': handle_image_text_slide,
-            'table': handle_table_slide,
-            'phases': handle_phases_slide,
-            'statistics': handle_statistics_slide,
-            'people': handle_people_slide,
-            'cover': handle_cover_slide,
-            'contact': handle_contact_slide,
-            'images': handle_images_slide,
-            'graphs': handle_graph_slide,
-        }
-        
-        handler = handler_map.get(slide_type)
-        if not handler:
-            available_types = ', '.join(handler_map.keys())
-            raise ValueError(f"Unsupported slide type '{slide_type}'. Available types: {available_types}")
-        
-        # Call the appropriate handler
+        # Download the image and call the appropriate handler
         try:
-            result = handler(presentation_bytes, slide_data, image_data)
-            print(f"✅ {slide_type.upper()} slide generated successfully")
+            result = self._process_slide_in_presentation(presentation_bytes, slide_type, slide_data)
+            logger.info("✅ %s slide generated successfully", slide_type.upper())
             return result
         except Exception as e:
             error_msg = f"Error in {slide_type} handler: {str(e)}"
-            print(f"❌ {error_msg}")
+            logger.error("❌ %s", error_msg)
             raise RuntimeError(error_msg)
     
     # Convenience methods for backward compatibility and specific slide types
@@ -237,42 +498,133 @@ class SlideDataService:
         Returns:
             BytesIO object containing the complete presentation
         """
-        print(f"🎨 Generating multi-slide presentation (OPTIMIZED)...")
+        logger.info("🎨 Generating multi-slide presentation (OPTIMIZED)...")
+        
+        # Normalize the request once; the loop below reads attributes, not dict keys
+        configs = [SlideConfig.from_dict(config) for config in slides_config]
         
-        # Download template ONCE from S3
-        presentation_bytes = self.download_template_from_s3(template_s3_url)
+        # Download template ONCE from S3 in the background while every slide's
+        # images are fetched concurrently, so neither waits on the other
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            template_future = pool.submit(self.download_template_from_s3, template_s3_url)
+            images = self._prefetch_images(configs)
+            presentation_bytes = template_future.result()
         
-        # Load presentation ONCE into memory
-        prs = Presentation(presentation_bytes)
-        print(f"📄 Loaded presentation with {len(prs.slides)} slides")
+        # Load presentation ONCE into memory (copied from the parsed-template cache)
+        prs = self._load_presentation(presentation_bytes)
+        logger.debug("📄 Loaded presentation with %d slides", len(prs.slides))
         
         # Process each slide configuration
         slides_processed = 0
-        for idx, config in enumerate(slides_config, 1):
-            slide_type = config.get('slide_type')
-            slide_data = config.get('slide_data', {})
+        for idx, config in enumerate(configs, 1):
+            slide_type = config.slide_type
             
             if not slide_type:
-                print(f"⚠️ Skipping config {idx} without slide_type")
+                logger.warning("⚠️ Skipping config %d without slide_type", idx)
                 continue
             
             try:
-                print(f"🔧 Processing slide {idx}/{len(slides_config)}: {slide_type}")
-                self._modify_slide_in_presentation(prs, slide_type, slide_data)
+                logger.debug("🔧 Processing slide %d/%d: %s", idx, len(configs), slide_type)
+                slide_images = images.get(idx, {})
+                self._modify_slide_in_presentation(
+                    prs, slide_type, config.slide_data,
+                    image_data=slide_images.get(config.image_url),
+                    download_image=False,
+                    prefetched_images=slide_images
+                )
                 slides_processed += 1
             except Exception as e:
-                print(f"⚠️ Error processing {slide_type} slide: {e}")
+                logger.warning("⚠️ Error processing %s slide: %s", slide_type, e)
                 continue
         
-        # Save presentation ONCE to BytesIO
+        # Save presentation ONCE to BytesIO, sized from the template up front
+        output = self._save_presentation(prs, presentation_bytes.getbuffer().nbytes)
+        
+        logger.info("✅ Multi-slide presentation generated successfully (%d/%d slides processed)", slides_processed, len(slides_config))
+        return output
+    
+    @staticmethod
+    def _save_presentation(prs: Presentation, estimated_size: int) -> BytesIO:
+        """
+        Save a presentation into a BytesIO preallocated to estimated_size
+        
+        The zip writer then fills existing memory instead of regrowing the
+        buffer as it goes; the buffer is trimmed to the real length afterwards.
+        
+        Returns:
+            BytesIO containing the saved presentation, positioned at 0
+        """
         output = BytesIO()
+        if estimated_size > 0:
+            output.seek(estimated_size - 1)
+            output.write(b'\0')
+            output.seek(0)
         prs.save(output)
+        output.truncate()
         output.seek(0)
-        
-        print(f"✅ Multi-slide presentation generated successfully ({slides_processed}/{len(slides_config)} slides processed)")
         return output
     
-    def _modify_slide_in_presentation(self, prs: Presentation, slide_type: str, slide_data: Dict[str, Any]) -> None:
+    @staticmethod
+    def _collect_image_urls(slide_data: Dict[str, Any]) -> List[str]:
+        """All image URLs a slide uses: image_url plus the cover/contact 'image' and gallery 'images' lists"""
+        urls = [slide_data.get('image_url')]
+        for key in ('image', 'images'):
+            if isinstance(slide_data.get(key), list):
+                urls.extend(slide_data[key])
+        return [url for url in urls if url and isinstance(url, str)]
+    
+    def _prefetch_images(
+        self,
+        configs: List[SlideConfig],
+        max_workers: int = 16
+    ) -> Dict[int, Dict[str, Optional[BytesIO]]]:
+        """
+        Download the images of every slide config in parallel
+        
+        Each distinct URL is fetched once, however many slides use it (logos,
+        backgrounds); every slide gets its own BytesIO over the shared bytes.
+        
+        Args:
+            configs: Normalized slide configurations
+            max_workers: Maximum concurrent downloads
+            
+        Returns:
+            Dict of 1-based config index -> {image URL: BytesIO, or None if the download failed}
+        """
+        slide_urls = {
+            idx: self._collect_image_urls(config.slide_data)
+            for idx, config in enumerate(configs, 1)
+        }
+        unique_urls = list(dict.fromkeys(url for urls in slide_urls.values() for url in urls))
+        if not unique_urls:
+            return {}
+        
+        def fetch(url):
+            try:
+                return self.download_image_from_url(url).getvalue()
+            except Exception as e:
+                logger.warning("⚠️ Could not download image: %s", e)
+                return None
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(unique_urls))) as executor:
+            content = dict(zip(unique_urls, executor.map(fetch, unique_urls)))
+        logger.debug("🖼️ Prefetched %d unique images", len(unique_urls))
+        
+        return {
+            idx: {url: BytesIO(content[url]) if content[url] is not None else None for url in urls}
+            for idx, urls in slide_urls.items()
+            if urls
+        }
+    
+    def _modify_slide_in_presentation(
+        self,
+        prs: Presentation,
+        slide_type: str,
+        slide_data: Dict[str, Any],
+        image_data: Optional[BytesIO] = None,
+        download_image: bool = True,
+        prefetched_images: Optional[Dict[str, Optional[BytesIO]]] = None
+    ) -> None:
         """
         OPTIMIZED: Modify a single slide directly in the presentation object
         
@@ -283,9 +635,10 @@ class SlideDataService:
             prs: Presentation object to modify
             slide_type: Type of slide ('points', 'image_text', 'table', 'phases', etc.)
             slide_data: Dictionary with slide configuration
+            image_data: Already-downloaded image for the slide
+            download_image: Download slide_data['image_url'] here (False when prefetched)
+            prefetched_images: Already-downloaded images by URL for multi-image slides
         """
-        from io import BytesIO
-        
         # Get slide number and validate
         slide_number = slide_data.get('slide_number', 1)
         slide_index = slide_number - 1
@@ -294,173 +647,163 @@ class SlideDataService:
             raise ValueError(f"Slide {slide_number} not found in presentation (has {len(prs.slides)} slides)")
         
         slide = prs.slides[slide_index]
-        print(f"📝 Modifying slide {slide_number} ({slide_type})...")
+        logger.debug("📝 Modifying slide %d (%s)...", slide_number, slide_type)
         
         # Download image if needed
-        image_data = None
-        if slide_data.get('image_url'):
+        if download_image and image_data is None and slide_data.get('image_url'):
             try:
                 image_data = self.download_image_from_url(slide_data['image_url'])
             except Exception as e:
-                print(f"⚠️ Warning: Could not download image for {slide_type}: {e}")
-        
-        # Handle multiple images for cover/contact/images slide types
-        if slide_data.get('image') and isinstance(slide_data['image'], list):
-            # These slide types handle multiple images internally
-            pass
+                logger.warning("⚠️ Could not download image for %s: %s", slide_type, e)
         
         # Route to appropriate modification logic based on slide type
-        if slide_type == 'points':
-            self._modify_points_slide(slide, slide_data, image_data)
-        elif slide_type == 'image_text':
-            self._modify_image_text_slide(slide, slide_data, image_data)
-        elif slide_type == 'table':
-            self._modify_table_slide(slide, slide_data)
-        elif slide_type == 'phases':
-            self._modify_phases_slide(slide, slide_data, image_data)
-        elif slide_type == 'statistics':
-            self._modify_statistics_slide(slide, slide_data, image_data)
-        elif slide_type == 'people':
-            self._modify_people_slide(slide, slide_data, image_data)
-        elif slide_type == 'cover':
-            self._modify_cover_slide(slide, slide_data)
-        elif slide_type == 'contact':
-            self._modify_contact_slide(slide, slide_data)
-        elif slide_type == 'images':
-            self._modify_images_slide(slide, slide_data)
-        elif slide_type == 'graphs':
-            self._modify_graph_slide(slide, slide_data)
-        else:
+        entry = self._MODIFIER_MAP.get(slide_type)
+        if entry is None:
             raise ValueError(f"Unsupported slide type: {slide_type}")
         
-        print(f"✅ Slide {slide_number} modified successfully")
+        modifier, extra_arg = entry
+        if extra_arg == 'image_data':
+            modifier(slide, slide_data, image_data)
+        elif extra_arg == 'prefetched_images':
+            modifier(slide, slide_data, prefetched_images)
+        else:
+            modifier(slide, slide_data)
+        
+        logger.debug("✅ Slide %d modified successfully", slide_number)
     
-    # Import helper functions from handlers to reuse logic
-    def _modify_points_slide(self, slide, slide_data: Dict[str, Any], image_data: BytesIO = None):
+    # Modifiers reuse the handler helpers imported at module level
+    @staticmethod
+    def _modify_points_slide(slide, slide_data: Dict[str, Any], image_data: BytesIO = None):
         """Modify points slide directly"""
-        from services.handlers.points import _update_header, _update_description, _update_image, _update_points
-        
         if slide_data.get('header'):
-            _update_header(slide, slide_data)
+            _points_update_header(slide, slide_data)
         if slide_data.get('description'):
-            _update_description(slide, slide_data)
+            _points_update_description(slide, slide_data)
         if image_data and slide_data.get('image_url'):
-            _update_image(slide, image_data)
+            _points_update_image(slide, image_data)
         if slide_data.get('points'):
-            _update_points(slide, slide_data)
+            _points_update_points(slide, slide_data)
     
-    def _modify_image_text_slide(self, slide, slide_data: Dict[str, Any], image_data: BytesIO = None):
+    @staticmethod
+    def _modify_image_text_slide(slide, slide_data: Dict[str, Any], image_data: BytesIO = None):
         """Modify image+text slide directly"""
-        from services.handlers.image_text import _update_title, _update_text, _update_image
-        
         if slide_data.get('title'):
-            _update_title(slide, slide_data)
+            _image_text_update_title(slide, slide_data)
         if slide_data.get('text'):
-            _update_text(slide, slide_data)
+            _image_text_update_text(slide, slide_data)
         if image_data and slide_data.get('image_url'):
-            _update_image(slide, image_data)
+            _image_text_update_image(slide, image_data)
     
-    def _modify_table_slide(self, slide, slide_data: Dict[str, Any]):
+    @staticmethod
+    def _modify_table_slide(slide, slide_data: Dict[str, Any]):
         """Modify table slide directly"""
-        from services.handlers.table import _update_title, _update_table
-        
+        shapes = list(slide.shapes)
         if slide_data.get('title'):
-            _update_title(slide, slide_data)
+            _table_update_title(slide, slide_data, shapes)
         if slide_data.get('table_data'):
-            _update_table(slide, slide_data)
+            _table_update_table(slide, slide_data, shapes)
     
-    def _modify_phases_slide(self, slide, slide_data: Dict[str, Any], image_data: BytesIO = None):
+    @staticmethod
+    def _modify_phases_slide(slide, slide_data: Dict[str, Any], image_data: BytesIO = None):
         """Modify phases slide directly"""
-        from services.handlers.phases import _update_title, _update_phases, _update_image
-        
         if slide_data.get('title'):
-            _update_title(slide, slide_data)
+            _phases_update_title(slide, slide_data)
         if slide_data.get('phases'):
-            _update_phases(slide, slide_data)
+            _phases_update_phases(slide, slide_data)
         if image_data and slide_data.get('image_url'):
-            _update_image(slide, image_data)
+            _phases_update_image(slide, image_data)
     
-    def _modify_statistics_slide(self, slide, slide_data: Dict[str, Any], image_data: BytesIO = None):
+    @staticmethod
+    def _modify_statistics_slide(slide, slide_data: Dict[str, Any], image_data: BytesIO = None):
         """Modify statistics slide directly"""
-        from services.handlers.statistics import _update_title, _update_description, _update_statistics, _update_background_color, _update_image
-        
+        shapes = list(slide.shapes)
         if slide_data.get('title'):
-            _update_title(slide, slide_data)
+            _statistics_update_title(slide, slide_data, shapes)
         if slide_data.get('description'):
-            _update_description(slide, slide_data)
+            _statistics_update_description(slide, slide_data, shapes)
         if slide_data.get('stat_data'):
-            _update_statistics(slide, slide_data)
+            _statistics_update_statistics(slide, slide_data, shapes)
         if slide_data.get('background_color'):
-            _update_background_color(slide, slide_data['background_color'])
+            _statistics_update_background_color(slide, slide_data['background_color'], shapes)
         if image_data and slide_data.get('image_url'):
-            _update_image(slide, image_data)
+            _statistics_update_image(slide, image_data, shapes)
     
-    def _modify_people_slide(self, slide, slide_data: Dict[str, Any], image_data: BytesIO = None):
+    @staticmethod
+    def _modify_people_slide(slide, slide_data: Dict[str, Any], image_data: BytesIO = None):
         """Modify people slide directly"""
-        from services.handlers.people import _update_title, _update_description, _update_people, _update_background_color, _update_image
-        
         if slide_data.get('title'):
-            _update_title(slide, slide_data)
+            _people_update_title(slide, slide_data)
         if slide_data.get('description'):
-            _update_description(slide, slide_data)
+            _people_update_description(slide, slide_data)
         if slide_data.get('names'):
-            _update_people(slide, slide_data)
+            _people_update_people(slide, slide_data)
         if slide_data.get('background_color'):
-            _update_background_color(slide, slide_data['background_color'])
+            _people_update_background_color(slide, slide_data['background_color'])
         if image_data and slide_data.get('image_url'):
-            _update_image(slide, image_data)
+            _people_update_image(slide, image_data)
     
-    def _modify_cover_slide(self, slide, slide_data: Dict[str, Any]):
+    @staticmethod
+    def _modify_cover_slide(slide, slide_data: Dict[str, Any], prefetched_images: Dict[str, BytesIO] = None):
         """Modify cover slide directly"""
-        from services.handlers.cover import _update_title, _update_subtitle, _update_company_name, _update_images_from_urls, _apply_color_scheme
-        
         if slide_data.get('title'):
-            _update_title(slide, slide_data)
+            _cover_update_title(slide, slide_data)
         if slide_data.get('subtitle'):
-            _update_subtitle(slide, slide_data)
+            _cover_update_subtitle(slide, slide_data)
         if slide_data.get('company_name'):
-            _update_company_name(slide, slide_data)
+            _cover_update_company_name(slide, slide_data)
         if slide_data.get('image'):
-            _update_images_from_urls(slide, slide_data.get('image', []))
+            _cover_update_images_from_urls(slide, slide_data.get('image', []), prefetched_images)
         if slide_data.get('colors'):
-            _apply_color_scheme(slide, slide_data.get('colors', {}))
+            _cover_apply_color_scheme(slide, slide_data.get('colors', {}))
     
-    def _modify_contact_slide(self, slide, slide_data: Dict[str, Any]):
+    @staticmethod
+    def _modify_contact_slide(slide, slide_data: Dict[str, Any], prefetched_images: Dict[str, BytesIO] = None):
         """Modify contact slide directly"""
-        from services.handlers.contact import _update_title, _update_website, _update_linkedin, _update_email, _update_phone, _update_images_from_urls, _apply_color_scheme
-        
         if slide_data.get('title'):
-            _update_title(slide, slide_data)
+            _contact_update_title(slide, slide_data)
         if slide_data.get('website_link'):
-            _update_website(slide, slide_data)
+            _contact_update_website(slide, slide_data)
         if slide_data.get('linkedin_link'):
-            _update_linkedin(slide, slide_data)
+            _contact_update_linkedin(slide, slide_data)
         if slide_data.get('contact_email'):
-            _update_email(slide, slide_data)
+            _contact_update_email(slide, slide_data)
         if slide_data.get('contact_phone'):
-            _update_phone(slide, slide_data)
+            _contact_update_phone(slide, slide_data)
         if slide_data.get('image'):
-            _update_images_from_urls(slide, slide_data.get('image', []))
+            _contact_update_images_from_urls(slide, slide_data.get('image', []), prefetched_images)
         if slide_data.get('colors'):
-            _apply_color_scheme(slide, slide_data.get('colors', {}))
+            _contact_apply_color_scheme(slide, slide_data.get('colors', {}))
     
-    def _modify_images_slide(self, slide, slide_data: Dict[str, Any]):
+    @staticmethod
+    def _modify_images_slide(slide, slide_data: Dict[str, Any], prefetched_images: Dict[str, BytesIO] = None):
         """Modify images slide directly"""
-        from services.handlers.images import _update_title, _update_image_gallery
-        
         if slide_data.get('title'):
-            _update_title(slide, slide_data)
+            _images_update_title(slide, slide_data)
         if slide_data.get('images'):
-            _update_image_gallery(slide, slide_data)
+            _images_update_image_gallery(slide, slide_data, prefetched_images)
     
-    def _modify_graph_slide(self, slide, slide_data: Dict[str, Any]):
+    @staticmethod
+    def _modify_graph_slide(slide, slide_data: Dict[str, Any]):
         """Modify graph slide directly"""
-        from services.handlers.graphs import _update_title, _update_chart
-        
         if slide_data.get('title'):
-            _update_title(slide, slide_data)
-        if slide_data.get('chart_data'):
-            _update_chart(slide, slide_data)
+            _graphs_update_title(slide, slide_data)
+        if slide_data.get('charts'):
+            _graphs_update_charts(slide, slide_data)
+    
+    # Slide type -> (modifier, extra argument it takes besides slide and slide_data);
+    # __func__ unwraps the staticmethods so entries are plain functions on every Python version
+    _MODIFIER_MAP = {
+        'points': (_modify_points_slide.__func__, 'image_data'),
+        'image_text': (_modify_image_text_slide.__func__, 'image_data'),
+        'table': (_modify_table_slide.__func__, None),
+        'phases': (_modify_phases_slide.__func__, 'image_data'),
+        'statistics': (_modify_statistics_slide.__func__, 'image_data'),
+        'people': (_modify_people_slide.__func__, 'image_data'),
+        'cover': (_modify_cover_slide.__func__, 'prefetched_images'),
+        'contact': (_modify_contact_slide.__func__, 'prefetched_images'),
+        'images': (_modify_images_slide.__func__, 'prefetched_images'),
+        'graphs': (_modify_graph_slide.__func__, None),
+    }
     
     def _process_slide_in_presentation(self, presentation_bytes: BytesIO, slide_type: str, slide_data: Dict[str, Any]) -> BytesIO:
         """
@@ -475,25 +818,12 @@ class SlideDataService:
             try:
                 image_data = self.download_image_from_url(slide_data['image_url'])
             except Exception as e:
-                print(f"⚠️ Warning: Could not download image for {slide_type}: {e}")
+                logger.warning("⚠️ Could not download image for %s: %s", slide_type, e)
         
         # Route to appropriate handler
-        handler_map = {
-            'points': handle_points_slide,
-            'image_text': handle_image_text_slide,
-            'table': handle_table_slide,
-            'phases': handle_phases_slide,
-            'statistics': handle_statistics_slide,
-            'people': handle_people_slide,
-            'cover': handle_cover_slide,
-            'contact': handle_contact_slide,
-            'images': handle_images_slide,
-            'graphs': handle_graph_slide,
-        }
-        
-        handler = handler_map.get(slide_type)
+        handler = self._HANDLER_MAP.get(slide_type)
         if not handler:
-            print(f"⚠️ Unknown slide type: {slide_type}")
+            logger.warning("⚠️ Unknown slide type: %s", slide_type)
             return presentation_bytes
         
         return handler(presentation_bytes, slide_data, image_data)
@@ -5,14 +5,31 @@ from datetime import datetime
 from dotenv import load_dotenv
 from msal import PublicClientApplication
 from pptx import Presentation
+from pptx.shapes.picture import Picture
 from openpyxl import Workbook
 import base64
 import hashlib
+import struct
+from functools import lru_cache
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 try:
     from PIL import Image
 except ImportError:
     Image = None  # PIL is optional for enhanced image analysis
 
+# Where extracted pictures are written
+IMAGES_FOLDER = "extracted_images"
+
+# PIL is only consulted for image formats the header sniffers don't cover
+USE_PIL = bool(os.environ.get("PPT_USE_PIL"))
+
+# Base64 data URLs are big and slow to build; only emit them when asked to
+EMBED_BASE64 = os.getenv("PPT_EMBED_BASE64") == "1"
+
+# Excel's hard limit on characters in one cell
+_EXCEL_CELL_LIMIT = 32767
+
 # ------------------------------------------------
 # Load environment
 # ------------------------------------------------
@@ -64,19 +81,102 @@ def graph_put(url, token, data, content_type="application/octet-stream"):
         raise RuntimeError(f"PUT {url} failed: {r.status_code} {r.text}")
     return r
 
+# ------------------------------------------------
+# Lookup tables
+# ------------------------------------------------
+# Control characters Excel rejects in cells (everything below 0x20 except
+# tab, LF and CR, plus DEL), mapped to None for str.translate
+_ILLEGAL_XLSX_TABLE = dict.fromkeys(list(range(0, 9)) + [11, 12] + list(range(14, 32)) + [0x7F])
+
+_EXTENSION_MAP = {
+    'image/jpeg': '.jpg',
+    'image/jpg': '.jpg',
+    'image/png': '.png',
+    'image/gif': '.gif',
+    'image/bmp': '.bmp',
+    'image/tiff': '.tiff',
+    'image/webp': '.webp',
+    'image/svg+xml': '.svg'
+}
+
+_ALIGNMENT_MAP = {
+    0: 'Left', 1: 'Center', 2: 'Right', 3: 'Justify',
+    4: 'Distribute', 5: 'Thai Distribute'
+}
+
+_FILL_TYPE_MAP = {
+    0: 'No Fill', 1: 'Solid', 2: 'Gradient', 3: 'Picture',
+    4: 'Pattern', 5: 'Group', 6: 'Background'
+}
+
+_CHART_TYPE_MAP = {
+    1: 'Area', 2: 'Bar', 3: 'Column', 4: 'Line', 5: 'Pie',
+    6: 'Scatter', 7: 'Surface', 8: 'Radar', 9: 'Treemap',
+    10: 'Sunburst', 11: 'Histogram', 12: 'BoxWhisker',
+    13: 'Waterfall', 14: 'Funnel', 15: 'Map'
+}
+
+_PLACEHOLDER_MAP = {
+    0: 'Title', 1: 'Body', 2: 'CenterTitle', 3: 'Subtitle',
+    4: 'DateAndTime', 5: 'SlideNumber', 6: 'Footer', 7: 'Header',
+    8: 'Object', 9: 'Chart', 10: 'Table', 11: 'ClipArt',
+    12: 'Diagram', 13: 'Media', 14: 'SlideImage', 15: 'Picture'
+}
+
+_LINE_STYLE_MAP = {
+    0: 'None', 1: 'Solid', 2: 'Dash', 3: 'Dot',
+    4: 'DashDot', 5: 'DashDotDot', 6: 'Double'
+}
+
+# Namespaces for the effects and animation lookups on the parsed XML
+_XML_NS = {
+    'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
+    'p': 'http://schemas.openxmlformats.org/presentationml/2006/main'
+}
+
+# Row values for shapes that are not pictures / charts
+_NO_IMAGE_INFO = {
+    'has_image': False,
+    'format': '',
+    'width': 0,
+    'height': 0,
+    'file_size': 0,
+    'url': '',
+    'base64': ''
+}
+_NO_CHART_INFO = {
+    'type': 'None',
+    'title': 'None',
+    'data': 'None',
+    'categories': 'None',
+    'series': 'None'
+}
+
+_SHAPE_TYPE_MAP = {
+    1: "AutoShape", 2: "Callout", 3: "Chart", 4: "Comment",
+    5: "Freeform", 6: "Group", 7: "Line", 8: "LinkedOLEObject",
+    9: "LinkedPicture", 10: "Media", 11: "OLEObject", 12: "Picture",
+    13: "Placeholder", 14: "TextBox", 15: "3DModel", 16: "Canvas",
+    17: "Connector", 18: "Ink", 19: "Table", 20: "SmartArt"
+}
+
+# Enhanced headers for comprehensive data, one per row_data column
+_HEADERS = (
+    "Slide No", "Shape Name", "Shape Type", "Content",
+    "Left (EMU)", "Top (EMU)", "Width (EMU)", "Height (EMU)",
+    "Left (Inches)", "Top (Inches)", "Width (Inches)", "Height (Inches)",
+    "Font Name", "Font Size", "Font Bold", "Font Italic", "Font Underline", "Font Color",
+    "Text Alignment", "Line Spacing", "Paragraph Spacing",
+    "Fill Color", "Fill Type", "Transparency", "Line Color", "Line Width", "Line Style", "Rotation",
+    "Has Image", "Image Format", "Image Width", "Image Height", "Image File Size", "Image URL", "Image Base64",
+    "Chart Type", "Chart Title", "Chart Data", "Chart Categories", "Chart Series",
+    "Hyperlink", "Z-Order", "Hidden", "Shadow", "Glow Effect", "Reflection",
+    "3D Effects", "Placeholder Type", "Animation Effects"
+)
+
 def get_image_extension(content_type):
     """Get file extension from content type"""
-    extension_map = {
-        'image/jpeg': '.jpg',
-        'image/jpg': '.jpg', 
-        'image/png': '.png',
-        'image/gif': '.gif',
-        'image/bmp': '.bmp',
-        'image/tiff': '.tiff',
-        'image/webp': '.webp',
-        'image/svg+xml': '.svg'
-    }
-    return extension_map.get(content_type.lower(), '.img')
+    return _EXTENSION_MAP.get(content_type.lower(), '.img')
 
 def get_mime_type(content_type):
     """Get proper MIME type for base64 data URL"""
@@ -84,6 +184,62 @@ def get_mime_type(content_type):
         return content_type
     return 'image/jpeg'  # Default fallback
 
+# Shapes on a grid or from the same layout share positions and sizes, so
+# the same handful of EMU values is converted over and over
+@lru_cache(maxsize=4096)
+def emu_to_inches(emu):
+    """Convert EMU (English Metric Units) to inches"""
+    return round(emu / 914400, 2) if emu else 0
+
+def _png_size(blob):
+    """Read (width, height) from a PNG's IHDR chunk, or None if blob isn't a PNG"""
+    if len(blob) >= 24 and blob[:8] == b'\x89PNG\r\n\x1a\n' and blob[12:16] == b'IHDR':
+        return struct.unpack('>II', blob[16:24])
+    return None
+
+def _jpeg_size(blob):
+    """Read (width, height) from a JPEG's first SOFn marker, or None if not found"""
+    if blob[:2] != b'\xff\xd8':
+        return None
+    i = 2
+    while i + 9 <= len(blob):
+        if blob[i] != 0xFF:
+            return None
+        marker = blob[i + 1]
+        if marker == 0xFF:  # fill byte
+            i += 1
+            continue
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            height, width = struct.unpack('>HH', blob[i + 5:i + 9])
+            return width, height
+        if marker == 0x01 or 0xD0 <= marker <= 0xD9:  # markers without a length
+            i += 2
+            continue
+        i += 2 + struct.unpack('>H', blob[i + 2:i + 4])[0]
+    return None
+
+def get_image_size(blob, content_type):
+    """
+    Native pixel size of an image from its header bytes alone, without decoding
+
+    PNG and JPEG are sniffed directly; other formats go through PIL only when
+    PPT_USE_PIL is set. Returns None when the size can't be determined.
+    """
+    content_type = (content_type or '').lower()
+    if content_type == 'image/png':
+        size = _png_size(blob)
+    elif content_type in ('image/jpeg', 'image/jpg'):
+        size = _jpeg_size(blob)
+    else:
+        size = _png_size(blob) or _jpeg_size(blob)
+    if size is None and USE_PIL and Image:
+        try:
+            with Image.open(BytesIO(blob)) as img:
+                size = img.size
+        except Exception:
+            pass
+    return size
+
 def sanitize_text(text):
     """Remove illegal characters for Excel cells"""
     if text is None:
@@ -91,10 +247,7 @@ def sanitize_text(text):
     if not isinstance(text, str):
         text = str(text)
     # Remove control characters except tab, newline, and carriage return
-    # Excel doesn't support characters with codes 0-31 except 9 (tab), 10 (LF), 13 (CR)
-    import re
-    # Remove all control characters except allowed ones
-    text = re.sub(r'[\x00-\x08\x0B-\x0C\x0E-\x1F\x7F]', '', text)
+    text = text.translate(_ILLEGAL_XLSX_TABLE)
     # Limit length to avoid Excel's 32,767 character limit per cell
     if len(text) > 32000:
         text = text[:32000] + '...'
@@ -104,38 +257,25 @@ def sanitize_text(text):
 # Extract presentation data
 # ------------------------------------------------
 def extract_ppt_to_excel(prs):
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "PPT_Data"
+    # Write-only mode streams each appended row straight to XML instead of
+    # keeping a Cell object per value alive until save
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("PPT_Data")
     
-    # Enhanced headers for comprehensive data
-    headers = [
-        "Slide No", "Shape Name", "Shape Type", "Content", 
-        "Left (EMU)", "Top (EMU)", "Width (EMU)", "Height (EMU)",
-        "Left (Inches)", "Top (Inches)", "Width (Inches)", "Height (Inches)",
-        "Font Name", "Font Size", "Font Bold", "Font Italic", "Font Underline", "Font Color",
-        "Text Alignment", "Line Spacing", "Paragraph Spacing",
-        "Fill Color", "Fill Type", "Transparency", "Line Color", "Line Width", "Line Style", "Rotation",
-        "Has Image", "Image Format", "Image Width", "Image Height", "Image File Size", "Image URL", "Image Base64",
-        "Chart Type", "Chart Title", "Chart Data", "Chart Categories", "Chart Series",
-        "Hyperlink", "Z-Order", "Hidden", "Shadow", "Glow Effect", "Reflection",
-        "3D Effects", "Placeholder Type", "Animation Effects"
-    ]
-    ws.append(headers)
-
-    def emu_to_inches(emu):
-        """Convert EMU (English Metric Units) to inches"""
-        return round(emu / 914400, 2) if emu else 0
+    ws.append(_HEADERS)
 
     def get_color_info(color_obj):
         """Extract color information"""
         try:
-            if hasattr(color_obj, 'rgb'):
-                return f"RGB({color_obj.rgb.red},{color_obj.rgb.green},{color_obj.rgb.blue})"
-            elif hasattr(color_obj, 'theme_color'):
-                return f"Theme Color {color_obj.theme_color}"
-            else:
-                return "Auto/Default"
+            try:
+                rgb = color_obj.rgb
+            except AttributeError:
+                # Not an RGB color: python-pptx raises for the other color types
+                try:
+                    return f"Theme Color {color_obj.theme_color}"
+                except AttributeError:
+                    return "Auto/Default"
+            return f"RGB({rgb.red},{rgb.green},{rgb.blue})"
         except:
             return "Unknown"
 
@@ -158,20 +298,15 @@ def extract_ppt_to_excel(prs):
                 first_paragraph = text_frame.paragraphs[0]
                 
                 # Paragraph alignment
-                if hasattr(first_paragraph, 'alignment'):
-                    alignment_map = {
-                        0: 'Left', 1: 'Center', 2: 'Right', 3: 'Justify', 
-                        4: 'Distribute', 5: 'Thai Distribute'
-                    }
-                    font_info['alignment'] = alignment_map.get(first_paragraph.alignment, 'Left')
+                font_info['alignment'] = _ALIGNMENT_MAP.get(first_paragraph.alignment, 'Left')
                 
                 # Line spacing
-                if hasattr(first_paragraph, 'line_spacing'):
-                    try:
-                        if first_paragraph.line_spacing:
-                            font_info['line_spacing'] = f"{first_paragraph.line_spacing:.2f}"
-                    except:
-                        pass
+                try:
+                    line_spacing = first_paragraph.line_spacing
+                    if line_spacing:
+                        font_info['line_spacing'] = f"{line_spacing:.2f}"
+                except:
+                    pass
                 
                 # Space before/after paragraph
                 try:
@@ -190,7 +325,7 @@ def extract_ppt_to_excel(prs):
                     font_info['bold'] = font.bold if font.bold is not None else False
                     font_info['italic'] = font.italic if font.italic is not None else False
                     font_info['underline'] = font.underline if font.underline is not None else False
-                    font_info['color'] = get_color_info(font.color) if hasattr(font, 'color') else 'Auto'
+                    font_info['color'] = get_color_info(font.color)
         except:
             pass
         
@@ -205,28 +340,34 @@ def extract_ppt_to_excel(prs):
         }
         
         try:
-            if hasattr(shape, 'fill') and shape.fill:
-                # Fill type
-                fill_type_map = {
-                    0: 'No Fill', 1: 'Solid', 2: 'Gradient', 3: 'Picture', 
-                    4: 'Pattern', 5: 'Group', 6: 'Background'
-                }
-                fill_info['type'] = fill_type_map.get(shape.fill.type, 'Unknown')
-                
-                # Fill color
-                if hasattr(shape.fill, 'fore_color'):
-                    fill_info['color'] = get_color_info(shape.fill.fore_color)
-                
-                # Transparency
-                if hasattr(shape.fill, 'transparency'):
-                    fill_info['transparency'] = f"{shape.fill.transparency * 100:.1f}%"
+            try:
+                fill = shape.fill
+            except AttributeError:
+                # Shapes such as groups and graphic frames have no fill
+                return fill_info
+            
+            # Fill type
+            fill_info['type'] = _FILL_TYPE_MAP.get(fill.type, 'Unknown')
+            
+            # Fill color
+            fill_info['color'] = get_color_info(fill.fore_color)
+            
+            # Transparency
+            try:
+                fill_info['transparency'] = f"{fill.transparency * 100:.1f}%"
+            except AttributeError:
+                pass
                     
         except:
             pass
         
         return fill_info
 
-    def get_image_info(shape, slide_num, shape_index, images_folder="extracted_images"):
+    # Content hash -> (file URL, base64 data URL) of pictures already extracted;
+    # two slide workers racing on the same new picture just both write it once
+    seen_images = {}
+
+    def get_image_info(shape, slide_num, shape_index, images_folder=IMAGES_FOLDER):
         """Extract detailed image information and save images"""
         image_info = {
             'has_image': False,
@@ -239,49 +380,54 @@ def extract_ppt_to_excel(prs):
         }
         
         try:
-            if shape.shape_type == 12 or hasattr(shape, 'image'):  # Picture
+            try:
+                image = shape.image
+            except (AttributeError, ValueError):
+                # No image property, or a picture without an embedded image
+                image = None
+            
+            if shape.shape_type == 12 or image is not None:  # Picture
                 image_info['has_image'] = True
                 
-                if hasattr(shape, 'image') and shape.image:
+                if image:
                     # Get image data
-                    image_blob = shape.image.blob
-                    image_info['format'] = shape.image.content_type or 'Unknown'
+                    image_blob = image.blob
+                    image_info['format'] = image.content_type or 'Unknown'
                     image_info['file_size'] = len(image_blob) if image_blob else 0
                     
                     if image_blob:
-                        # Create images folder if it doesn't exist
-                        if not os.path.exists(images_folder):
-                            os.makedirs(images_folder)
-                        
-                        # Generate unique filename based on content hash
-                        image_hash = hashlib.md5(image_blob).hexdigest()[:12]
-                        file_extension = get_image_extension(image_info['format'])
-                        filename = f"slide_{slide_num}_shape_{shape_index}_{image_hash}{file_extension}"
-                        filepath = os.path.join(images_folder, filename)
-                        
-                        # Save image to file
-                        with open(filepath, 'wb') as f:
-                            f.write(image_blob)
-                        
-                        # Create URL (relative path)
-                        image_info['url'] = filepath.replace('\\', '/')
-                        
-                        # Create base64 data URL for direct embedding
-                        base64_string = base64.b64encode(image_blob).decode('utf-8')
-                        mime_type = get_mime_type(image_info['format'])
-                        image_info['base64'] = f"data:{mime_type};base64,{base64_string}"  # Full base64 for complete usage
-                    
-                    # Try to get image dimensions
-                    try:
-                        if Image and image_blob:  # Only if PIL is available
-                            img = Image.open(BytesIO(image_blob))
-                            image_info['width'] = img.width
-                            image_info['height'] = img.height
+                        # Same picture (e.g. a logo) on several slides: reuse the first
+                        # copy's file and base64 instead of writing and encoding it again
+                        image_hash = hashlib.blake2b(image_blob, digest_size=6).hexdigest()
+                        seen = seen_images.get(image_hash)
+                        if seen:
+                            image_info['url'], image_info['base64'] = seen
                         else:
-                            # Fallback to shape dimensions
-                            image_info['width'] = emu_to_inches(shape.width)
-                            image_info['height'] = emu_to_inches(shape.height)
-                    except:
+                            # Generate unique filename based on content hash
+                            file_extension = get_image_extension(image_info['format'])
+                            filename = f"slide_{slide_num}_shape_{shape_index}_{image_hash}{file_extension}"
+                            filepath = os.path.join(images_folder, filename)
+                            
+                            # Save image to file (the folder is created once, up front)
+                            Path(filepath).write_bytes(image_blob)
+                            
+                            # Create URL (relative path)
+                            image_info['url'] = filepath.replace('\\', '/')
+                            
+                            # Create base64 data URL for direct embedding (opt-in)
+                            if EMBED_BASE64:
+                                # Build the data URL as bytes and decode once; the
+                                # base64 alphabet is ASCII so no UTF-8 pass is needed
+                                mime_type = get_mime_type(image_info['format'])
+                                prefix = f"data:{mime_type};base64,".encode('ascii')
+                                image_info['base64'] = (prefix + base64.b64encode(image_blob)).decode('ascii')
+                            seen_images[image_hash] = (image_info['url'], image_info['base64'])
+                    
+                    # Try to get image dimensions from the header bytes
+                    size = get_image_size(image_blob, image_info['format']) if image_blob else None
+                    if size:
+                        image_info['width'], image_info['height'] = size
+                    else:
                         # Fallback to shape dimensions
                         image_info['width'] = emu_to_inches(shape.width)
                         image_info['height'] = emu_to_inches(shape.height)
@@ -291,7 +437,7 @@ def extract_ppt_to_excel(prs):
         
         return image_info
 
-    def get_chart_info(shape):
+    def get_chart_info(shape, element_xml):
         """Extract detailed chart information"""
         chart_info = {
             'type': 'None',
@@ -302,25 +448,20 @@ def extract_ppt_to_excel(prs):
         }
         
         try:
-            if shape.shape_type == 3 and hasattr(shape, 'chart'):  # Chart type
-                chart = shape.chart
-                
+            try:
+                chart = shape.chart if shape.shape_type == 3 else None  # Chart type
+            except AttributeError:
+                chart = None
+            
+            if chart is not None:
                 # Chart type
-                chart_type_map = {
-                    1: 'Area', 2: 'Bar', 3: 'Column', 4: 'Line', 5: 'Pie',
-                    6: 'Scatter', 7: 'Surface', 8: 'Radar', 9: 'Treemap',
-                    10: 'Sunburst', 11: 'Histogram', 12: 'BoxWhisker',
-                    13: 'Waterfall', 14: 'Funnel', 15: 'Map'
-                }
-                chart_info['type'] = chart_type_map.get(chart.chart_type, f'Unknown({chart.chart_type})')
+                chart_info['type'] = _CHART_TYPE_MAP.get(chart.chart_type, f'Unknown({chart.chart_type})')
                 
                 # Chart title
-                if hasattr(chart, 'chart_title') and chart.chart_title:
-                    try:
-                        if hasattr(chart.chart_title, 'text_frame') and chart.chart_title.text_frame:
-                            chart_info['title'] = chart.chart_title.text_frame.text.strip()
-                    except:
-                        chart_info['title'] = 'Has Title'
+                try:
+                    chart_info['title'] = chart.chart_title.text_frame.text.strip()
+                except:
+                    chart_info['title'] = 'Has Title'
                 
                 # Extract series data
                 series_data = []
@@ -328,30 +469,29 @@ def extract_ppt_to_excel(prs):
                 chart_data_points = []
                 
                 try:
-                    if hasattr(chart, 'plots') and chart.plots:
-                        plot = chart.plots[0]  # Get first plot
+                    plots = chart.plots
+                    if plots:
+                        plot = plots[0]  # Get first plot
                         
                         # Extract categories
-                        if hasattr(plot, 'categories') and plot.categories:
+                        if plot.categories:
                             try:
                                 categories_data = [str(cat) for cat in plot.categories]
                             except:
                                 categories_data = ['Category data available']
                         
                         # Extract series
-                        if hasattr(plot, 'series'):
-                            for i, series in enumerate(plot.series):
-                                series_name = getattr(series, 'name', f'Series {i+1}')
-                                series_data.append(series_name)
-                                
-                                # Try to extract values
-                                try:
-                                    if hasattr(series, 'values') and series.values:
-                                        values = [str(v) for v in series.values if v is not None]
-                                        if values:
-                                            chart_data_points.append(f"{series_name}: [{', '.join(values[:10])}{'...' if len(values) > 10 else ''}]")
-                                except:
-                                    chart_data_points.append(f"{series_name}: [Values available]")
+                        for i, series in enumerate(plot.series):
+                            series_name = getattr(series, 'name', f'Series {i+1}')
+                            series_data.append(series_name)
+                            
+                            # Try to extract values
+                            try:
+                                values = [str(v) for v in series.values if v is not None]
+                                if values:
+                                    chart_data_points.append(f"{series_name}: [{', '.join(values[:10])}{'...' if len(values) > 10 else ''}]")
+                            except:
+                                chart_data_points.append(f"{series_name}: [Values available]")
                 except:
                     pass
                 
@@ -368,8 +508,7 @@ def extract_ppt_to_excel(prs):
                 # Fallback: Try to extract from chart XML
                 if chart_info['data'] == 'None':
                     try:
-                        chart_xml = shape.element.xml
-                        if 'val' in chart_xml and 'cat' in chart_xml:
+                        if 'val' in element_xml and 'cat' in element_xml:
                             chart_info['data'] = '[Chart data embedded in XML]'
                     except:
                         pass
@@ -393,19 +532,19 @@ def extract_ppt_to_excel(prs):
         
         try:
             # Check for shadow
-            if hasattr(shape, 'shadow') and shape.shadow.inherit:
-                effects_info['shadow'] = True
+            try:
+                effects_info['shadow'] = bool(shape.shadow.inherit)
+            except AttributeError:
+                pass
                 
-            # Check for other effects (these might not be directly accessible)
-            # This is a simplified check - actual implementation might vary
-            if hasattr(shape, 'element'):
-                element_xml = shape.element.xml
-                if 'glow' in element_xml.lower():
-                    effects_info['glow'] = True
-                if 'reflection' in element_xml.lower():
-                    effects_info['reflection'] = True
-                if 'scene3d' in element_xml.lower() or 'sp3d' in element_xml.lower():
-                    effects_info['3d_effects'] = True
+            # Check for other effects on the parsed XML tree
+            element = shape.element
+            effects_info['glow'] = element.find('.//a:glow', _XML_NS) is not None
+            effects_info['reflection'] = element.find('.//a:reflection', _XML_NS) is not None
+            effects_info['3d_effects'] = (
+                element.find('.//a:scene3d', _XML_NS) is not None
+                or element.find('.//a:sp3d', _XML_NS) is not None
+            )
                     
         except:
             pass
@@ -415,148 +554,182 @@ def extract_ppt_to_excel(prs):
     def get_placeholder_type(shape):
         """Get placeholder type if shape is a placeholder"""
         try:
-            if hasattr(shape, 'placeholder') and shape.placeholder:
-                placeholder_map = {
-                    0: 'Title', 1: 'Body', 2: 'CenterTitle', 3: 'Subtitle',
-                    4: 'DateAndTime', 5: 'SlideNumber', 6: 'Footer', 7: 'Header',
-                    8: 'Object', 9: 'Chart', 10: 'Table', 11: 'ClipArt',
-                    12: 'Diagram', 13: 'Media', 14: 'SlideImage', 15: 'Picture'
-                }
-                return placeholder_map.get(shape.placeholder.placeholder_format.type, 'Unknown')
+            placeholder = shape.placeholder
+            if placeholder:
+                return _PLACEHOLDER_MAP.get(placeholder.placeholder_format.type, 'Unknown')
         except:
             pass
         return 'Not a placeholder'
 
     def get_shape_type_name(shape_type):
         """Convert shape type number to readable name"""
-        type_mapping = {
-            1: "AutoShape", 2: "Callout", 3: "Chart", 4: "Comment", 
-            5: "Freeform", 6: "Group", 7: "Line", 8: "LinkedOLEObject",
-            9: "LinkedPicture", 10: "Media", 11: "OLEObject", 12: "Picture",
-            13: "Placeholder", 14: "TextBox", 15: "3DModel", 16: "Canvas",
-            17: "Connector", 18: "Ink", 19: "Table", 20: "SmartArt"
-        }
-        return type_mapping.get(shape_type, f"Unknown({shape_type})")
+        return _SHAPE_TYPE_MAP.get(shape_type, f"Unknown({shape_type})")
 
-    for slide_num, slide in enumerate(prs.slides, start=1):
-        for shape_index, shape in enumerate(slide.shapes):
-            # Basic shape info
-            content = ""
-            hyperlink = ""
-            
-            # Extract content based on shape type
-            if shape.has_text_frame:
-                content = sanitize_text(shape.text.strip().replace("\n", " | "))
-                # Check for hyperlinks
-                try:
-                    if shape.text_frame.paragraphs:
-                        for para in shape.text_frame.paragraphs:
-                            for run in para.runs:
-                                if hasattr(run, 'hyperlink') and run.hyperlink.address:
-                                    hyperlink = sanitize_text(run.hyperlink.address)
-                                    break
-                except:
-                    pass
-                    
-            elif shape.shape_type == 19:  # Table
-                table_data = []
-                try:
-                    for row in shape.table.rows:
-                        row_text = [sanitize_text(cell.text.strip()) for cell in row.cells]
-                        table_data.append(", ".join(row_text))
-                    content = " | ".join(table_data)
-                except:
-                    content = "[TABLE - Could not extract data]"
-                    
-            elif shape.shape_type == 12:  # Picture
-                content = "[IMAGE]"
-                
-            elif shape.shape_type == 3:  # Chart
-                content = "[CHART]"
-
-            # Position and size info
-            left_emu = shape.left
-            top_emu = shape.top
-            width_emu = shape.width
-            height_emu = shape.height
-            
-            left_inches = emu_to_inches(left_emu)
-            top_inches = emu_to_inches(top_emu)
-            width_inches = emu_to_inches(width_emu)
-            height_inches = emu_to_inches(height_emu)
-
-            # Enhanced information extraction
-            font_info = get_font_info(shape.text_frame if shape.has_text_frame else None)
-            fill_info = get_fill_info(shape)
-            image_info = get_image_info(shape, slide_num, shape_index)
-            chart_info = get_chart_info(shape)
-            effects_info = get_effects_info(shape)
-            placeholder_type = get_placeholder_type(shape)
-
-            # Line information
-            line_color = "None"
-            line_width = "None"
-            line_style = "None"
-            
+    def process_shape(slide_num, shape_index, shape, animated_ids):
+        """Build the worksheet row for one shape"""
+        shape_type = shape.shape_type
+
+        # Basic shape info
+        content = ""
+        hyperlink = ""
+        
+        # Extract content based on shape type
+        if shape.has_text_frame:
+            content = sanitize_text(shape.text.strip().replace("\n", " | "))
+            # Check for hyperlinks; stop at the first run that has one
             try:
-                if hasattr(shape, 'line') and shape.line:
-                    line_color = get_color_info(shape.line.color)
-                    line_width = f"{shape.line.width.pt}pt" if shape.line.width else "Default"
-                    # Line style
-                    line_style_map = {
-                        0: 'None', 1: 'Solid', 2: 'Dash', 3: 'Dot', 
-                        4: 'DashDot', 5: 'DashDotDot', 6: 'Double'
-                    }
-                    if hasattr(shape.line, 'dash_style'):
-                        line_style = line_style_map.get(shape.line.dash_style, 'Solid')
+                hyperlink = next(
+                    sanitize_text(run.hyperlink.address)
+                    for para in shape.text_frame.paragraphs
+                    for run in para.runs
+                    if run.hyperlink.address
+                )
+            except StopIteration:
+                hyperlink = ""
             except:
                 pass
-
-            # Rotation
-            rotation = 0
+                
+        elif shape_type == 19:  # Table
+            table_data = []
             try:
-                rotation = shape.rotation
+                for row in shape.table.rows:
+                    row_text = [sanitize_text(cell.text.strip()) for cell in row.cells]
+                    table_data.append(", ".join(row_text))
+                content = " | ".join(table_data)
             except:
-                pass
-
-            # Shape type
-            shape_type_name = get_shape_type_name(shape.shape_type)
+                content = "[TABLE - Could not extract data]"
+                
+        elif shape_type == 12:  # Picture
+            content = "[IMAGE]"
             
-            # Hidden status
-            hidden = False
+        elif shape_type == 3:  # Chart
+            content = "[CHART]"
+
+        # Position and size info
+        left_emu = shape.left
+        top_emu = shape.top
+        width_emu = shape.width
+        height_emu = shape.height
+        
+        left_inches = emu_to_inches(left_emu)
+        top_inches = emu_to_inches(top_emu)
+        width_inches = emu_to_inches(width_emu)
+        height_inches = emu_to_inches(height_emu)
+
+        # Only the chart data probe needs the serialized XML
+        element_xml = ""
+        if shape_type == 3:
             try:
-                hidden = not shape.element.get('hidden', '0') == '0'
-            except:
+                element_xml = shape.element.xml
+            except Exception:
                 pass
 
-            # Animation effects (simplified check)
-            animation_effects = "None"
-            try:
-                # This is a basic check - full animation detection would require more complex parsing
-                if hasattr(shape, 'element') and 'anim' in shape.element.xml.lower():
-                    animation_effects = "Has Animation"
-            except:
-                pass
+        # Enhanced information extraction
+        font_info = get_font_info(shape.text_frame if shape.has_text_frame else None)
+        fill_info = get_fill_info(shape)
+        # Only pictures carry an image, only chart frames a chart and only
+        # placeholders a placeholder type; every other shape gets the
+        # defaults without running the probes
+        if shape_type == 12 or isinstance(shape, Picture):
+            image_info = get_image_info(shape, slide_num, shape_index)
+        else:
+            image_info = _NO_IMAGE_INFO
+        chart_info = get_chart_info(shape, element_xml) if shape_type == 3 else _NO_CHART_INFO
+        effects_info = get_effects_info(shape)
+        placeholder_type = get_placeholder_type(shape) if shape.is_placeholder else 'Not a placeholder'
+
+        # Line information
+        line_color = "None"
+        line_width = "None"
+        line_style = "None"
+        
+        try:
+            line = shape.line
+            line_color = get_color_info(line.color)
+            line_width = f"{line.width.pt}pt" if line.width else "Default"
+            # Line style
+            line_style = _LINE_STYLE_MAP.get(line.dash_style, 'Solid')
+        except AttributeError:
+            # Groups and graphic frames have no line
+            pass
+        except:
+            pass
 
-            # Append all enhanced data to worksheet (sanitize all string values)
-            row_data = [
-                slide_num, sanitize_text(shape.name), shape_type_name, content,
-                left_emu, top_emu, width_emu, height_emu,
-                left_inches, top_inches, width_inches, height_inches,
-                sanitize_text(font_info['name']), sanitize_text(font_info['size']), font_info['bold'], 
-                font_info['italic'], font_info['underline'], sanitize_text(font_info['color']),
-                sanitize_text(font_info['alignment']), sanitize_text(font_info['line_spacing']), sanitize_text(font_info['paragraph_spacing']),
-                sanitize_text(fill_info['color']), sanitize_text(fill_info['type']), sanitize_text(fill_info['transparency']),
-                sanitize_text(line_color), sanitize_text(line_width), sanitize_text(line_style), rotation,
-                image_info['has_image'], sanitize_text(image_info['format']), image_info['width'], 
-                image_info['height'], image_info['file_size'], sanitize_text(image_info['url']), sanitize_text(image_info['base64']),
-                sanitize_text(chart_info['type']), sanitize_text(chart_info['title']), sanitize_text(chart_info['data']), sanitize_text(chart_info['categories']), sanitize_text(chart_info['series']),
-                hyperlink, shape_index, hidden,
-                effects_info['shadow'], effects_info['glow'], effects_info['reflection'],
-                effects_info['3d_effects'], sanitize_text(placeholder_type), sanitize_text(animation_effects)
-            ]
-            
-            ws.append(row_data)
+        # Rotation
+        rotation = 0
+        try:
+            rotation = shape.rotation
+        except:
+            pass
+
+        # Shape type
+        shape_type_name = get_shape_type_name(shape_type)
+        
+        # Hidden status
+        hidden = False
+        try:
+            hidden = not shape.element.get('hidden', '0') == '0'
+        except:
+            pass
+
+        # Animation effects (targets collected from the slide timing)
+        animation_effects = "None"
+        try:
+            if str(shape.shape_id) in animated_ids:
+                animation_effects = "Has Animation"
+        except:
+            pass
+
+        # The data URL is pure ASCII by construction, so it skips sanitize_text;
+        # one too long for a cell is left out rather than truncated into garbage
+        base64_cell = image_info['base64'] if len(image_info['base64']) <= _EXCEL_CELL_LIMIT else ''
+
+        # Build the worksheet row. Only text taken from the deck itself goes
+        # through sanitize_text; numbers, booleans and the labels/measurements
+        # built above are already cell-safe
+        row_data = (
+            slide_num, sanitize_text(shape.name), shape_type_name, content,
+            left_emu, top_emu, width_emu, height_emu,
+            left_inches, top_inches, width_inches, height_inches,
+            sanitize_text(font_info['name']), font_info['size'], font_info['bold'], 
+            font_info['italic'], font_info['underline'], font_info['color'],
+            font_info['alignment'], font_info['line_spacing'], font_info['paragraph_spacing'],
+            fill_info['color'], fill_info['type'], fill_info['transparency'],
+            line_color, line_width, line_style, rotation,
+            image_info['has_image'], sanitize_text(image_info['format']), image_info['width'], 
+            image_info['height'], image_info['file_size'], image_info['url'], base64_cell,
+            chart_info['type'], sanitize_text(chart_info['title']), sanitize_text(chart_info['data']), sanitize_text(chart_info['categories']), sanitize_text(chart_info['series']),
+            hyperlink, shape_index, hidden,
+            effects_info['shadow'], effects_info['glow'], effects_info['reflection'],
+            effects_info['3d_effects'], placeholder_type, animation_effects
+        )
+
+        return row_data
+
+    def process_slide(slide_num, slide):
+        """Build the worksheet rows for every shape on one slide"""
+        # Animations live in the slide's timing tree, keyed by shape id; read
+        # it once here instead of searching every shape's XML
+        animated_ids = {
+            target.get('spid')
+            for target in slide.element.iterfind('.//p:timing//p:spTgt', _XML_NS)
+        }
+        return [
+            process_shape(slide_num, shape_index, shape, animated_ids)
+            for shape_index, shape in enumerate(slide.shapes)
+        ]
+
+    # Pictures are saved from several worker threads; create their folder up front
+    os.makedirs(IMAGES_FOLDER, exist_ok=True)
+
+    # Slides are independent, and python-pptx's lxml work and the image file
+    # writes release the GIL, so extract them in parallel
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(process_slide, slide_num, slide) for slide_num, slide in enumerate(prs.slides, start=1)]
+        # openpyxl isn't thread-safe: append on this thread, in slide order
+        for future in futures:
+            for row_data in future.result():
+                ws.append(row_data)
     
     return wb
 
@@ -605,7 +778,7 @@ def main():
     print("📁 Images extracted to: ./extracted_images/ folder")
     print("🔗 Image URLs and base64 data included in Excel")
     print("📈 Chart data including series, categories, and values extracted")
-    print("💡 Note: Install 'pillow' package for enhanced image dimension analysis:")
+    print("💡 Note: PNG/JPEG sizes are read from headers; set PPT_USE_PIL=1 and install 'pillow' for other formats:")
     print("   pip install pillow")
 
 if __name__ == "__main__":
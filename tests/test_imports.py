@@ -0,0 +1,20 @@
+"""Smoke test: the slide service and its handlers import cleanly"""
+import importlib
+import os
+import unittest
+
+
+class ImportTest(unittest.TestCase):
+    def setUp(self):
+        # s3_service builds its singleton at import time and refuses to start without these
+        os.environ.setdefault("AWS_ACCESS_KEY_ID", "test")
+        os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "test")
+        os.environ.setdefault("S3_BUCKET_NAME", "test-bucket")
+
+    def test_slide_data_service_imports(self):
+        module = importlib.import_module("services.slide_data_service")
+        self.assertTrue(hasattr(module, "SlideDataService"))
+
+
+if __name__ == "__main__":
+    unittest.main()